@@ -1,5 +1,8 @@
 ﻿$ErrorActionPreference = "Stop"
 
+$forceInstall = $args -contains '--force-install'
+$cliArgs = @($args | Where-Object { $_ -ne '--force-install' })
+
 function Get-PythonSpec {
     $candidates = @(
         @('py', '-3.12'),
@@ -71,14 +74,28 @@ if (-not (Test-Path $venvPath)) {
 }
 
 $venvPython = Join-Path $venvPath "Scripts/python.exe"
+$cliPath = Join-Path $venvPath "Scripts/bitthumb-cli.exe"
 
-& $venvPython -m pip install --upgrade --disable-pip-version-check pip setuptools wheel > $null
-& $venvPython -m pip install --disable-pip-version-check $projectRoot
+# pyproject.toml과 src/가 바뀌지 않았으면 재설치 없이 설치된 엔트리포인트를 바로 실행한다.
+$installStamp = Join-Path $venvPath ".bitthumb-install-hash"
+$currentHash = (& $venvPython (Join-Path $PSScriptRoot "install_hash.py") $projectRoot).Trim()
+$installedHash = ""
+if (Test-Path $installStamp) {
+    $installedHash = (Get-Content -Raw $installStamp).Trim()
+}
 
-$cliPath = Join-Path $venvPath "Scripts/bitthumb-cli.exe"
+if ($forceInstall -or -not (Test-Path $cliPath) -or $installedHash -ne $currentHash) {
+    & $venvPython -m pip install --upgrade --disable-pip-version-check pip setuptools wheel > $null
+    & $venvPython -m pip install --disable-pip-version-check $projectRoot
+    if ($LASTEXITCODE -ne 0) {
+        throw "bitthumb-cli 설치에 실패했습니다."
+    }
+    Set-Content -Path $installStamp -Value $currentHash -Encoding ascii
+}
 
 if (-not (Test-Path $cliPath)) {
     throw "bitthumb-cli가 설치되지 않았습니다."
 }
 
-& $cliPath @args
+& $cliPath @cliArgs
+exit $LASTEXITCODE
@@ -1,6 +1,17 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# PowerShell 래퍼와 같이 --force-install은 위치와 관계없이 받아서 CLI 인자에서 뺀다.
+FORCE_INSTALL=0
+CLI_ARGS=()
+for arg in "$@"; do
+  if [ "${arg}" = "--force-install" ]; then
+    FORCE_INSTALL=1
+  else
+    CLI_ARGS+=("${arg}")
+  fi
+done
+
 PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 VENV_PATH="${PROJECT_ROOT}/.venv-bitthumb"
 
@@ -34,9 +45,16 @@ if [ ! -d "${VENV_PATH}" ]; then
   "$PYTHON_BIN" -m venv "${VENV_PATH}"
 fi
 
-source "${VENV_PATH}/bin/activate"
+# pyproject.toml과 src/가 바뀌지 않았으면 재설치 없이 설치된 엔트리포인트를 바로 실행한다.
+INSTALL_STAMP="${VENV_PATH}/.bitthumb-install-hash"
+CLI_PATH="${VENV_PATH}/bin/bitthumb-cli"
+CURRENT_HASH="$("${VENV_PYTHON}" "${PROJECT_ROOT}/scripts/install_hash.py" "${PROJECT_ROOT}")"
+INSTALLED_HASH="$(cat "${INSTALL_STAMP}" 2>/dev/null || true)"
 
-pip install --upgrade --disable-pip-version-check pip setuptools wheel >/dev/null
-pip install --disable-pip-version-check "${PROJECT_ROOT}"
+if [ "${FORCE_INSTALL}" = 1 ] || [ ! -x "${CLI_PATH}" ] || [ "${INSTALLED_HASH}" != "${CURRENT_HASH}" ]; then
+  "${VENV_PYTHON}" -m pip install --upgrade --disable-pip-version-check pip setuptools wheel >/dev/null
+  "${VENV_PYTHON}" -m pip install --disable-pip-version-check "${PROJECT_ROOT}"
+  printf "%s\n" "${CURRENT_HASH}" > "${INSTALL_STAMP}"
+fi
 
-bitthumb-cli "$@"
+exec "${CLI_PATH}" ${CLI_ARGS[@]+"${CLI_ARGS[@]}"}
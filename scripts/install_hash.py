@@ -0,0 +1,40 @@
+"""런처가 재설치 여부를 판단할 때 쓰는 프로젝트 내용 해시.
+
+pyproject.toml과 src/ 아래 파일의 경로와 내용을 합쳐 SHA-256으로 출력한다.
+빌드 부산물(__pycache__, *.egg-info)은 설치할 때마다 바뀌므로 제외한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from pathlib import Path
+
+_SKIP_DIRS = ("__pycache__",)
+_SKIP_SUFFIXES = (".pyc", ".pyo", ".egg-info")
+
+
+def _included(path: Path, root: Path) -> bool:
+    if not path.is_file():
+        return False
+    parts = path.relative_to(root).parts
+    if any(part in _SKIP_DIRS or part.endswith(_SKIP_SUFFIXES) for part in parts):
+        return False
+    return True
+
+
+def project_hash(root: Path) -> str:
+    digest = hashlib.sha256()
+    files = [root / "pyproject.toml", *sorted((root / "src").rglob("*"))]
+    for path in files:
+        if not _included(path, root):
+            continue
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    print(project_hash(Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()))
@@ -0,0 +1,137 @@
+"""여러 계정의 주문을 계정별 프로세스로 나눠 실행한다.
+
+계정 파일(TOML) 형식::
+
+    [accounts.main]
+    access_key = "..."
+    secret_key = "..."
+    markets = ["KRW-BTC", "KRW-ETH"]   # 생략하면 --market/--markets 값을 쓴다
+
+    [accounts.sub]
+    access_key_env = "SUB_ACCESS_KEY"  # 키를 파일 대신 환경 변수에서 읽는다
+    secret_key_env = "SUB_SECRET_KEY"
+    side = "ask"
+
+계정마다 별도 프로세스에서 `cli.run_markets`를 실행하므로 연결 풀과 요청 수 제한
+버킷도 계정별로 따로 잡힌다.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, Mapping
+
+from .config import ApiSettings
+from .types import Side, ensure_side
+
+
+@dataclass(frozen=True)
+class Account:
+    name: str
+    access_key: str
+    secret_key: str
+    markets: tuple[str, ...] = ()
+    side: Side | None = None
+
+    def settings(self, base: ApiSettings) -> ApiSettings:
+        return replace(base, access_key=self.access_key, secret_key=self.secret_key)
+
+
+def _read_key(name: str, table: Mapping[str, Any], field: str) -> str:
+    env_name = table.get(f"{field}_env")
+    if env_name:
+        value = os.getenv(str(env_name))
+        if not value:
+            raise ValueError(f"계정 {name}: 환경 변수 {env_name}이(가) 비어 있습니다.")
+        return value
+    value = table.get(field)
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"계정 {name}: {field} 또는 {field}_env가 필요합니다.")
+    return value
+
+
+def _read_markets(name: str, table: Mapping[str, Any]) -> tuple[str, ...]:
+    raw = table.get("markets", ())
+    if isinstance(raw, str):
+        raw = [item.strip() for item in raw.split(",")]
+    if not isinstance(raw, (list, tuple)) or not all(isinstance(item, str) for item in raw):
+        raise ValueError(f"계정 {name}: markets는 문자열 목록이어야 합니다.")
+    return tuple(dict.fromkeys(item for item in raw if item))
+
+
+def parse_accounts(document: Mapping[str, Any]) -> list[Account]:
+    tables = document.get("accounts")
+    if not isinstance(tables, dict) or not tables:
+        raise ValueError("계정 파일에 [accounts.<이름>] 항목이 없습니다.")
+    accounts: list[Account] = []
+    for name, table in tables.items():
+        if not isinstance(table, dict):
+            raise ValueError(f"계정 {name}: 테이블 형식이어야 합니다.")
+        side = table.get("side")
+        accounts.append(
+            Account(
+                name=name,
+                access_key=_read_key(name, table, "access_key"),
+                secret_key=_read_key(name, table, "secret_key"),
+                markets=_read_markets(name, table),
+                side=ensure_side(side) if side is not None else None,
+            )
+        )
+    return accounts
+
+
+def load_accounts(path: str | os.PathLike[str]) -> list[Account]:
+    import tomllib
+
+    try:
+        with open(path, "rb") as handle:
+            document = tomllib.load(handle)
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(f"계정 파일 형식이 올바르지 않습니다: {exc}") from exc
+    return parse_accounts(document)
+
+
+@dataclass(frozen=True)
+class AccountJob:
+    name: str
+    settings: ApiSettings
+    markets: tuple[str, ...]
+    side: Side
+    dry_run: bool
+    concurrency: int
+
+
+def run_account(job: AccountJob) -> list[dict[str, Any]]:
+    """작업자 프로세스에서 한 계정의 마켓들을 실행한다.
+
+    예외 객체는 프로세스 경계를 넘길 때 복원되지 않을 수 있으므로 결과를 dict로
+    바꿔서 돌려준다.
+    """
+    import asyncio
+
+    from . import cli
+
+    configs = [cli.ExecutionConfig(market=market, side=job.side, dry_run=job.dry_run) for market in job.markets]
+    outcomes = asyncio.run(cli.run_markets(settings=job.settings, configs=configs, concurrency=job.concurrency))
+    return [{"account_name": job.name, **cli.summarize_outcome(outcome)} for outcome in outcomes]
+
+
+def fan_out(jobs: Sequence[AccountJob]) -> Iterator[list[dict[str, Any]]]:
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if not jobs:
+        return
+    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {pool.submit(run_account, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield future.result()
+            except Exception as exc:
+                # 작업자 프로세스 자체가 실패해도 다른 계정 결과는 모은다.
+                yield [
+                    {"account_name": job.name, "market": market, "ok": False, "error": str(exc) or type(exc).__name__}
+                    for market in job.markets
+                ]
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from typing import Any
+import base64
 import hashlib
+import hmac
 import time
 from uuid import uuid4
 from urllib.parse import quote_plus
 
-import jwt
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
 
 
 def _is_sequence(value: Any) -> bool:
@@ -60,6 +68,9 @@ def generate_jwt(
     algorithm: str = "HS256",
     query_hash_algorithm: str = "SHA512",
 ) -> str:
+    # PyJWT는 무거우므로 이 참조 구현이 호출될 때만 불러온다.
+    import jwt
+
     query = serialize_query(params)
     payload: dict[str, Any] = {
         "access_key": access_key,
@@ -72,3 +83,72 @@ def generate_jwt(
         payload["query_hash_alg"] = query_hash_algorithm
 
     return jwt.encode(payload, secret_key, algorithm=algorithm)
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+class Signer:
+    """키 쌍별로 재사용하는 JWT 서명기.
+
+    헤더 세그먼트와 HMAC 키 상태를 미리 만들어 두고, 같은 쿼리 문자열의
+    query_hash는 LRU 캐시에서 꺼내 쓴다. 호출마다 바뀌는 값은 nonce와
+    timestamp뿐이며, 결과는 `generate_jwt`와 바이트 단위로 같다.
+    """
+
+    __slots__ = ("_claims_prefix", "_hash_alg_suffix", "_mac", "_segment_prefix", "_query_hash")
+
+    def __init__(
+        self,
+        *,
+        access_key: str,
+        secret_key: str,
+        algorithm: str = "HS256",
+        query_hash_algorithm: str = "SHA512",
+        cache_size: int = 256,
+    ) -> None:
+        digest = _HMAC_DIGESTS.get(algorithm)
+        if digest is None:
+            raise ValueError(f"지원하지 않는 서명 알고리즘입니다: {algorithm}")
+
+        # PyJWT와 동일하게 키를 정렬하고 공백 없이 직렬화한 헤더를 사용한다.
+        header = f'{{"alg":{encode_basestring_ascii(algorithm)},"typ":"JWT"}}'
+        self._segment_prefix = _b64encode(header.encode("ascii")) + b"."
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=digest)
+        self._claims_prefix = f'{{"access_key":{encode_basestring_ascii(access_key)},"nonce":'
+        self._hash_alg_suffix = f',"query_hash_alg":{encode_basestring_ascii(query_hash_algorithm)}}}'
+
+        def _query_hash(query: str) -> str:
+            return hash_query_string(query, algorithm=query_hash_algorithm)
+
+        self._query_hash = lru_cache(maxsize=cache_size)(_query_hash)
+
+    def query_hash(self, params: Mapping[str, Any] | None) -> str:
+        if not params:
+            return ""
+        # 1, 1.0, True처럼 같다고 비교되지만 다르게 직렬화되는 값이 있으므로
+        # 파라미터가 아니라 직렬화된 쿼리 문자열을 캐시 키로 쓴다.
+        return self._query_hash(serialize_query(params))
+
+    def sign(
+        self,
+        params: Mapping[str, Any] | None,
+        *,
+        nonce: str | None = None,
+        timestamp: int | None = None,
+    ) -> str:
+        claims = (
+            f"{self._claims_prefix}{encode_basestring_ascii(nonce or str(uuid4()))}"
+            f',"timestamp":{timestamp or int(time.time() * 1000)}'
+        )
+        query_hash = self.query_hash(params)
+        if query_hash:
+            claims = f'{claims},"query_hash":"{query_hash}"{self._hash_alg_suffix}'
+        else:
+            claims = f"{claims}}}"
+
+        signing_input = self._segment_prefix + _b64encode(claims.encode("ascii"))
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64encode(mac.digest())).decode("ascii")
@@ -0,0 +1,120 @@
+"""JSONL 주문 계획 파일 스트리밍."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, Any, Mapping
+
+from .types import Side, ensure_side
+
+
+@dataclass(frozen=True)
+class PlanRow:
+    line: int
+    market: str
+    side: Side
+    amount: float | None = None
+    # `--simulate`에서 주문을 재생할 시각(epoch 초)
+    ts: float | None = None
+    # 해석에 실패한 행은 오류 메시지를 담아 그대로 흘려보내고 결과에 기록한다.
+    error: str | None = None
+
+
+def _parse_amount(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    if isinstance(value, bool):
+        raise ValueError("amount 값이 숫자가 아닙니다.")
+    try:
+        amount = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("amount 값이 숫자가 아닙니다.") from exc
+    if amount <= 0:
+        raise ValueError("amount 값은 0보다 커야 합니다.")
+    return amount
+
+
+def _parse_ts(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        from datetime import datetime
+
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if moment.tzinfo is not None:
+                return moment.timestamp()
+    raise ValueError("ts 값은 epoch 초 또는 시간대가 있는 ISO 8601 시각이어야 합니다.")
+
+
+def parse_row(line: int, raw: Mapping[str, Any], default_side: Side) -> PlanRow:
+    market = raw.get("market")
+    if not isinstance(market, str) or not market:
+        raise ValueError("market 값이 필요합니다.")
+    return PlanRow(
+        line=line,
+        market=market,
+        side=ensure_side(raw.get("side") or default_side),
+        amount=_parse_amount(raw.get("amount")),
+        ts=_parse_ts(raw.get("ts")),
+    )
+
+
+def read_plan(path: str | os.PathLike[str], *, default_side: Side = "bid") -> Iterator[PlanRow]:
+    with open(path, encoding="utf-8") as handle:
+        for line, text in enumerate(handle, start=1):
+            text = text.strip()
+            if not text or text.startswith("#"):
+                continue
+            try:
+                raw = json.loads(text)
+            except json.JSONDecodeError:
+                yield PlanRow(line=line, market="", side=default_side, error="JSON 형식이 아닙니다.")
+                continue
+            if not isinstance(raw, dict):
+                yield PlanRow(line=line, market="", side=default_side, error="각 행은 JSON 객체여야 합니다.")
+                continue
+            try:
+                row = parse_row(line, raw, default_side)
+            except ValueError as exc:
+                market = raw.get("market")
+                row = PlanRow(
+                    line=line,
+                    market=market if isinstance(market, str) else "",
+                    side=default_side,
+                    error=str(exc),
+                )
+            yield row
+
+
+class ResultWriter:
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+        self.written = 0
+        self.failed = 0
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        self._stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.written += 1
+        if not record.get("ok", True):
+            self.failed += 1
+
+
+@contextmanager
+def open_results(path: str | None) -> Iterator[ResultWriter]:
+    if path in (None, "-"):
+        yield ResultWriter(sys.stdout)
+        sys.stdout.flush()
+        return
+    with open(path, "a", encoding="utf-8") as handle:
+        yield ResultWriter(handle)
@@ -0,0 +1,256 @@
+"""서명/직렬화/주문 구성 경로 벤치마크.
+
+네트워크 없이 실행되며, 결과를 JSON으로 저장해 커밋 간에 비교할 수 있다.
+
+    python -m bitthumb_cli.bench --output bench.json
+    python -m bitthumb_cli.bench --baseline bench.json --threshold 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+from . import auth, cli, orders
+from .chance import ChanceSnapshot
+from .config import ApiSettings
+
+_ACCESS_KEY = "bench-access-key"
+_SECRET_KEY = "bench-secret-key-bench-secret-key"
+_MARKETS = tuple(f"KRW-C{index:03d}" for index in range(64))
+
+_CHANCE_PARAMS = {"market": "KRW-BTC"}
+_ORDER_PARAMS = {"market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "5500"}
+_ARRAY_PARAMS = {
+    "market": "KRW-BTC",
+    "uuids": [f"9ca023a5-851b-4fec-9f0a-{index:012d}" for index in range(100)],
+    "states": ["wait", "watch", "done", "cancel"],
+    "limit": 100,
+}
+
+_SETTINGS = ApiSettings(
+    base_url="https://bench.invalid",
+    access_key=_ACCESS_KEY,
+    secret_key=_SECRET_KEY,
+    fallback_amount=6000,
+)
+
+
+def _chance(market: str) -> dict[str, Any]:
+    coin = market.split("-", 1)[-1]
+    return {
+        "bid_fee": "0.0025",
+        "ask_fee": "0.0025",
+        "market": {
+            "id": market,
+            "bid": {"currency": "KRW", "min_total": "5000"},
+            "ask": {"currency": coin, "min_total": "5000"},
+            "state": "active",
+        },
+        "bid_account": {"currency": "KRW", "balance": "1000000", "locked": "0"},
+        "ask_account": {"currency": coin, "balance": "0.5", "locked": "0"},
+    }
+
+
+class _FakeResponse:
+    __slots__ = ("_body",)
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        self._body = body
+
+    def json(self) -> dict[str, Any]:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FakeClient:
+    """실제 전송 없이 미리 만든 응답을 돌려주는 클라이언트."""
+
+    def __init__(self) -> None:
+        self._chances = {market: _FakeResponse(_chance(market)) for market in (*_MARKETS, "KRW-BTC")}
+        self._order = _FakeResponse({"uuid": "bench-order", "state": "wait"})
+
+    def get(self, url: str, **_: Any) -> _FakeResponse:
+        return self._chances[url.rsplit("=", 1)[-1]]
+
+    def post(self, url: str, **_: Any) -> _FakeResponse:
+        return self._order
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    func: Callable[[], Any]
+    # 한 번 호출에 처리하는 작업 수 (예: 여러 마켓을 한 번에 도는 경우)
+    units: int = 1
+
+
+def build_cases() -> list[Case]:
+    signer = auth.Signer(access_key=_ACCESS_KEY, secret_key=_SECRET_KEY)
+    chance = _chance("KRW-BTC")
+    array_query = auth.serialize_query(_ARRAY_PARAMS)
+    client = _FakeClient()
+    bid_config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+    configs = [cli.ExecutionConfig(market=market, side="bid", dry_run=False) for market in _MARKETS]
+
+    def _many_markets() -> None:
+        for item in configs:
+            cli.execute_trade_cycle(client=client, settings=_SETTINGS, config=item)
+
+    return [
+        Case("serialize_query.market", lambda: auth.serialize_query(_CHANCE_PARAMS)),
+        Case("serialize_query.order", lambda: auth.serialize_query(_ORDER_PARAMS)),
+        Case("serialize_query.array", lambda: auth.serialize_query(_ARRAY_PARAMS)),
+        Case("hash_query_string.array", lambda: auth.hash_query_string(array_query)),
+        Case(
+            "generate_jwt.chance",
+            lambda: auth.generate_jwt(access_key=_ACCESS_KEY, secret_key=_SECRET_KEY, params=_CHANCE_PARAMS),
+        ),
+        Case(
+            "generate_jwt.array",
+            lambda: auth.generate_jwt(access_key=_ACCESS_KEY, secret_key=_SECRET_KEY, params=_ARRAY_PARAMS),
+        ),
+        Case("signer.sign.chance", lambda: signer.sign(_CHANCE_PARAMS)),
+        Case("signer.sign.array", lambda: signer.sign(_ARRAY_PARAMS)),
+        Case("format_decimal.int", lambda: orders._format_decimal(5500)),
+        Case("format_decimal.float", lambda: orders._format_decimal(0.00012345)),
+        Case("chance_snapshot.parse", lambda: ChanceSnapshot.parse(chance)),
+        Case(
+            "build_order_plan.bid",
+            lambda: cli.build_order_plan(
+                chance=chance, side="bid", market="KRW-BTC", fallback_amount=None, dry_run=False
+            ),
+        ),
+        Case(
+            "build_order_plan.ask",
+            lambda: cli.build_order_plan(
+                chance=chance, side="ask", market="KRW-BTC", fallback_amount=None, dry_run=False, price=100000000.0
+            ),
+        ),
+        Case(
+            "execute_trade_cycle.fake_client",
+            lambda: cli.execute_trade_cycle(client=client, settings=_SETTINGS, config=bid_config),
+        ),
+        Case("execute_trade_cycle.markets", _many_markets, units=len(configs)),
+    ]
+
+
+def _calibrate(func: Callable[[], Any], target: float) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - started >= target or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def measure(case: Case, *, repeat: int, target: float) -> dict[str, Any]:
+    number = _calibrate(case.func, target)
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            case.func()
+        samples.append((time.perf_counter() - started) / (number * case.units))
+    best = min(samples)
+    return {
+        "ops_per_sec": round(1 / best, 1),
+        "best_us": round(best * 1e6, 3),
+        "median_us": round(statistics.median(samples) * 1e6, 3),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(*, repeat: int = 5, target: float = 0.05, pattern: str | None = None) -> dict[str, Any]:
+    results = {
+        case.name: measure(case, repeat=repeat, target=target)
+        for case in build_cases()
+        if pattern is None or pattern in case.name
+    }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    threshold: float,
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        change = result["best_us"] / previous["best_us"] - 1
+        rows.append(
+            {
+                "case": name,
+                "baseline_us": previous["best_us"],
+                "current_us": result["best_us"],
+                "change": round(change, 4),
+                "regression": change > threshold,
+            }
+        )
+    return rows
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="bitthumb-cli 핫패스 벤치마크")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="회귀로 판단할 호출당 시간 증가율 (기본 0.15 = 15%%)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--target", type=float, default=0.05, help="측정 1회당 목표 시간(초)")
+    parser.add_argument("--filter", dest="pattern", help="이름에 이 문자열이 포함된 케이스만 실행")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _build_parser().parse_args(argv)
+    report = run_suite(repeat=args.repeat, target=args.target, pattern=args.pattern)
+
+    for name, result in report["results"].items():
+        print(f"{name:<34} {result['best_us']:>12.3f} us {result['ops_per_sec']:>14.1f} ops/s")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        rows = compare(report, baseline, threshold=args.threshold)
+        regressions = [row for row in rows if row["regression"]]
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else "ok"
+            print(f"{row['case']:<34} {row['change']:>+8.1%} {flag}")
+        if regressions:
+            print(f"\n{len(regressions)}개 케이스가 {args.threshold:.0%} 이상 느려졌습니다.", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
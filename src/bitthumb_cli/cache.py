@@ -0,0 +1,170 @@
+"""`orders/chance` 응답 캐시.
+
+응답을 마켓 정보(최소 주문 금액, 수수료 등)와 계좌 정보로 나눠 각각 다른 TTL로
+보관한다. 주문이 성공하면 사용한 통화의 잔고는 같은 키의 모든 마켓 항목에서
+로컬로 차감하고, 받는 통화의 잔고는 체결 수량을 알 수 없으므로 무효화해 다음
+회차에서 다시 조회하게 한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Mapping
+
+from .types import Side
+
+DEFAULT_MARKET_TTL = 300.0
+DEFAULT_ACCOUNT_TTL = 10.0
+
+_ACCOUNT_KEYS: dict[Side, str] = {"bid": "bid_account", "ask": "ask_account"}
+
+
+def _decimal(value: Any) -> Decimal | None:
+    if value in (None, ""):
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def _text(value: Decimal) -> str:
+    text = format(value.normalize(), "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
+def _account_currency(market: str, side: Side, account: Mapping[str, Any]) -> str:
+    currency = account.get("currency")
+    if currency:
+        return str(currency)
+    # 응답에 통화가 없으면 마켓 코드(`KRW-BTC`)에서 매수는 KRW, 매도는 BTC로 본다.
+    quote, _, base = market.partition("-")
+    return quote if side == "bid" else base
+
+
+class _Entry:
+    __slots__ = ("market", "market_expires", "accounts", "account_expires")
+
+    def __init__(self) -> None:
+        self.market: dict[str, Any] = {}
+        self.market_expires = 0.0
+        self.accounts: dict[Side, dict[str, Any]] = {}
+        self.account_expires: dict[Side, float] = {}
+
+
+class ChanceCache:
+    def __init__(
+        self,
+        *,
+        market_ttl: float = DEFAULT_MARKET_TTL,
+        account_ttl: float = DEFAULT_ACCOUNT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if market_ttl < 0 or account_ttl < 0:
+            raise ValueError("캐시 TTL은 0 이상이어야 합니다.")
+        self.market_ttl = market_ttl
+        self.account_ttl = account_ttl
+        self._clock = clock
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, access_key: str, market: str, side: Side) -> dict[str, Any] | None:
+        # 주문에 쓰는 쪽 계좌 정보만 살아 있으면 된다.
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get((access_key, market))
+            if (
+                entry is None
+                or entry.market_expires <= now
+                or entry.account_expires.get(side, 0.0) <= now
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+            chance = dict(entry.market)
+            for cached_side, account in entry.accounts.items():
+                chance[_ACCOUNT_KEYS[cached_side]] = dict(account)
+            return chance
+
+    def market_info(self, access_key: str, market: str) -> dict[str, Any] | None:
+        """계좌 정보와 관계없이 살아 있는 마켓 정보(최소 주문 금액, 수수료)만 돌려준다."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get((access_key, market))
+            if entry is None or entry.market_expires <= now:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(entry.market)
+
+    def store(self, access_key: str, market: str, chance: Mapping[str, Any]) -> None:
+        now = self._clock()
+        account_keys = set(_ACCOUNT_KEYS.values())
+        with self._lock:
+            entry = self._entries.setdefault((access_key, market), _Entry())
+            entry.market = {key: value for key, value in chance.items() if key not in account_keys}
+            entry.market_expires = now + self.market_ttl
+            for side, key in _ACCOUNT_KEYS.items():
+                account = chance.get(key)
+                if isinstance(account, Mapping):
+                    entry.accounts[side] = dict(account)
+                    entry.account_expires[side] = now + self.account_ttl
+                else:
+                    entry.accounts.pop(side, None)
+                    entry.account_expires.pop(side, None)
+
+    def invalidate(self, access_key: str, market: str | None = None) -> None:
+        with self._lock:
+            if market is not None:
+                self._entries.pop((access_key, market), None)
+                return
+            for key in [key for key in self._entries if key[0] == access_key]:
+                del self._entries[key]
+
+    def apply_order(self, access_key: str, market: str, side: Side, amount: float) -> None:
+        """주문 성공 후 사용한 쪽 잔고를 로컬에서 차감한다.
+
+        매수는 주문 금액에 `bid_fee`를 더해 KRW 잔고에서, 매도는 수량만큼 코인
+        잔고에서 뺀다. 같은 키의 다른 마켓 항목도 같은 통화 잔고라면 함께 차감하고,
+        받는 쪽 통화 잔고는 시장가 체결 결과를 알 수 없으므로 모두 만료시킨다.
+        """
+        quote, _, base = market.partition("-")
+        spent_currency, received_currency = (quote, base) if side == "bid" else (base, quote)
+        with self._lock:
+            entry = self._entries.get((access_key, market))
+            spent: Decimal | None = Decimal(str(amount))
+            if side == "bid":
+                # 주문한 마켓 항목이 없으면 수수료를 알 수 없으므로 차감 대신 만료시킨다.
+                fee = (_decimal(entry.market.get("bid_fee")) or Decimal(0)) if entry is not None else None
+                spent = spent * (1 + fee) if fee is not None else None
+
+            for (key, entry_market), cached in self._entries.items():
+                if key != access_key:
+                    continue
+                for account_side, account in list(cached.accounts.items()):
+                    currency = _account_currency(entry_market, account_side, account)
+                    if currency == spent_currency and spent is not None and self._deduct(account, spent):
+                        continue
+                    if currency in (spent_currency, received_currency):
+                        cached.accounts.pop(account_side, None)
+                        cached.account_expires.pop(account_side, None)
+
+    @staticmethod
+    def _deduct(account: dict[str, Any], spent: Decimal) -> bool:
+        adjusted = False
+        for field in ("balance", "available"):
+            current = _decimal(account.get(field))
+            if current is None:
+                continue
+            account[field] = _text(max(current - spent, Decimal(0)))
+            adjusted = True
+        return adjusted
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
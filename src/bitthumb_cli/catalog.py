@@ -0,0 +1,257 @@
+"""거래소 마켓 목록 캐시.
+
+공개 API `/v1/market/all`로 받은 마켓 코드를 정렬해 디스크에 한 줄에 하나씩
+저장한다. 정렬된 목록이므로 `KRW-*` 같은 접두사 패턴은 이분 탐색으로 펼친다.
+파일은 마켓 검증이 필요할 때 처음 읽고, TTL이 지나면 다시 받아 온다.
+
+`--single-snapshot`이 쓰는 마켓별 최소 주문 금액과 수수료율(`orders/chance`의
+마켓 정보)도 같은 디렉터리의 JSON 파일(`MarketInfoStore`)에 TTL과 함께 남겨,
+다음 실행에서는 계좌 조회 한 번으로 계획할 수 있게 한다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from .config import ApiSettings
+from .types import HttpClient
+
+MARKET_ALL_PATH = "/v1/market/all"
+_HEADER = "bitthumb-markets/1"
+_INFO_FORMAT = "bitthumb-market-info/1"
+_WILDCARDS = frozenset("*?[")
+
+
+def is_pattern(market: str) -> bool:
+    return not _WILDCARDS.isdisjoint(market)
+
+
+@dataclass(frozen=True)
+class MarketCatalog:
+    # 정렬된 마켓 코드
+    markets: tuple[str, ...]
+    fetched_at: float
+
+    @classmethod
+    def build(cls, markets: Iterable[str], fetched_at: float) -> MarketCatalog:
+        return cls(markets=tuple(sorted(set(markets))), fetched_at=fetched_at)
+
+    def __contains__(self, market: object) -> bool:
+        if not isinstance(market, str):
+            return False
+        index = bisect.bisect_left(self.markets, market)
+        return index < len(self.markets) and self.markets[index] == market
+
+    def _prefixed(self, prefix: str) -> tuple[str, ...]:
+        start = bisect.bisect_left(self.markets, prefix)
+        stop = start
+        while stop < len(self.markets) and self.markets[stop].startswith(prefix):
+            stop += 1
+        return self.markets[start:stop]
+
+    def expand(self, pattern: str) -> tuple[str, ...]:
+        if not is_pattern(pattern):
+            return (pattern,) if pattern in self else ()
+        prefix = pattern[:-1]
+        if pattern.endswith("*") and not is_pattern(prefix):
+            return self._prefixed(prefix)
+        return tuple(market for market in self.markets if fnmatch.fnmatchcase(market, pattern))
+
+    def suggest(self, market: str) -> str | None:
+        import difflib
+
+        matches = difflib.get_close_matches(market, self.markets, n=1)
+        return matches[0] if matches else None
+
+    def resolve(self, markets: Sequence[str]) -> tuple[str, ...]:
+        """마켓 인자를 검증하고 패턴을 펼친다. 순서는 유지하고 중복은 한 번만 남긴다."""
+        resolved: dict[str, None] = {}
+        for item in markets:
+            expanded = self.expand(item)
+            if not expanded:
+                raise ValueError(self._unknown(item))
+            resolved.update(dict.fromkeys(expanded))
+        return tuple(resolved)
+
+    def _unknown(self, market: str) -> str:
+        if is_pattern(market):
+            return f"패턴과 일치하는 마켓이 없습니다: {market}"
+        suggestion = self.suggest(market)
+        hint = f" ({suggestion}을(를) 의도했나요?)" if suggestion else ""
+        return f"거래소에 없는 마켓입니다: {market}{hint}"
+
+    def check(self, market: str) -> None:
+        if market not in self:
+            raise ValueError(self._unknown(market))
+
+
+def default_cache_path(settings: ApiSettings) -> Path:
+    if settings.market_cache_path:
+        return Path(settings.market_cache_path)
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    # 대역 서버와 실제 거래소 목록이 섞이지 않도록 base_url마다 파일을 나눈다.
+    digest = hashlib.sha1(settings.base_url.encode("utf-8")).hexdigest()[:12]
+    return Path(root) / "bitthumb-cli" / f"markets-{digest}.txt"
+
+
+def read_catalog(path: str | os.PathLike[str]) -> MarketCatalog | None:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            header = handle.readline().split()
+            if len(header) != 2 or header[0] != _HEADER:
+                return None
+            fetched_at = float(header[1])
+            markets = tuple(line.rstrip("\n") for line in handle if line.strip())
+    except (OSError, ValueError):
+        return None
+    return MarketCatalog(markets=markets, fetched_at=fetched_at)
+
+
+def write_catalog(path: str | os.PathLike[str], catalog: MarketCatalog) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    body = "\n".join((f"{_HEADER} {catalog.fetched_at:.3f}", *catalog.markets)) + "\n"
+    temp.write_text(body, encoding="utf-8")
+    os.replace(temp, target)
+
+
+def parse_market_list(payload: Any) -> list[str]:
+    if not isinstance(payload, list):
+        raise ValueError("market/all 응답 형식이 올바르지 않습니다.")
+    markets = [item.get("market") for item in payload if isinstance(item, dict)]
+    return [market for market in markets if isinstance(market, str) and market]
+
+
+def fetch_catalog(
+    settings: ApiSettings,
+    *,
+    client: HttpClient,
+    clock: Callable[[], float] = time.time,
+) -> MarketCatalog:
+    from .orders import DEFAULT_TIMEOUT
+
+    response = client.get(
+        f"{settings.base_url}{MARKET_ALL_PATH}",
+        params={"isDetails": "false"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    response.raise_for_status()
+    return MarketCatalog.build(parse_market_list(response.json()), clock())
+
+
+def load_catalog(
+    settings: ApiSettings,
+    *,
+    client: HttpClient,
+    path: str | os.PathLike[str] | None = None,
+    clock: Callable[[], float] = time.time,
+) -> MarketCatalog | None:
+    """디스크 캐시를 읽고, 없거나 만료되었으면 새로 받아 저장한다.
+
+    목록은 호출한 쪽의 클라이언트로 받아 주문과 같은 연결 풀, 요청 수 제한 훅을
+    거친다. 새로 받지 못하면 만료된 캐시라도 쓰고, 그것도 없으면 None을 돌려준다.
+    """
+    import httpx
+
+    target = Path(path) if path is not None else default_cache_path(settings)
+    cached = read_catalog(target)
+    if cached is not None and clock() - cached.fetched_at < settings.market_cache_ttl:
+        return cached
+    try:
+        fresh = fetch_catalog(settings, client=client, clock=clock)
+    except (httpx.HTTPError, ValueError):
+        return cached
+    try:
+        write_catalog(target, fresh)
+    except OSError:
+        pass
+    return fresh
+
+
+def default_info_path(settings: ApiSettings) -> Path:
+    # 수수료율은 계정마다 다를 수 있으므로 base_url과 access_key 조합마다 파일을 나눈다.
+    digest = hashlib.sha1(f"{settings.base_url}\n{settings.access_key}".encode("utf-8")).hexdigest()[:12]
+    return default_cache_path(settings).with_name(f"market-info-{digest}.json")
+
+
+class MarketInfoStore:
+    """마켓별 chance 마켓 정보(최소 주문 금액, 수수료율)를 실행 사이에 보관한다."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float,
+        entries: dict[str, dict[str, Any]] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self._entries = entries or {}
+        self._clock = clock
+        self._dirty = False
+
+    @classmethod
+    def open(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ) -> MarketInfoStore:
+        """파일을 읽는다. 없거나 형식이 다르면 빈 저장소로 시작한다."""
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            with open(path, encoding="utf-8") as handle:
+                raw = json.load(handle)
+        except (OSError, ValueError):
+            raw = None
+        if isinstance(raw, dict) and raw.get("format") == _INFO_FORMAT and isinstance(raw.get("markets"), dict):
+            entries = {
+                market: entry
+                for market, entry in raw["markets"].items()
+                if isinstance(entry, dict)
+                and isinstance(entry.get("fetched_at"), (int, float))
+                and isinstance(entry.get("info"), dict)
+            }
+        return cls(path, ttl=ttl, entries=entries, clock=clock)
+
+    def get(self, market: str) -> dict[str, Any] | None:
+        entry = self._entries.get(market)
+        if entry is None or self._clock() - entry["fetched_at"] >= self.ttl:
+            return None
+        return dict(entry["info"])
+
+    def put(self, market: str, info: Mapping[str, Any]) -> None:
+        self._entries[market] = {"fetched_at": self._clock(), "info": dict(info)}
+        self._dirty = True
+
+    def save(self) -> None:
+        """바뀐 내용이 있으면 임시 파일에 쓴 뒤 교체한다. 쓰지 못해도 실행은 계속한다."""
+        if not self._dirty:
+            return
+        body = json.dumps({"format": _INFO_FORMAT, "markets": self._entries}, ensure_ascii=False)
+        temp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp.write_text(body, encoding="utf-8")
+            os.replace(temp, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+
+def open_info_store(settings: ApiSettings, *, clock: Callable[[], float] = time.time) -> MarketInfoStore | None:
+    if settings.market_cache_ttl <= 0:
+        return None
+    return MarketInfoStore.open(default_info_path(settings), ttl=settings.market_cache_ttl, clock=clock)
@@ -0,0 +1,139 @@
+"""`orders/chance` 응답을 한 번에 검증해 담아 두는 스냅샷.
+
+응답 형식 오류는 해석 시점에 바로 던지지 않고 해당 방향(bid/ask)의 값을 읽을 때
+던진다. 매수만 하는 실행이 매도 쪽 계좌 정보 누락 때문에 실패하지 않게 하기 위해서다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Callable, Mapping
+
+from .types import Side, SupportsJsonResponse
+
+_MIN_TOTAL_NOT_NUMBER = "orders/chance 응답의 최소 주문 금액이 숫자가 아닙니다."
+_ACCOUNT_MISSING = "orders/chance 응답에서 계좌 정보를 찾을 수 없습니다."
+_AVAILABLE_MISSING = "orders/chance 응답에 사용 가능 잔액 정보가 없습니다."
+_AVAILABLE_NOT_NUMBER = "orders/chance 응답의 사용 가능 금액이 숫자가 아닙니다."
+
+
+@cache
+def _fast_loads() -> Callable[[bytes], Any] | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson.loads
+
+
+def decode_response(response: SupportsJsonResponse) -> Any:
+    # orjson이 설치되어 있으면 본문 바이트를 직접 해석한다.
+    loads = _fast_loads()
+    content = getattr(response, "content", None)
+    if loads is None or not isinstance(content, bytes):
+        return response.json()
+    return loads(content)
+
+
+# 회차마다 만들어지므로 frozen 초기화 비용을 피한다. 만든 뒤에는 바꾸지 않는다.
+@dataclass(slots=True)
+class SideChance:
+    min_total: float | None = None
+    currency: str | None = None
+    account: Mapping[str, Any] | None = None
+    available: float | None = None
+    min_total_error: str | None = None
+    available_error: str | None = None
+
+
+def _parse_side(market: Any, account: Any, side: Side) -> SideChance:
+    min_total: float | None = None
+    min_total_error: str | None = None
+    currency: str | None = None
+    info = market.get(side) if isinstance(market, dict) else None
+    if isinstance(info, dict):
+        raw_currency = info.get("currency")
+        if isinstance(raw_currency, str) and raw_currency:
+            currency = raw_currency
+        minimum = info.get("min_total") or info.get("min")
+        if minimum not in (None, ""):
+            try:
+                min_total = float(minimum)
+            except (TypeError, ValueError):
+                min_total_error = _MIN_TOTAL_NOT_NUMBER
+
+    if not isinstance(account, dict):
+        return SideChance(
+            min_total=min_total,
+            currency=currency,
+            min_total_error=min_total_error,
+            available_error=_ACCOUNT_MISSING,
+        )
+    available: float | None = None
+    available_error: str | None = None
+    raw_available = account.get("available")
+    if raw_available in (None, ""):
+        raw_available = account.get("balance")
+    if raw_available in (None, ""):
+        available_error = _AVAILABLE_MISSING
+    else:
+        try:
+            available = float(raw_available)
+        except (TypeError, ValueError):
+            available_error = _AVAILABLE_NOT_NUMBER
+    return SideChance(
+        min_total=min_total,
+        currency=currency,
+        account=account,
+        available=available,
+        min_total_error=min_total_error,
+        available_error=available_error,
+    )
+
+
+@dataclass(slots=True)
+class ChanceSnapshot:
+    bid: SideChance
+    ask: SideChance
+    payment_currency: Any = None
+    order_currency: Any = None
+
+    @classmethod
+    def parse(cls, raw: Mapping[str, Any]) -> ChanceSnapshot:
+        market = raw.get("market")
+        return cls(
+            bid=_parse_side(market, raw.get("bid_account"), "bid"),
+            ask=_parse_side(market, raw.get("ask_account"), "ask"),
+            payment_currency=raw.get("payment_currency"),
+            order_currency=raw.get("order_currency"),
+        )
+
+    @classmethod
+    def of(cls, chance: Mapping[str, Any] | ChanceSnapshot) -> ChanceSnapshot:
+        return chance if isinstance(chance, ChanceSnapshot) else cls.parse(chance)
+
+    def side(self, side: Side) -> SideChance:
+        return self.bid if side == "bid" else self.ask
+
+    def min_total(self, side: Side) -> float | None:
+        info = self.side(side)
+        if info.min_total_error is not None:
+            raise ValueError(info.min_total_error)
+        return info.min_total
+
+    def available(self, side: Side) -> float:
+        info = self.side(side)
+        if info.available_error is not None:
+            raise ValueError(info.available_error)
+        assert info.available is not None
+        return info.available
+
+    def account(self, side: Side) -> Mapping[str, Any] | None:
+        return self.side(side).account
+
+    def currency_label(self, side: Side, market: str) -> str:
+        currency = self.side(side).currency
+        if side == "bid":
+            return self.payment_currency or currency or "KRW"
+        return self.order_currency or currency or market.split("-", 1)[-1]
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from dataclasses import dataclass
-from typing import Any, Mapping
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from decimal import ROUND_UP, Decimal
+from typing import TYPE_CHECKING, Any, Mapping, Sequence, TypeVar
 
-import httpx
+from . import cache, config, metrics, orders, output
+from .chance import ChanceSnapshot
+from .types import AsyncHttpClient, HttpClient, Side, ensure_side
 
-from . import config, orders
-from .types import HttpClient, Side, ensure_side
+if TYPE_CHECKING:
+    import httpx
+
+    from . import accounts, batch, catalog, engine, journal, ratelimit, transport
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 5
+# --adaptive에서 --max-concurrency를 주지 않으면 시작 값의 이 배수까지 늘린다.
+ADAPTIVE_HEADROOM = 4
+DEFAULT_ARM_LEAD = 3.0
+# 빗썸 코인 수량의 최소 단위
+_VOLUME_STEP = Decimal("0.00000001")
 
 
 @dataclass(frozen=True)
@@ -22,6 +38,8 @@ class OrderPlan:
     available: float
     currency_label: str
     dry_run: bool
+    # 실제 주문에만 붙는 클라이언트 주문 식별자. 재전송 전 중복 확인에 쓴다.
+    identifier: str | None = None
 
 
 @dataclass(frozen=True)
@@ -30,6 +48,30 @@ class CliOptions:
     side: Side
     dotenv: str | None
     dry_run: bool
+    markets: tuple[str, ...] = ()
+    concurrency: int = DEFAULT_CONCURRENCY
+    repeat: int | None = None
+    interval: float = 0.0
+    until: datetime | None = None
+    metrics_out: str | None = None
+    metrics_prom: str | None = None
+    plan: str | None = None
+    plan_out: str | None = None
+    fire_at: datetime | None = None
+    arm_lead: float = DEFAULT_ARM_LEAD
+    output: str = "human"
+    accounts: str | None = None
+    single_snapshot: bool = False
+    adaptive: bool = False
+    max_concurrency: int | None = None
+    journal: str | None = None
+    resume: bool = False
+    confirm_fills: float | None = None
+    simulate: str | None = None
+
+    @property
+    def looping(self) -> bool:
+        return self.repeat is not None or self.until is not None
 
 
 @dataclass(frozen=True)
@@ -37,6 +79,10 @@ class ExecutionConfig:
     market: str
     side: Side
     dry_run: bool
+    amount: float | None = None
+
+
+CycleResult = tuple[OrderPlan, Mapping[str, Any] | None, Mapping[str, Any]]
 
 
 def _resolve_market(market: str | None, settings: config.ApiSettings) -> str:
@@ -47,20 +93,95 @@ def _resolve_market(market: str | None, settings: config.ApiSettings) -> str:
     raise ValueError("--market 또는 BITTHUMB_DEFAULT_MARKET가 필요합니다.")
 
 
-def _order_min_total(chance: Mapping[str, Any], side: Side) -> float | None:
-    market = chance.get("market")
-    if not isinstance(market, dict):
-        return None
-    info = market.get("bid" if side == "bid" else "ask")
-    if not isinstance(info, dict):
+def _resolve_markets(
+    market_catalog: catalog.MarketCatalog | None,
+    markets: Sequence[str],
+) -> tuple[str, ...]:
+    from . import catalog
+
+    # 목록을 받지 못했으면 그대로 보내 거래소가 판단하게 한다. 패턴만은 펼칠 수 없다.
+    if market_catalog is None:
+        for market in markets:
+            if catalog.is_pattern(market):
+                raise ValueError(f"거래소 마켓 목록을 가져오지 못해 {market}을(를) 펼칠 수 없습니다.")
+        return tuple(markets)
+    return market_catalog.resolve(markets)
+
+
+def _resolve_single_market(market_catalog: catalog.MarketCatalog | None, market: str) -> str:
+    resolved = _resolve_markets(market_catalog, (market,))
+    if len(resolved) != 1:
+        raise ValueError(f"--market {market}이(가) 여러 마켓과 일치합니다. --markets를 사용하세요.")
+    return resolved[0]
+
+
+def _parse_markets(raw: str) -> tuple[str, ...]:
+    markets: list[str] = []
+    for item in raw.split(","):
+        market = item.strip()
+        if market and market not in markets:
+            markets.append(market)
+    if not markets:
+        raise ValueError("--markets에 최소 한 개의 마켓이 필요합니다.")
+    return tuple(markets)
+
+
+def _parse_moment(raw: str, flag: str = "--until") -> datetime:
+    try:
+        moment = datetime.fromisoformat(raw)
+    except ValueError as exc:
+        raise ValueError(f"{flag}은 ISO 8601 시각이어야 합니다. (예: 2026-10-20T10:00:00+09:00)") from exc
+    # 시간대가 없으면 로컬 시간으로 해석한다.
+    return moment if moment.tzinfo is not None else moment.astimezone()
+
+
+def _order_min_total(chance: Mapping[str, Any] | ChanceSnapshot, side: Side) -> float | None:
+    return ChanceSnapshot.of(chance).min_total(side)
+
+
+def _guide_amount(snapshot: ChanceSnapshot, side: Side, price: float | None) -> float | None:
+    minimum = snapshot.min_total(side)
+    if side == "bid" or minimum is None:
+        return minimum
+    if price is None or price <= 0:
+        raise ValueError("매도 최소 주문 금액을 수량으로 환산하려면 현재가가 필요합니다.")
+    # 환산한 수량이 최소 금액 아래로 내려가지 않도록 소수점 8자리에서 올린다.
+    volume = (Decimal(str(minimum)) / Decimal(str(price))).quantize(_VOLUME_STEP, rounding=ROUND_UP)
+    return float(volume)
+
+
+def _needs_price(snapshot: ChanceSnapshot, side: Side) -> bool:
+    return side == "ask" and snapshot.ask.min_total is not None
+
+
+def _ask_price(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    snapshot: ChanceSnapshot,
+    recorder: metrics.Recorder,
+) -> float | None:
+    if not _needs_price(snapshot, config.side):
         return None
-    minimum = info.get("min_total") or info.get("min")
-    if minimum in (None, ""):
+    prices = orders.fetch_ticker_prices(client=client, settings=settings, markets=[config.market], recorder=recorder)
+    return prices.get(config.market)
+
+
+async def _ask_price_async(
+    *,
+    client: AsyncHttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    snapshot: ChanceSnapshot,
+    recorder: metrics.Recorder,
+) -> float | None:
+    if not _needs_price(snapshot, config.side):
         return None
-    try:
-        return float(minimum)
-    except (TypeError, ValueError) as exc:
-        raise ValueError("orders/chance 응답의 최소 주문 금액이 숫자가 아닙니다.") from exc
+    prices = await orders.fetch_ticker_prices_async(
+        client=client, settings=settings, markets=[config.market], recorder=recorder
+    )
+    return prices.get(config.market)
 
 
 def _resolve_amount(guide_amount: float | None, fallback_amount: float | None) -> float:
@@ -71,39 +192,12 @@ def _resolve_amount(guide_amount: float | None, fallback_amount: float | None) -
     raise ValueError("orders/chance 응답 또는 BITTHUMB_FALLBACK_AMOUNT 중 최소 주문 금액이 필요합니다.")
 
 
-def _available_balance(chance: Mapping[str, Any], side: Side) -> float:
-    account_key = "bid_account" if side == "bid" else "ask_account"
-    account = chance.get(account_key)
-    if not isinstance(account, dict):
-        raise ValueError("orders/chance 응답에서 계좌 정보를 찾을 수 없습니다.")
-    available = account.get("available")
-    if available in (None, ""):
-        available = account.get("balance")
-    if available in (None, ""):
-        raise ValueError("orders/chance 응답에 사용 가능 잔액 정보가 없습니다.")
-    try:
-        return float(available)
-    except (TypeError, ValueError) as exc:
-        raise ValueError("orders/chance 응답의 사용 가능 금액이 숫자가 아닙니다.") from exc
-
-
-def _resolve_currency_label(chance: Mapping[str, Any], side: Side, market: str) -> str:
-    market_info = chance.get("market")
-    currency_from_market: str | None = None
-    if isinstance(market_info, dict):
-        section = market_info.get("bid" if side == "bid" else "ask")
-        if isinstance(section, dict):
-            raw_currency = section.get("currency")
-            if isinstance(raw_currency, str) and raw_currency:
-                currency_from_market = raw_currency
-
-    if side == "bid":
-        return (chance.get("payment_currency") or currency_from_market or "KRW")
-    return (
-        chance.get("order_currency")
-        or currency_from_market
-        or market.split("-", 1)[-1]
-    )
+def _available_balance(chance: Mapping[str, Any] | ChanceSnapshot, side: Side) -> float:
+    return ChanceSnapshot.of(chance).available(side)
+
+
+def _resolve_currency_label(chance: Mapping[str, Any] | ChanceSnapshot, side: Side, market: str) -> str:
+    return ChanceSnapshot.of(chance).currency_label(side, market)
 
 
 def _assert_sufficient_balance(required: float, available: float, currency: str) -> None:
@@ -114,10 +208,15 @@ def _assert_sufficient_balance(required: float, available: float, currency: str)
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    from . import fills
+
     parser = argparse.ArgumentParser(
         description="빗썸 API 이벤트 스크립트",
     )
-    parser.add_argument("--market", help="거래 마켓 (예: KRW-BTC)")
+    targets = parser.add_mutually_exclusive_group()
+    targets.add_argument("--market", help="거래 마켓 (예: KRW-BTC)")
+    targets.add_argument("--markets", help="동시에 실행할 마켓 목록 (예: KRW-BTC,KRW-XRP)")
+    targets.add_argument("--plan", help="한 줄에 하나씩 {market, side, amount}를 담은 JSONL 주문 계획 파일")
     parser.add_argument("--side", choices=["bid", "ask"], default="bid", help="주문 방향")
     parser.add_argument("--dotenv", help="커스텀 .env 경로", default=None)
     parser.add_argument(
@@ -125,6 +224,71 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="실제 주문 대신 시뮬레이션으로 실행 (기본은 LIVE)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"--markets/--plan 실행 시 동시 요청 수 (기본 {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="429/5xx와 응답 시간에 따라 동시 요청 수를 자동 조절 (--concurrency에서 시작)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help=f"--adaptive가 늘릴 수 있는 최대 동시 요청 수 (기본 --concurrency의 {ADAPTIVE_HEADROOM}배)",
+    )
+    parser.add_argument("--journal", help="--plan 주문의 의도와 결과를 기록할 SQLite 저널 경로")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="--journal에 완료로 기록된 행은 건너뛰고, 결과가 없는 행은 주문 목록으로 확인한 뒤 이어서 실행",
+    )
+    parser.add_argument(
+        "--confirm-fills",
+        nargs="?",
+        type=float,
+        const=fills.DEFAULT_DEADLINE,
+        metavar="SECONDS",
+        help=f"주문 뒤 체결을 한 번에 조회해 결과에 붙임. 값은 확인 마감(초, 기본 {fills.DEFAULT_DEADLINE:g})",
+    )
+    parser.add_argument(
+        "--simulate",
+        metavar="DIR",
+        help="--plan --dry-run 주문을 DIR에 기록된 호가 스냅샷으로 체결해 보는 오프라인 백테스트 (NumPy 필요)",
+    )
+    parser.add_argument("--plan-out", help="--plan 결과를 기록할 JSONL 경로 (기본 표준 출력)")
+    parser.add_argument("--repeat", type=int, help="하나의 연결 풀로 반복할 주문 횟수")
+    parser.add_argument("--interval", type=float, default=0.0, help="반복 사이 대기 시간(초)")
+    parser.add_argument("--until", help="이 시각까지 반복 (ISO 8601, 예: 2026-10-20T10:00:00+09:00)")
+    parser.add_argument(
+        "--fire-at",
+        help="이 시각에 맞춰 주문 전송 (ISO 8601, 예: 2026-10-20T10:00:00+09:00)",
+    )
+    parser.add_argument(
+        "--arm-lead",
+        type=float,
+        default=DEFAULT_ARM_LEAD,
+        help=f"--fire-at 몇 초 전에 연결 예열과 주문 준비를 할지 (기본 {DEFAULT_ARM_LEAD})",
+    )
+    parser.add_argument(
+        "--single-snapshot",
+        action="store_true",
+        help="--markets 실행 시 마켓별 chance 대신 계좌 조회 한 번으로 잔고를 나눠 주문 계획",
+    )
+    parser.add_argument(
+        "--accounts",
+        help="여러 계정을 계정별 프로세스로 실행할 계정 파일(TOML)",
+    )
+    parser.add_argument(
+        "--output",
+        choices=output.OUTPUT_MODES,
+        help="출력 형식: human(기본), json(실행 끝에 문서 하나), jsonl(회차마다 한 줄), quiet",
+    )
+    parser.add_argument("--metrics-out", help="회차별 단계 지연을 JSON Lines로 기록할 경로")
+    parser.add_argument("--metrics-prom", help="Prometheus textfile 히스토그램을 기록할 경로")
     return parser
 
 
@@ -133,21 +297,93 @@ def _parse_cli_options(argv: list[str] | None) -> tuple[argparse.ArgumentParser,
     namespace = parser.parse_args(argv)
     try:
         side = ensure_side(namespace.side)
+        markets = _parse_markets(namespace.markets) if namespace.markets is not None else ()
+        until = _parse_moment(namespace.until) if namespace.until is not None else None
+        fire_at = _parse_moment(namespace.fire_at, "--fire-at") if namespace.fire_at is not None else None
     except ValueError as exc:
         parser.error(str(exc))
+    if namespace.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다.")
+    if namespace.repeat is not None and namespace.repeat < 1:
+        parser.error("--repeat는 1 이상이어야 합니다.")
+    if namespace.interval < 0:
+        parser.error("--interval은 0 이상이어야 합니다.")
+    if (markets or namespace.plan) and (namespace.repeat is not None or until is not None):
+        parser.error("--repeat/--until은 --markets/--plan과 함께 사용할 수 없습니다.")
+    if namespace.plan_out and not namespace.plan:
+        parser.error("--plan-out은 --plan과 함께 사용해야 합니다.")
+    # --plan/--simulate 결과는 항상 --plan-out JSONL로 기록하므로 다른 형식을 받지 않는다.
+    if namespace.output is not None and namespace.plan:
+        parser.error("--output은 --plan과 함께 사용할 수 없습니다. 결과는 --plan-out에 JSONL로 기록합니다.")
+    if fire_at is not None and (
+        markets or namespace.plan or namespace.repeat is not None or until is not None
+    ):
+        parser.error("--fire-at은 단일 --market 실행에서만 사용할 수 있습니다.")
+    if namespace.accounts and (
+        namespace.plan or namespace.repeat is not None or until is not None or fire_at is not None
+    ):
+        parser.error("--accounts는 --plan, --repeat, --until, --fire-at과 함께 사용할 수 없습니다.")
+    # 계정별 작업자 프로세스는 아래 옵션들을 전달받지 않으므로 조용히 무시하지 않고 거부한다.
+    if namespace.accounts and (
+        namespace.adaptive
+        or namespace.single_snapshot
+        or namespace.metrics_out
+        or namespace.metrics_prom
+        or namespace.journal
+    ):
+        parser.error(
+            "--accounts는 --adaptive, --single-snapshot, --metrics-out, --metrics-prom, --journal과 "
+            "함께 사용할 수 없습니다."
+        )
+    if namespace.single_snapshot and not markets:
+        parser.error("--single-snapshot은 --markets와 함께 사용해야 합니다.")
+    if namespace.adaptive and (not (markets or namespace.plan) or namespace.single_snapshot):
+        parser.error("--adaptive는 --markets 또는 --plan과 함께 사용해야 합니다. (--single-snapshot 제외)")
+    if namespace.max_concurrency is not None and (
+        not namespace.adaptive or namespace.max_concurrency < namespace.concurrency
+    ):
+        parser.error("--max-concurrency는 --adaptive와 함께, --concurrency 이상으로 지정해야 합니다.")
+    if namespace.journal and (not namespace.plan or namespace.dry_run):
+        parser.error("--journal은 LIVE --plan 실행에서만 사용할 수 있습니다.")
+    if namespace.resume and not namespace.journal:
+        parser.error("--resume은 --journal과 함께 사용해야 합니다.")
+    if namespace.confirm_fills is not None:
+        if namespace.confirm_fills <= 0:
+            parser.error("--confirm-fills는 0보다 커야 합니다.")
+        if namespace.dry_run or namespace.accounts or namespace.repeat is not None or until or fire_at:
+            parser.error("--confirm-fills는 --dry-run, --accounts, --repeat, --until, --fire-at과 함께 사용할 수 없습니다.")
+    if namespace.simulate and (not namespace.plan or not namespace.dry_run):
+        parser.error("--simulate는 --plan --dry-run과 함께 사용해야 합니다.")
+    if namespace.arm_lead < 0:
+        parser.error("--arm-lead는 0 이상이어야 합니다.")
     return parser, CliOptions(
         market=namespace.market,
         side=side,
         dotenv=namespace.dotenv,
         dry_run=namespace.dry_run,
+        markets=markets,
+        concurrency=namespace.concurrency,
+        repeat=namespace.repeat,
+        interval=namespace.interval,
+        until=until,
+        metrics_out=namespace.metrics_out,
+        metrics_prom=namespace.metrics_prom,
+        plan=namespace.plan,
+        plan_out=namespace.plan_out,
+        fire_at=fire_at,
+        arm_lead=namespace.arm_lead,
+        output=namespace.output or "human",
+        accounts=namespace.accounts,
+        single_snapshot=namespace.single_snapshot,
+        adaptive=namespace.adaptive,
+        max_concurrency=namespace.max_concurrency,
+        journal=namespace.journal,
+        resume=namespace.resume,
+        confirm_fills=namespace.confirm_fills,
+        simulate=namespace.simulate,
     )
 
 
-def _print(label: str, payload: Any) -> None:
-    text = json.dumps(payload, ensure_ascii=False, indent=2)
-    print(f"\n[{label}]\n{text}")
-
-
 def prepare_execution_config(options: CliOptions, settings: config.ApiSettings) -> ExecutionConfig:
     market = _resolve_market(options.market, settings)
     return ExecutionConfig(
@@ -157,42 +393,147 @@ def prepare_execution_config(options: CliOptions, settings: config.ApiSettings)
     )
 
 
-def _announce_execution(config: ExecutionConfig) -> None:
-    print("주문 준비 중...")
-    print(f"- 마켓: {config.market}")
-    print(f"- 모드: {'DRY-RUN' if config.dry_run else 'LIVE'}")
+def prepare_market_configs(options: CliOptions) -> list[ExecutionConfig]:
+    return [
+        ExecutionConfig(market=market, side=options.side, dry_run=options.dry_run)
+        for market in options.markets
+    ]
+
+
+def _announce_execution(reporter: output.Reporter, config: ExecutionConfig) -> None:
+    reporter.status("주문 준비 중...")
+    reporter.status(f"- 마켓: {config.market}")
+    reporter.status(f"- 모드: {'DRY-RUN' if config.dry_run else 'LIVE'}")
 
 
-def _summarize_plan(plan: OrderPlan, account_snapshot: Mapping[str, Any] | None) -> None:
-    print(f"- 금액: {plan.amount} {plan.currency_label}")
-    print(f"- 사용 가능: {plan.available} {plan.currency_label}")
-    if account_snapshot is not None:
-        _print("주문 가능 정보", account_snapshot)
+def _announce_markets(reporter: output.Reporter, configs: Sequence[ExecutionConfig], concurrency: int) -> None:
+    reporter.status("주문 준비 중...")
+    reporter.status(f"- 마켓: {', '.join(item.market for item in configs)}")
+    reporter.status(f"- 모드: {'DRY-RUN' if configs[0].dry_run else 'LIVE'}")
+    reporter.status(f"- 동시 요청: {concurrency}")
+
+
+def _cycle_recorder(sink: metrics.MetricsSink, reporter: output.Reporter) -> metrics.Recorder:
+    if reporter.timings and not sink.enabled:
+        return metrics.Recorder()
+    return sink.recorder()
+
+
+def cycle_output(
+    config: ExecutionConfig,
+    value: CycleResult,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    **fields: Any,
+) -> dict[str, Any]:
+    """한 회차 결과를 출력·데몬 응답용 레코드로 만든다."""
+    record = {"side": config.side, "dry_run": config.dry_run, **_cycle_record(config.market, value, None), **fields}
+    if recorder.enabled:
+        record["timings"] = {name: round(seconds, 6) for name, seconds in recorder.phases.items()}
+    return record
+
+
+def attach_fills(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    records: Sequence[dict[str, Any]],
+    deadline: float,
+) -> None:
+    """성공한 주문 레코드들의 체결을 한 번에 확인해 `fill` 항목으로 붙인다."""
+    import httpx
+    from . import fills
+
+    placed = [
+        (record, record["result"]["uuid"])
+        for record in records
+        if record.get("ok") and isinstance(record.get("result"), Mapping) and record["result"].get("uuid")
+    ]
+    if not placed:
+        return
+    try:
+        found = fills.confirm_fills(
+            client=client, settings=settings, uuids=[uuid for _, uuid in placed], deadline=deadline
+        )
+    except httpx.HTTPError as exc:
+        for record, _ in placed:
+            record["fill"] = {"error": f"체결 확인 실패: {exc}"}
+        return
+    for record, uuid in placed:
+        record["fill"] = found[uuid].as_record()
 
 
 def _fail(parser: argparse.ArgumentParser, exc: Exception) -> None:
     parser.error(str(exc))
 
 
-def _handle_http_status_error(exc: httpx.HTTPStatusError) -> None:
-    _print(
+def _handle_http_status_error(reporter: output.Reporter, exc: httpx.HTTPStatusError) -> None:
+    reporter.section(
+        "api_error",
         "API 오류",
         {"status_code": exc.response.status_code, "body": exc.response.text},
     )
     sys.exit(1)
 
+
+def describe_error(exc: Exception) -> dict[str, Any]:
+    """예외를 레코드에 넣을 `status_code`/`body` 또는 `error` 항목으로 바꾼다."""
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return {"status_code": exc.response.status_code, "body": exc.response.text}
+    if isinstance(exc, httpx.HTTPError):
+        return {"error": f"네트워크 오류: {exc}"}
+    return {"error": str(exc)}
+
+
+def _cycle_record(market: str, value: CycleResult | None, error: Exception | None) -> dict[str, Any]:
+    if error is not None:
+        return {"market": market, "ok": False, **describe_error(error)}
+    plan, account_snapshot, result = value
+    return {
+        "market": market,
+        "ok": True,
+        "amount": plan.amount,
+        "available": plan.available,
+        "currency": plan.currency_label,
+        "account": account_snapshot,
+        "result": result,
+    }
+
+
+def summarize_outcome(outcome: engine.Outcome[str, CycleResult]) -> dict[str, Any]:
+    """마켓별 실행 결과를 출력용 레코드로 만든다."""
+    return _cycle_record(outcome.key, outcome.value, outcome.error)
+
+
+def _plan_record(outcome: engine.Outcome[batch.PlanRow, CycleResult]) -> dict[str, Any]:
+    row = outcome.key
+    return {"line": row.line, "side": row.side, **_cycle_record(row.market, outcome.value, outcome.error)}
+
+
 def build_order_plan(
     *,
-    chance: Mapping[str, Any],
+    chance: Mapping[str, Any] | ChanceSnapshot,
     side: Side,
     market: str,
     fallback_amount: float | None,
     dry_run: bool,
+    amount: float | None = None,
+    price: float | None = None,
 ) -> OrderPlan:
-    guide_amount = _order_min_total(chance, side)
-    amount = _resolve_amount(guide_amount, fallback_amount)
-    available = _available_balance(chance, side)
-    currency_label = _resolve_currency_label(chance, side, market)
+    """chance 응답으로 주문 금액(매도는 수량)을 정하고 잔고를 검사한다.
+
+    chance의 `min_total`은 매수·매도 모두 KRW 금액이므로, 매도는 `price`(현재가)로
+    나눠 코인 수량으로 환산한다.
+    """
+    snapshot = ChanceSnapshot.of(chance)
+    guide_amount = _guide_amount(snapshot, side, price)
+    if amount is None:
+        amount = _resolve_amount(guide_amount, fallback_amount)
+    elif guide_amount is not None and amount + 1e-9 < guide_amount:
+        raise ValueError(f"주문 금액 {amount}이(가) 최소 주문 금액 {guide_amount}보다 작습니다.")
+    available = snapshot.available(side)
+    currency_label = snapshot.currency_label(side, market)
     _assert_sufficient_balance(amount, available, currency_label)
     return OrderPlan(
         market=market,
@@ -201,66 +542,1008 @@ def build_order_plan(
         available=available,
         currency_label=currency_label,
         dry_run=dry_run,
+        identifier=None if dry_run else orders.new_identifier(),
     )
 
 
+def chance_cache_for(settings: config.ApiSettings) -> cache.ChanceCache | None:
+    if settings.chance_market_ttl <= 0 or settings.chance_account_ttl <= 0:
+        return None
+    return cache.ChanceCache(market_ttl=settings.chance_market_ttl, account_ttl=settings.chance_account_ttl)
+
+
+def _cached_chance(
+    chance_cache: cache.ChanceCache | None,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+) -> dict[str, Any] | None:
+    if chance_cache is None:
+        return None
+    return chance_cache.get(settings.access_key, config.market, config.side)
+
+
+def _store_chance(
+    chance_cache: cache.ChanceCache | None,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    chance: Mapping[str, Any],
+) -> None:
+    if chance_cache is not None:
+        chance_cache.store(settings.access_key, config.market, chance)
+
+
+def _forget_chance(chance_cache: cache.ChanceCache | None, settings: config.ApiSettings, plan: OrderPlan) -> None:
+    # 실패한 주문은 잔고에 어떤 영향을 줬는지 알 수 없으므로 다음 회차에서 다시 조회한다.
+    if chance_cache is not None and not plan.dry_run:
+        chance_cache.invalidate(settings.access_key, plan.market)
+
+
+def _apply_order(chance_cache: cache.ChanceCache | None, settings: config.ApiSettings, plan: OrderPlan) -> None:
+    if chance_cache is not None and not plan.dry_run:
+        chance_cache.apply_order(settings.access_key, plan.market, plan.side, plan.amount)
+
+
 def execute_trade_cycle(
     *,
     client: HttpClient,
     settings: config.ApiSettings,
     config: ExecutionConfig,
-) -> tuple[OrderPlan, Mapping[str, Any] | None, Mapping[str, Any]]:
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    chance_cache: cache.ChanceCache | None = None,
+    before_order: Callable[[OrderPlan], None] | None = None,
+) -> CycleResult:
+    chance = _cached_chance(chance_cache, settings, config)
+    if chance is None:
+        chance = orders.fetch_order_chance(
+            client=client,
+            settings=settings,
+            market=config.market,
+            recorder=recorder,
+        )
+        _store_chance(chance_cache, settings, config, chance)
+    with recorder.phase("plan"):
+        snapshot = ChanceSnapshot.parse(chance)
+    price = _ask_price(client=client, settings=settings, config=config, snapshot=snapshot, recorder=recorder)
+    with recorder.phase("plan"):
+        plan = build_order_plan(
+            chance=snapshot,
+            side=config.side,
+            market=config.market,
+            fallback_amount=settings.fallback_amount,
+            dry_run=config.dry_run,
+            amount=config.amount,
+            price=price,
+        )
+    if before_order is not None and not plan.dry_run:
+        before_order(plan)
+    try:
+        result = orders.place_market_order(
+            client=client,
+            settings=settings,
+            market=plan.market,
+            amount=plan.amount,
+            side=plan.side,
+            dry_run=plan.dry_run,
+            recorder=recorder,
+            identifier=plan.identifier,
+        )
+    except Exception:
+        _forget_chance(chance_cache, settings, plan)
+        raise
+    _apply_order(chance_cache, settings, plan)
+    return plan, snapshot.account(plan.side), result
+
+
+def _record_cycle(
+    sink: metrics.MetricsSink,
+    recorder: metrics.Recorder,
+    config: ExecutionConfig,
+    error: Exception | None = None,
+) -> None:
+    sink.record_cycle(
+        recorder,
+        market=config.market,
+        side=config.side,
+        dry_run=config.dry_run,
+        error=describe_error(error) if error is not None else None,
+    )
+
+
+def run_measured_cycle(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    sink: metrics.MetricsSink = metrics.NULL_SINK,
+    stats: transport.TransportStats | None = None,
+    chance_cache: cache.ChanceCache | None = None,
+    recorder: metrics.Recorder | None = None,
+    before_order: Callable[[OrderPlan], None] | None = None,
+) -> CycleResult:
+    if recorder is None:
+        recorder = sink.recorder()
+    connect_before = stats.connect_seconds if stats is not None else 0.0
+    try:
+        with recorder.phase("cycle"):
+            result = execute_trade_cycle(
+                client=client,
+                settings=settings,
+                config=config,
+                recorder=recorder,
+                chance_cache=chance_cache,
+                before_order=before_order,
+            )
+    except Exception as exc:
+        if stats is not None:
+            recorder.add("connect", stats.connect_seconds - connect_before)
+        _record_cycle(sink, recorder, config, exc)
+        raise
+    if stats is not None:
+        recorder.add("connect", stats.connect_seconds - connect_before)
+    _record_cycle(sink, recorder, config)
+    return result
+
+
+def run_repeated_cycles(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    repeat: int | None,
+    interval: float = 0.0,
+    until: datetime | None = None,
+    sink: metrics.MetricsSink = metrics.NULL_SINK,
+    stats: transport.TransportStats | None = None,
+    chance_cache: cache.ChanceCache | None = None,
+) -> Iterator[CycleResult]:
+    return _repeat(
+        lambda: run_measured_cycle(
+            client=client,
+            settings=settings,
+            config=config,
+            sink=sink,
+            stats=stats,
+            chance_cache=chance_cache,
+        ),
+        repeat=repeat,
+        interval=interval,
+        until=until,
+    )
+
+
+def _repeat(
+    cycle: Callable[[], T],
+    *,
+    repeat: int | None,
+    interval: float = 0.0,
+    until: datetime | None = None,
+) -> Iterator[T]:
+    completed = 0
+    while repeat is None or completed < repeat:
+        if completed and interval > 0:
+            time.sleep(interval)
+        if until is not None and datetime.now(timezone.utc) >= until:
+            return
+        yield cycle()
+        completed += 1
+
+
+def _run_loop(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    options: CliOptions,
+    stats: transport.TransportStats,
+    sink: metrics.MetricsSink,
+    reporter: output.Reporter,
+) -> None:
+    started = time.monotonic()
+    completed = 0
+    chance_cache = chance_cache_for(settings)
+
+    def _cycle() -> tuple[CycleResult, metrics.Recorder]:
+        recorder = _cycle_recorder(sink, reporter)
+        value = run_measured_cycle(
+            client=client,
+            settings=settings,
+            config=config,
+            sink=sink,
+            stats=stats,
+            chance_cache=chance_cache,
+            recorder=recorder,
+        )
+        return value, recorder
+
+    try:
+        for value, recorder in _repeat(
+            _cycle,
+            repeat=options.repeat,
+            interval=options.interval,
+            until=options.until,
+        ):
+            completed += 1
+            reporter.cycle(cycle_output(config, value, recorder, index=completed))
+    finally:
+        # 중간에 실패하더라도 그때까지의 처리량은 남긴다.
+        summary = stats.summary(cycles=completed, elapsed=time.monotonic() - started)
+        if chance_cache is not None:
+            summary["chance_cache"] = chance_cache.stats()
+        reporter.section("throughput", "처리량 요약", summary)
+
+
+def arm_order(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+) -> tuple[OrderPlan, Mapping[str, Any] | None, orders.PreparedOrder]:
+    # chance 조회가 연결 풀 예열을 겸한다.
     chance = orders.fetch_order_chance(
         client=client,
         settings=settings,
         market=config.market,
+        recorder=recorder,
     )
-    plan = build_order_plan(
-        chance=chance,
-        side=config.side,
-        market=config.market,
-        fallback_amount=settings.fallback_amount,
-        dry_run=config.dry_run,
+    with recorder.phase("plan"):
+        snapshot = ChanceSnapshot.parse(chance)
+    price = _ask_price(client=client, settings=settings, config=config, snapshot=snapshot, recorder=recorder)
+    with recorder.phase("plan"):
+        plan = build_order_plan(
+            chance=snapshot,
+            side=config.side,
+            market=config.market,
+            fallback_amount=settings.fallback_amount,
+            dry_run=config.dry_run,
+            amount=config.amount,
+            price=price,
+        )
+        prepared = orders.prepare_market_order(
+            settings=settings,
+            market=plan.market,
+            amount=plan.amount,
+            side=plan.side,
+            identifier=plan.identifier,
+        )
+    return plan, snapshot.account(plan.side), prepared
+
+
+def fire_armed_order(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    plan: OrderPlan,
+    prepared: orders.PreparedOrder,
+    target_ts: float,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+) -> tuple[Mapping[str, Any], dict[str, Any]]:
+    from . import firing
+
+    armed_at = time.time()
+    firing.wait_until(target_ts)
+    with recorder.phase("sign"):
+        headers = orders.sign_prepared_order(settings, prepared)
+    sent_at = time.time()
+    if plan.dry_run:
+        result: Mapping[str, Any] = {"dry_run": True, **prepared.payload}
+    else:
+        with recorder.phase("order"):
+            result = orders.post_prepared_order(client=client, prepared=prepared, headers=headers)
+    done_at = time.time()
+    return result, firing.timing_report(
+        target_ts=target_ts,
+        armed_at=armed_at,
+        sent_at=sent_at,
+        done_at=done_at,
     )
-    result = orders.place_market_order(
+
+
+def _run_fire_at(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    options: CliOptions,
+    sink: metrics.MetricsSink,
+    reporter: output.Reporter,
+) -> None:
+    from . import firing
+
+    target_ts = options.fire_at.timestamp()
+    if target_ts <= time.time():
+        raise ValueError("--fire-at 시각이 이미 지났습니다.")
+    reporter.status(f"- 발사 시각: {options.fire_at.isoformat()} (준비 {options.arm_lead}초 전)")
+
+    firing.wait_until(target_ts - options.arm_lead)
+    recorder = _cycle_recorder(sink, reporter)
+    try:
+        plan, account_snapshot, prepared = arm_order(
+            client=client,
+            settings=settings,
+            config=config,
+            recorder=recorder,
+        )
+        result, timing = fire_armed_order(
+            client=client,
+            settings=settings,
+            plan=plan,
+            prepared=prepared,
+            target_ts=target_ts,
+            recorder=recorder,
+        )
+    except Exception as exc:
+        _record_cycle(sink, recorder, config, exc)
+        raise
+    _record_cycle(sink, recorder, config)
+    reporter.cycle(cycle_output(config, (plan, account_snapshot, result), recorder, firing=timing))
+
+
+async def execute_trade_cycle_async(
+    *,
+    client: AsyncHttpClient,
+    settings: config.ApiSettings,
+    config: ExecutionConfig,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    chance_cache: cache.ChanceCache | None = None,
+) -> CycleResult:
+    chance = _cached_chance(chance_cache, settings, config)
+    if chance is None:
+        chance = await orders.fetch_order_chance_async(
+            client=client,
+            settings=settings,
+            market=config.market,
+            recorder=recorder,
+        )
+        _store_chance(chance_cache, settings, config, chance)
+    with recorder.phase("plan"):
+        snapshot = ChanceSnapshot.parse(chance)
+    price = await _ask_price_async(client=client, settings=settings, config=config, snapshot=snapshot, recorder=recorder)
+    with recorder.phase("plan"):
+        plan = build_order_plan(
+            chance=snapshot,
+            side=config.side,
+            market=config.market,
+            fallback_amount=settings.fallback_amount,
+            dry_run=config.dry_run,
+            amount=config.amount,
+            price=price,
+        )
+    try:
+        result = await orders.place_market_order_async(
+            client=client,
+            settings=settings,
+            market=plan.market,
+            amount=plan.amount,
+            side=plan.side,
+            dry_run=plan.dry_run,
+            recorder=recorder,
+            identifier=plan.identifier,
+        )
+    except Exception:
+        _forget_chance(chance_cache, settings, plan)
+        raise
+    _apply_order(chance_cache, settings, plan)
+    return plan, snapshot.account(plan.side), result
+
+
+async def run_markets(
+    *,
+    settings: config.ApiSettings,
+    configs: Sequence[ExecutionConfig],
+    concurrency: int,
+    sink: metrics.MetricsSink = metrics.NULL_SINK,
+    limit: engine.AdaptiveLimit | None = None,
+    limiter: ratelimit.RateLimiter | None = None,
+) -> list[engine.Outcome[str, CycleResult]]:
+    import httpx
+    from . import engine, ratelimit
+
+    width = limit.maximum if limit is not None else concurrency
+    limits = httpx.Limits(max_connections=width, max_keepalive_connections=width)
+    limiter = limiter or ratelimit.RateLimiter.from_settings(settings)
+    by_market = {item.market: item for item in configs}
+    async with httpx.AsyncClient(
+        timeout=orders.DEFAULT_TIMEOUT,
+        limits=limits,
+        event_hooks=limiter.async_event_hooks(),
+    ) as client:
+
+        async def _cycle(market: str) -> CycleResult:
+            recorder = sink.recorder()
+            try:
+                with recorder.phase("cycle"):
+                    result = await execute_trade_cycle_async(
+                        client=client,
+                        settings=settings,
+                        config=by_market[market],
+                        recorder=recorder,
+                    )
+            except Exception as exc:
+                _record_cycle(sink, recorder, by_market[market], exc)
+                raise
+            _record_cycle(sink, recorder, by_market[market])
+            return result
+
+        return await engine.run_bounded(by_market, _cycle, concurrency=concurrency, limit=limit)
+
+
+def adaptive_limit_for(options: CliOptions, sink: metrics.MetricsSink) -> engine.AdaptiveLimit | None:
+    from . import engine
+
+    if not options.adaptive:
+        return None
+    return engine.AdaptiveLimit(
+        initial=options.concurrency,
+        maximum=options.max_concurrency or options.concurrency * ADAPTIVE_HEADROOM,
+        on_change=lambda value: sink.set_gauge("concurrency_limit", value),
+    )
+
+
+def _run_markets(
+    parser: argparse.ArgumentParser,
+    options: CliOptions,
+    settings: config.ApiSettings,
+    sink: metrics.MetricsSink,
+    reporter: output.Reporter,
+) -> None:
+    import asyncio
+
+    import httpx
+    from . import catalog, ratelimit, transport
+
+    limit = adaptive_limit_for(options, sink)
+    # 마켓 목록과 체결 확인 조회도 주문과 같은 요청 수 제한 버킷을 쓰게 한다.
+    limiter = ratelimit.RateLimiter.from_settings(settings)
+    with httpx.Client(
+        timeout=orders.DEFAULT_TIMEOUT,
+        limits=transport.pool_limits(settings),
+        event_hooks=limiter.event_hooks(),
+    ) as client:
+        try:
+            options = replace(
+                options, markets=_resolve_markets(catalog.load_catalog(settings, client=client), options.markets)
+            )
+        except ValueError as exc:
+            _fail(parser, exc)
+            return
+        configs = prepare_market_configs(options)
+        _announce_markets(reporter, configs, options.concurrency)
+        outcomes = asyncio.run(
+            run_markets(
+                settings=settings,
+                configs=configs,
+                concurrency=options.concurrency,
+                sink=sink,
+                limit=limit,
+                limiter=limiter,
+            )
+        )
+        records = [summarize_outcome(outcome) for outcome in outcomes]
+        if options.confirm_fills is not None:
+            attach_fills(client=client, settings=settings, records=records, deadline=options.confirm_fills)
+    reporter.results("마켓별 주문 결과", records)
+    if limit is not None:
+        reporter.section("concurrency", "동시 요청 한도", limit.stats())
+    failed = sum(1 for outcome in outcomes if not outcome.ok)
+    if failed:
+        reporter.status(f"\n{len(outcomes)}개 마켓 중 {failed}개 실패")
+        sys.exit(1)
+
+
+def run_snapshot_markets(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    configs: Sequence[ExecutionConfig],
+    concurrency: int,
+    chance_cache: cache.ChanceCache | None = None,
+    info_store: catalog.MarketInfoStore | None = None,
+) -> list[engine.Outcome[str, CycleResult]]:
+    """계좌 조회 한 번으로 모든 마켓의 계획을 세운 뒤, 가능한 주문만 동시에 보낸다."""
+    from . import engine, planner
+
+    planned = planner.plan_markets(
         client=client,
         settings=settings,
-        market=plan.market,
-        amount=plan.amount,
-        side=plan.side,
-        dry_run=plan.dry_run,
+        configs=configs,
+        chance_cache=chance_cache,
+        concurrency=concurrency,
+        info_store=info_store,
+    )
+
+    def _place(plan: OrderPlan) -> CycleResult:
+        result = orders.place_market_order(
+            client=client,
+            settings=settings,
+            market=plan.market,
+            amount=plan.amount,
+            side=plan.side,
+            dry_run=plan.dry_run,
+            identifier=plan.identifier,
+        )
+        return plan, None, result
+
+    feasible = [outcome.value for outcome in planned if outcome.value is not None]
+    placed = {
+        outcome.key.market: outcome
+        for outcome in engine.stream_threaded(feasible, _place, concurrency=concurrency)
+    }
+    results: list[engine.Outcome[str, CycleResult]] = []
+    for outcome in planned:
+        if outcome.error is not None:
+            results.append(engine.Outcome(key=outcome.key, error=outcome.error))
+            continue
+        order = placed[outcome.key]
+        results.append(engine.Outcome(key=outcome.key, value=order.value, error=order.error))
+    return results
+
+
+def _run_snapshot_markets(
+    parser: argparse.ArgumentParser,
+    options: CliOptions,
+    settings: config.ApiSettings,
+    reporter: output.Reporter,
+) -> None:
+    import httpx
+    from . import catalog, ratelimit, transport
+
+    limiter = ratelimit.RateLimiter.from_settings(settings)
+    # 마켓 정보를 디스크에 남겨 두어 다음 실행부터는 계좌 조회 한 번으로 계획한다.
+    info_store = catalog.open_info_store(settings)
+    try:
+        with httpx.Client(
+            timeout=orders.DEFAULT_TIMEOUT,
+            limits=transport.pool_limits(settings, concurrency=options.concurrency),
+            event_hooks=limiter.event_hooks(),
+        ) as client:
+            options = replace(
+                options, markets=_resolve_markets(catalog.load_catalog(settings, client=client), options.markets)
+            )
+            configs = prepare_market_configs(options)
+            _announce_markets(reporter, configs, options.concurrency)
+            try:
+                outcomes = run_snapshot_markets(
+                    client=client,
+                    settings=settings,
+                    configs=configs,
+                    concurrency=options.concurrency,
+                    chance_cache=chance_cache_for(settings),
+                    info_store=info_store,
+                )
+            finally:
+                if info_store is not None:
+                    info_store.save()
+            records = [summarize_outcome(outcome) for outcome in outcomes]
+            if options.confirm_fills is not None:
+                attach_fills(client=client, settings=settings, records=records, deadline=options.confirm_fills)
+    except httpx.HTTPStatusError as exc:
+        # 계좌 조회 자체가 실패하면 어떤 마켓도 계획할 수 없다.
+        _handle_http_status_error(reporter, exc)
+        return
+    except httpx.HTTPError as exc:
+        _fail(parser, RuntimeError(f"네트워크 오류: {exc}"))
+        return
+    except ValueError as exc:
+        _fail(parser, exc)
+        return
+    reporter.results("마켓별 주문 결과", records)
+    failed = sum(1 for outcome in outcomes if not outcome.ok)
+    if failed:
+        reporter.status(f"\n{len(outcomes)}개 마켓 중 {failed}개 실패")
+        sys.exit(1)
+
+
+def run_plan(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    rows: Iterable[batch.PlanRow],
+    dry_run: bool,
+    concurrency: int,
+    sink: metrics.MetricsSink = metrics.NULL_SINK,
+    chance_cache: cache.ChanceCache | None = None,
+    market_catalog: catalog.MarketCatalog | None = None,
+    limit: engine.AdaptiveLimit | None = None,
+    order_journal: journal.Journal | None = None,
+) -> Iterator[engine.Outcome[batch.PlanRow, CycleResult]]:
+    from . import engine
+
+    def _cycle(row: batch.PlanRow) -> CycleResult:
+        if row.error is not None:
+            raise ValueError(row.error)
+        if market_catalog is not None:
+            market_catalog.check(row.market)
+        config = ExecutionConfig(market=row.market, side=row.side, dry_run=dry_run, amount=row.amount)
+        if order_journal is None:
+            return run_measured_cycle(
+                client=client, settings=settings, config=config, sink=sink, chance_cache=chance_cache
+            )
+
+        def _intent(plan: OrderPlan) -> None:
+            payload = orders.build_order_payload(
+                market=plan.market, amount=plan.amount, side=plan.side, identifier=plan.identifier
+            )
+            order_journal.record_intent(row.line, row.market, row.side, row.amount, payload)
+
+        try:
+            value = run_measured_cycle(
+                client=client,
+                settings=settings,
+                config=config,
+                sink=sink,
+                chance_cache=chance_cache,
+                before_order=_intent,
+            )
+        except Exception as exc:
+            order_journal.record_failure(row.line, row.market, row.side, row.amount, exc)
+            raise
+        order_journal.record_result(row.line, row.market, row.side, row.amount, dict(value[2]))
+        return value
+
+    return engine.stream_threaded(rows, _cycle, concurrency=concurrency, limit=limit)
+
+
+def resume_plan(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    order_journal: journal.Journal,
+    resume: bool,
+) -> dict[int, journal.Entry]:
+    """저널에서 완료된 행을 돌려준다.
+
+    결과 없이 의도만 남은 행은 거래소 주문 목록과 맞춰 본다. 식별자가 있는 행은
+    `identifiers[]`로 `orders.LIST_LIMIT`개씩 묶어 조회하고, 식별자가 없는 행이
+    있으면 가장 이른 의도 시각까지 주문 목록을 거슬러 올라가며 조회한다.
+    """
+    from . import journal
+
+    entries = order_journal.entries()
+    if entries and not resume:
+        raise ValueError(f"저널에 이미 {len(entries)}개 행이 기록되어 있습니다. 이어서 실행하려면 --resume을 쓰세요.")
+    ambiguous = [entry for entry in entries.values() if entry.state == journal.INTENT]
+    if ambiguous:
+        placed: dict[str, Mapping[str, Any]] = {}
+        identifiers = [entry.identifier for entry in ambiguous if entry.identifier]
+        for start in range(0, len(identifiers), orders.LIST_LIMIT):
+            chunk = identifiers[start : start + orders.LIST_LIMIT]
+            for order in orders.list_orders(client=client, settings=settings, identifiers=chunk, limit=len(chunk)):
+                placed[str(order.get("uuid"))] = order
+        unidentified = [entry.intent_at or 0.0 for entry in ambiguous if not entry.identifier]
+        if unidentified:
+            since = min(unidentified) - journal.DEFAULT_SKEW
+            for order in orders.list_orders_since(client=client, settings=settings, since=since):
+                placed.setdefault(str(order.get("uuid")), order)
+        matched = journal.reconcile(ambiguous, list(placed.values()))
+        for line, order in matched.items():
+            entry = entries[line]
+            order_journal.record_result(line, entry.market, entry.side, entry.amount, dict(order))
+            entries[line] = replace(entry, state=journal.DONE, result=dict(order))
+    return {line: entry for line, entry in entries.items() if entry.state == journal.DONE}
+
+
+def _pending_rows(
+    rows: Iterable[batch.PlanRow],
+    completed: Mapping[int, journal.Entry],
+    writer: batch.ResultWriter,
+) -> Iterator[batch.PlanRow]:
+    for row in rows:
+        entry = completed.get(row.line)
+        if entry is None:
+            yield row
+            continue
+        if (entry.market, entry.side) != (row.market, row.side):
+            raise ValueError(f"{row.line}번째 행이 저널 기록({entry.market} {entry.side})과 다릅니다.")
+        writer.write(
+            {"line": row.line, "side": row.side, "market": row.market, "ok": True, "resumed": True, "result": entry.result}
+        )
+
+
+def _run_plan(
+    parser: argparse.ArgumentParser,
+    options: CliOptions,
+    settings: config.ApiSettings,
+    sink: metrics.MetricsSink,
+) -> None:
+    import httpx
+    from . import batch, catalog, journal, ratelimit, transport
+
+    limiter = ratelimit.RateLimiter.from_settings(settings)
+    limit = adaptive_limit_for(options, sink)
+    print(
+        f"주문 계획 실행 중: {options.plan} (동시 요청 {options.concurrency}"
+        f"{f'~{limit.maximum}' if limit is not None else ''}, "
+        f"{'DRY-RUN' if options.dry_run else 'LIVE'})",
+        file=sys.stderr,
     )
-    account_snapshot = chance.get("bid_account") if plan.side == "bid" else chance.get("ask_account")
-    return plan, account_snapshot, result
+    order_journal: journal.Journal | None = None
+    try:
+        if options.journal:
+            order_journal = journal.Journal(options.journal, plan=options.plan or "")
+        with batch.open_results(options.plan_out) as writer, httpx.Client(
+            timeout=orders.DEFAULT_TIMEOUT,
+            limits=transport.pool_limits(settings, concurrency=limit.maximum if limit else options.concurrency),
+            event_hooks=limiter.event_hooks(),
+        ) as client:
+            rows: Iterable[batch.PlanRow] = batch.read_plan(options.plan, default_side=options.side)
+            if order_journal is not None:
+                completed = resume_plan(
+                    client=client, settings=settings, order_journal=order_journal, resume=options.resume
+                )
+                rows = _pending_rows(rows, completed, writer)
+            # 체결 확인은 배치 전체를 모아 한 번에 조회하므로 그동안 결과를 쥐고 있는다.
+            held: list[dict[str, Any]] | None = [] if options.confirm_fills is not None else None
+            for outcome in run_plan(
+                client=client,
+                settings=settings,
+                rows=rows,
+                dry_run=options.dry_run,
+                concurrency=options.concurrency,
+                sink=sink,
+                chance_cache=chance_cache_for(settings),
+                market_catalog=catalog.load_catalog(settings, client=client),
+                limit=limit,
+                order_journal=order_journal,
+            ):
+                if held is None:
+                    writer.write(_plan_record(outcome))
+                else:
+                    held.append(_plan_record(outcome))
+            if held is not None and options.confirm_fills is not None:
+                attach_fills(client=client, settings=settings, records=held, deadline=options.confirm_fills)
+                for record in held:
+                    writer.write(record)
+    except (OSError, ValueError) as exc:
+        _fail(parser, exc)
+        return
+    except httpx.HTTPError as exc:
+        _fail(parser, RuntimeError(f"주문 목록 확인 실패: {exc}"))
+        return
+    finally:
+        if order_journal is not None:
+            order_journal.close()
+            print(f"저널 기록 {order_journal.writes}건을 {order_journal.commits}번에 나눠 커밋했습니다.", file=sys.stderr)
+    print(f"주문 계획 {writer.written}건 중 {writer.failed}건 실패", file=sys.stderr)
+    coalesced = orders.CHANCE_FLIGHT.stats()["coalesced"]
+    if coalesced:
+        print(f"동시에 겹친 chance 조회 {coalesced}건을 합쳐 보냈습니다.", file=sys.stderr)
+    if limit is not None:
+        stats = limit.stats()
+        print(
+            f"동시 요청 한도: 최종 {stats['limit']}, 최대 {stats['peak']} (감소 {stats['cuts']}회)",
+            file=sys.stderr,
+        )
+    if writer.failed:
+        sys.exit(1)
+
+
+def _run_backtest(parser: argparse.ArgumentParser, options: CliOptions) -> None:
+    from . import batch
+
+    try:
+        from . import simulate
+    except ImportError:
+        _fail(parser, RuntimeError("--simulate에는 NumPy가 필요합니다. `pip install .[sim]`으로 설치하세요."))
+        return
+
+    print(f"주문 계획 백테스트 중: {options.plan} (호가 {options.simulate})", file=sys.stderr)
+    try:
+        simulator = simulate.Simulator.open(options.simulate or "")
+        with batch.open_results(options.plan_out) as writer:
+            rows = batch.read_plan(options.plan or "", default_side=options.side)
+            for outcome in simulate.run_backtest(rows, simulator):
+                writer.write(_plan_record(outcome))
+    except (OSError, ValueError) as exc:
+        _fail(parser, exc)
+        return
+    stats = simulator.stats()
+    print(f"주문 계획 {writer.written}건 중 {writer.failed}건 실패, {stats['filled']}건 체결", file=sys.stderr)
+    print(f"수수료: {stats['fees']}", file=sys.stderr)
+    print(f"최종 잔고: {stats['balances']}", file=sys.stderr)
+    if writer.failed:
+        sys.exit(1)
+
+
+def prepare_account_jobs(
+    options: CliOptions,
+    settings: config.ApiSettings,
+    account_list: Sequence[accounts.Account],
+    market_catalog: catalog.MarketCatalog | None = None,
+) -> list[accounts.AccountJob]:
+    from . import accounts
+
+    default_markets = options.markets or ((options.market or settings.default_market),)
+    jobs: list[accounts.AccountJob] = []
+    for account in account_list:
+        markets = account.markets or tuple(market for market in default_markets if market)
+        if not markets:
+            raise ValueError(f"계정 {account.name}: 주문할 마켓이 없습니다. markets 또는 --market을 지정하세요.")
+        try:
+            markets = _resolve_markets(market_catalog, markets)
+        except ValueError as exc:
+            raise ValueError(f"계정 {account.name}: {exc}") from exc
+        jobs.append(
+            accounts.AccountJob(
+                name=account.name,
+                settings=account.settings(settings),
+                markets=markets,
+                side=account.side or options.side,
+                dry_run=options.dry_run,
+                concurrency=options.concurrency,
+            )
+        )
+    return jobs
+
+
+def _run_accounts(
+    parser: argparse.ArgumentParser,
+    options: CliOptions,
+    sink: metrics.MetricsSink,
+    reporter: output.Reporter,
+) -> None:
+    import httpx
+    from . import accounts, catalog, ratelimit, transport
+
+    try:
+        settings = _load_settings(options, sink, require_credentials=False)
+        account_list = accounts.load_accounts(options.accounts)
+        # 계정별 작업자는 각자 연결 풀을 열므로 여기서는 마켓 목록만 받고 닫는다.
+        with httpx.Client(
+            timeout=orders.DEFAULT_TIMEOUT,
+            limits=transport.pool_limits(settings),
+            event_hooks=ratelimit.RateLimiter.from_settings(settings).event_hooks(),
+        ) as client:
+            market_catalog = catalog.load_catalog(settings, client=client)
+        jobs = prepare_account_jobs(options, settings, account_list, market_catalog)
+    except (OSError, ValueError) as exc:
+        _fail(parser, exc)
+        return
+    reporter.status("주문 준비 중...")
+    reporter.status(f"- 계정: {', '.join(job.name for job in jobs)}")
+    reporter.status(f"- 모드: {'DRY-RUN' if options.dry_run else 'LIVE'}")
+    records = [record for batch_records in accounts.fan_out(jobs) for record in batch_records]
+    records.sort(key=lambda record: (record["account_name"], record["market"]))
+    reporter.results("계정별 주문 결과", records)
+    failed = sum(1 for record in records if not record["ok"])
+    if failed:
+        reporter.status(f"\n{len(records)}건 중 {failed}건 실패")
+        sys.exit(1)
+
+
+def _load_settings(
+    options: CliOptions,
+    sink: metrics.MetricsSink,
+    *,
+    require_credentials: bool = True,
+) -> config.ApiSettings:
+    started = time.perf_counter()
+    settings = config.load_settings(options.dotenv, require_credentials=require_credentials)
+    sink.add_startup_phase("load_settings", time.perf_counter() - started)
+    return settings
 
 
 def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if args and args[0] in ("serve", "call"):
+        from . import daemon
+
+        (daemon.serve_main if args[0] == "serve" else daemon.call_main)(args[1:])
+        return
     parser, options = _parse_cli_options(argv)
     try:
-        settings = config.load_settings(options.dotenv)
+        sink = metrics.MetricsSink(jsonl_path=options.metrics_out, prom_path=options.metrics_prom)
+    except OSError as exc:
+        _fail(parser, exc)
+        return
+    reporter = output.build_reporter(options.output)
+    with sink:
+        try:
+            _run(parser, options, sink, reporter)
+        finally:
+            reporter.close()
+
+
+def _run(
+    parser: argparse.ArgumentParser,
+    options: CliOptions,
+    sink: metrics.MetricsSink,
+    reporter: output.Reporter,
+) -> None:
+    from . import catalog, ratelimit, transport
+
+    if options.accounts:
+        _run_accounts(parser, options, sink, reporter)
+        return
+    if options.simulate:
+        _run_backtest(parser, options)
+        return
+    if options.markets or options.plan:
+        try:
+            settings = _load_settings(options, sink)
+        except ValueError as exc:
+            _fail(parser, exc)
+            return
+        if options.plan:
+            _run_plan(parser, options, settings, sink)
+        elif options.single_snapshot:
+            _run_snapshot_markets(parser, options, settings, reporter)
+        else:
+            _run_markets(parser, options, settings, sink, reporter)
+        return
+
+    try:
+        settings = _load_settings(options, sink)
         exec_config = prepare_execution_config(options, settings)
     except ValueError as exc:
         _fail(parser, exc)
         return
 
-    _announce_execution(exec_config)
+    import httpx
 
+    stats = transport.TransportStats()
+    limiter = ratelimit.RateLimiter.from_settings(settings)
     try:
-        with httpx.Client(timeout=orders.DEFAULT_TIMEOUT) as client:
-            plan, account_snapshot, result = execute_trade_cycle(
+        with httpx.Client(
+            timeout=orders.DEFAULT_TIMEOUT,
+            limits=transport.pool_limits(settings),
+            event_hooks=transport.merge_hooks(limiter.event_hooks(), stats.event_hooks()),
+        ) as client:
+            exec_config = replace(
+                exec_config,
+                market=_resolve_single_market(catalog.load_catalog(settings, client=client), exec_config.market),
+            )
+            _announce_execution(reporter, exec_config)
+            if options.fire_at is not None:
+                _run_fire_at(
+                    client=client,
+                    settings=settings,
+                    config=exec_config,
+                    options=options,
+                    sink=sink,
+                    reporter=reporter,
+                )
+                return
+            if options.looping:
+                _run_loop(
+                    client=client,
+                    settings=settings,
+                    config=exec_config,
+                    options=options,
+                    stats=stats,
+                    sink=sink,
+                    reporter=reporter,
+                )
+                return
+            recorder = _cycle_recorder(sink, reporter)
+            value = run_measured_cycle(
                 client=client,
                 settings=settings,
                 config=exec_config,
+                sink=sink,
+                stats=stats,
+                recorder=recorder,
             )
+            record = cycle_output(exec_config, value, recorder)
+            if options.confirm_fills is not None:
+                attach_fills(client=client, settings=settings, records=[record], deadline=options.confirm_fills)
     except httpx.HTTPStatusError as exc:
-        _handle_http_status_error(exc)
+        _handle_http_status_error(reporter, exc)
     except httpx.HTTPError as exc:
         _fail(parser, RuntimeError(f"네트워크 오류: {exc}"))
     except ValueError as exc:
         _fail(parser, exc)
     else:
-        _summarize_plan(plan, account_snapshot)
-        _print("주문 결과", result)
+        reporter.cycle(record)
+
+
+def __getattr__(name: str) -> Any:
+    # httpx는 네트워크 경로에서만 필요하므로 `cli.httpx`로 처음 접근할 때 불러온다.
+    if name == "httpx":
+        import httpx
+
+        return httpx
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":  # pragma: no cover
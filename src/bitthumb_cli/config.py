@@ -5,7 +5,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 
 @dataclass(frozen=True)
@@ -15,18 +14,72 @@ class ApiSettings:
     secret_key: str
     default_market: str | None = None
     fallback_amount: float | None = None
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    query_rate_limit: float = 30.0
+    order_rate_limit: float = 8.0
+    chance_market_ttl: float = 300.0
+    chance_account_ttl: float = 10.0
+    retry_attempts: int = 3
+    hedge_percentile: float | None = None
+    market_cache_ttl: float = 86400.0
+    market_cache_path: str | None = None
 
 
-def _coerce_float(value: str | None) -> float | None:
+def _coerce_float(value: str | None, name: str = "BITTHUMB_FALLBACK_AMOUNT") -> float | None:
     if value in (None, ""):
         return None
     try:
         return float(value)
     except ValueError as exc:  # pragma: no cover - 입력 검증
-        raise ValueError("BITTHUMB_FALLBACK_AMOUNT 값이 숫자가 아닙니다.") from exc
+        raise ValueError(f"{name} 값이 숫자가 아닙니다.") from exc
 
 
-def load_settings(dotenv_path: str | os.PathLike[str] | None = None) -> ApiSettings:
+def _coerce_positive_int(value: str | None, name: str, default: int) -> int:
+    if value in (None, ""):
+        return default
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise ValueError(f"{name} 값이 정수가 아닙니다.") from exc
+    if number < 1:
+        raise ValueError(f"{name} 값은 1 이상이어야 합니다.")
+    return number
+
+
+def _coerce_positive_float(value: str | None, name: str, default: float) -> float:
+    number = _coerce_float(value, name)
+    if number is None:
+        return default
+    if number <= 0:
+        raise ValueError(f"{name} 값은 0보다 커야 합니다.")
+    return number
+
+
+def _coerce_non_negative_float(value: str | None, name: str, default: float) -> float:
+    number = _coerce_float(value, name)
+    if number is None:
+        return default
+    if number < 0:
+        raise ValueError(f"{name} 값은 0 이상이어야 합니다.")
+    return number
+
+
+def _coerce_percentile(value: str | None, name: str) -> float | None:
+    number = _coerce_float(value, name)
+    if number is not None and not 0 < number < 1:
+        raise ValueError(f"{name} 값은 0과 1 사이여야 합니다. (예: 0.95)")
+    return number
+
+
+def load_settings(
+    dotenv_path: str | os.PathLike[str] | None = None,
+    *,
+    require_credentials: bool = True,
+) -> ApiSettings:
+    from dotenv import load_dotenv
+
     if dotenv_path:
         load_dotenv(dotenv_path, override=True)
     else:
@@ -38,13 +91,42 @@ def load_settings(dotenv_path: str | os.PathLike[str] | None = None) -> ApiSetti
     access_key = os.getenv("BITTHUMB_ACCESS_KEY")
     secret_key = os.getenv("BITTHUMB_SECRET_KEY")
 
-    if not access_key or not secret_key:
+    if require_credentials and (not access_key or not secret_key):
         raise ValueError("BITTHUMB_ACCESS_KEY/SECRET_KEY 환경 변수가 필요합니다.")
 
     return ApiSettings(
         base_url=base_url,
-        access_key=access_key,
-        secret_key=secret_key,
+        access_key=access_key or "",
+        secret_key=secret_key or "",
         default_market=os.getenv("BITTHUMB_DEFAULT_MARKET"),
         fallback_amount=_coerce_float(os.getenv("BITTHUMB_FALLBACK_AMOUNT")),
+        max_connections=_coerce_positive_int(
+            os.getenv("BITTHUMB_MAX_CONNECTIONS"), "BITTHUMB_MAX_CONNECTIONS", ApiSettings.max_connections
+        ),
+        max_keepalive_connections=_coerce_positive_int(
+            os.getenv("BITTHUMB_MAX_KEEPALIVE"), "BITTHUMB_MAX_KEEPALIVE", ApiSettings.max_keepalive_connections
+        ),
+        keepalive_expiry=_coerce_non_negative_float(
+            os.getenv("BITTHUMB_KEEPALIVE_EXPIRY"), "BITTHUMB_KEEPALIVE_EXPIRY", ApiSettings.keepalive_expiry
+        ),
+        query_rate_limit=_coerce_positive_float(
+            os.getenv("BITTHUMB_QUERY_RPS"), "BITTHUMB_QUERY_RPS", ApiSettings.query_rate_limit
+        ),
+        order_rate_limit=_coerce_positive_float(
+            os.getenv("BITTHUMB_ORDER_RPS"), "BITTHUMB_ORDER_RPS", ApiSettings.order_rate_limit
+        ),
+        chance_market_ttl=_coerce_non_negative_float(
+            os.getenv("BITTHUMB_CHANCE_MARKET_TTL"), "BITTHUMB_CHANCE_MARKET_TTL", ApiSettings.chance_market_ttl
+        ),
+        chance_account_ttl=_coerce_non_negative_float(
+            os.getenv("BITTHUMB_CHANCE_ACCOUNT_TTL"), "BITTHUMB_CHANCE_ACCOUNT_TTL", ApiSettings.chance_account_ttl
+        ),
+        retry_attempts=_coerce_positive_int(
+            os.getenv("BITTHUMB_RETRY_ATTEMPTS"), "BITTHUMB_RETRY_ATTEMPTS", ApiSettings.retry_attempts
+        ),
+        hedge_percentile=_coerce_percentile(os.getenv("BITTHUMB_HEDGE_PERCENTILE"), "BITTHUMB_HEDGE_PERCENTILE"),
+        market_cache_ttl=_coerce_non_negative_float(
+            os.getenv("BITTHUMB_MARKET_CACHE_TTL"), "BITTHUMB_MARKET_CACHE_TTL", ApiSettings.market_cache_ttl
+        ),
+        market_cache_path=os.getenv("BITTHUMB_MARKET_CACHE") or None,
     )
@@ -0,0 +1,440 @@
+"""상주 실행 모드 (`bitthumb-cli serve`)와 로컬 호출 클라이언트 (`bitthumb-cli call`).
+
+설정, 서명기, 연결 풀을 메모리에 둔 채 Unix 도메인 소켓(또는 localhost TCP)으로
+주문 요청을 받는다. 요청과 응답은 한 줄에 JSON 객체 하나씩이며, 한 연결에서 여러
+요청을 보내면 끝나는 대로 한 줄씩 돌려준다.
+
+Unix 소켓은 파일 권한(0600)으로 접근을 막는다. TCP는 같은 호스트의 누구나 연결할
+수 있으므로 시작할 때 토큰 파일(0600)을 만들고, 모든 요청의 `token` 값이 이와
+같아야 처리한다.
+
+    {"market": "KRW-BTC", "side": "bid", "amount": 6000, "dry_run": true, "id": "t1"}
+    {"op": "ping"}
+    {"op": "stats"}
+"""
+
+from __future__ import annotations
+
+import argparse
+import hmac
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Mapping, Sequence
+
+from . import batch, catalog, cli, config, metrics, orders, ratelimit, transport
+
+DEFAULT_HEARTBEAT = 10.0
+_LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+def default_socket_path() -> str:
+    runtime = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime, "bitthumb-cli.sock")
+
+
+def default_token_path() -> str:
+    runtime = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime, "bitthumb-cli.token")
+
+
+def write_token(path: str) -> str:
+    """새 토큰을 만들어 소유자만 읽을 수 있는 파일에 쓴다."""
+    token = secrets.token_urlsafe(32)
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(token)
+    return token
+
+
+def read_token(path: str) -> str:
+    with open(path, encoding="utf-8") as handle:
+        token = handle.read().strip()
+    if not token:
+        raise ValueError(f"토큰 파일이 비어 있습니다: {path}")
+    return token
+
+
+def _dumps(payload: Mapping[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _parse_listen(raw: str) -> tuple[str, int]:
+    host, sep, port = raw.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError("--listen은 HOST:PORT 형식이어야 합니다. (예: 127.0.0.1:8766)")
+    host = host.strip("[]") or "127.0.0.1"
+    # 토큰은 평문 TCP로 오가므로 가로챌 수 있는 외부 주소에는 열지 않는다.
+    if host not in _LOOPBACK_HOSTS:
+        raise ValueError("--listen은 루프백 주소(127.0.0.1, ::1, localhost)만 사용할 수 있습니다.")
+    return host, int(port)
+
+
+class TradeService:
+    def __init__(
+        self,
+        settings: config.ApiSettings,
+        *,
+        concurrency: int = cli.DEFAULT_CONCURRENCY,
+        dry_run: bool = False,
+        sink: metrics.MetricsSink = metrics.NULL_SINK,
+        market_catalog: catalog.MarketCatalog | None = None,
+    ) -> None:
+        import httpx
+
+        self.settings = settings
+        self.market_catalog = market_catalog
+        self.dry_run = dry_run
+        self.sink = sink
+        self.stats = transport.TransportStats()
+        self.chance_cache = cli.chance_cache_for(settings)
+        limiter = ratelimit.RateLimiter.from_settings(settings)
+        self.client: httpx.Client = httpx.Client(
+            timeout=orders.DEFAULT_TIMEOUT,
+            limits=transport.pool_limits(settings, concurrency=concurrency),
+            event_hooks=transport.merge_hooks(limiter.event_hooks(), self.stats.event_hooks()),
+        )
+        self.started = time.monotonic()
+        self.cycles = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def warm(self, markets: Sequence[str]) -> None:
+        # chance 조회로 TLS 연결을 열어 두고 캐시도 채운다.
+        for market in markets:
+            chance = orders.fetch_order_chance(client=self.client, settings=self.settings, market=market)
+            if self.chance_cache is not None:
+                self.chance_cache.store(self.settings.access_key, market, chance)
+
+    def start_heartbeat(self, markets: Sequence[str], interval: float) -> threading.Thread | None:
+        # 유휴 연결이 keepalive_expiry로 닫히기 전에 주기적으로 다시 조회한다.
+        if not markets or interval <= 0:
+            return None
+
+        def _beat() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.warm(markets)
+                except Exception as exc:
+                    print(f"연결 유지 조회 실패: {exc}", file=sys.stderr)
+
+        thread = threading.Thread(target=_beat, name="bitthumb-heartbeat", daemon=True)
+        thread.start()
+        return thread
+
+    def handle(self, raw: Mapping[str, Any]) -> dict[str, Any]:
+        op = raw.get("op", "trade")
+        reply: dict[str, Any] = {"id": raw["id"]} if "id" in raw else {}
+        if op == "ping":
+            return {**reply, "ok": True, "op": "ping"}
+        if op == "stats":
+            with self._lock:
+                cycles = self.cycles
+            summary = self.stats.summary(cycles=cycles, elapsed=time.monotonic() - self.started)
+            if self.chance_cache is not None:
+                summary["chance_cache"] = self.chance_cache.stats()
+            summary["chance_flight"] = orders.CHANCE_FLIGHT.stats()
+            return {**reply, "ok": True, "op": "stats", **summary}
+        if op != "trade":
+            return {**reply, "ok": False, "error": f"알 수 없는 op입니다: {op}"}
+
+        dry_run = raw.get("dry_run", False)
+        # "false" 같은 문자열이 참으로 읽혀 조용히 DRY-RUN이 되지 않도록 bool만 받는다.
+        if not isinstance(dry_run, bool):
+            return {**reply, "ok": False, "error": "dry_run은 true 또는 false여야 합니다."}
+        try:
+            row = batch.parse_row(0, raw, "bid")
+            if self.market_catalog is not None:
+                self.market_catalog.check(row.market)
+        except ValueError as exc:
+            return {**reply, "ok": False, "error": str(exc)}
+        exec_config = cli.ExecutionConfig(
+            market=row.market,
+            side=row.side,
+            dry_run=self.dry_run or dry_run,
+            amount=row.amount,
+        )
+        recorder = metrics.Recorder()
+        try:
+            value = cli.run_measured_cycle(
+                client=self.client,
+                settings=self.settings,
+                config=exec_config,
+                sink=self.sink,
+                stats=self.stats,
+                chance_cache=self.chance_cache,
+                recorder=recorder,
+            )
+        except Exception as exc:
+            return {**reply, "market": row.market, "ok": False, **cli.describe_error(exc)}
+        finally:
+            with self._lock:
+                self.cycles += 1
+        return {**reply, **cli.cycle_output(exec_config, value, recorder)}
+
+    def close(self) -> None:
+        self._stop.set()
+        self.client.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _ServiceServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                raw = json.loads(text)
+            except json.JSONDecodeError:
+                response: dict[str, Any] = {"ok": False, "error": "JSON 형식이 아닙니다."}
+            else:
+                if not isinstance(raw, dict):
+                    response = {"ok": False, "error": "요청은 JSON 객체여야 합니다."}
+                elif not self.server.authorized(raw.pop("token", None)):
+                    response = {"ok": False, "error": "인증 토큰이 없거나 맞지 않습니다."}
+                else:
+                    response = self.server.service.handle(raw)
+            self.wfile.write(_dumps(response))
+
+
+class _ServiceServer(socketserver.ThreadingMixIn, socketserver.BaseServer):
+    daemon_threads = True
+    service: TradeService
+    label: str
+    token: str | None = None
+
+    def authorized(self, token: Any) -> bool:
+        if self.token is None:
+            return True
+        return isinstance(token, str) and hmac.compare_digest(token.encode("utf-8"), self.token.encode("utf-8"))
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="bitthumb-daemon",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class TcpServiceServer(_ServiceServer, socketserver.TCPServer):
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], service: TradeService, *, token: str) -> None:
+        if not token:
+            raise ValueError("TCP로 열려면 인증 토큰이 필요합니다.")
+        if ":" in address[0]:
+            self.address_family = socket.AF_INET6
+        socketserver.TCPServer.__init__(self, address, _Handler)
+        self.service = service
+        self.token = token
+        host, port = self.server_address[:2]
+        self.label = f"tcp://{host}:{port}"
+
+
+if hasattr(socket, "AF_UNIX"):
+
+    class UnixServiceServer(_ServiceServer, socketserver.UnixStreamServer):
+        def __init__(self, path: str, service: TradeService) -> None:
+            _remove_stale_socket(path)
+            # 소켓 파일은 소유자만 쓸 수 있어야 다른 사용자가 주문을 보낼 수 없다.
+            previous = os.umask(0o177)
+            try:
+                socketserver.UnixStreamServer.__init__(self, path, _Handler)
+            finally:
+                os.umask(previous)
+            self.service = service
+            self.label = f"unix://{path}"
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.server_address)
+            except FileNotFoundError:
+                pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise ValueError(f"이미 실행 중인 데몬이 있습니다: {path}")
+
+
+def build_server(
+    service: TradeService,
+    *,
+    socket_path: str | None = None,
+    listen: str | None = None,
+    token: str | None = None,
+) -> _ServiceServer:
+    if listen is not None:
+        if token is None:
+            raise ValueError("--listen으로 열려면 인증 토큰이 필요합니다.")
+        return TcpServiceServer(_parse_listen(listen), service, token=token)
+    if not hasattr(socket, "AF_UNIX"):
+        raise ValueError("이 플랫폼은 Unix 소켓을 지원하지 않습니다. --listen을 사용하세요.")
+    return UnixServiceServer(socket_path or default_socket_path(), service)
+
+
+def _connect(*, socket_path: str | None, listen: str | None, timeout: float) -> socket.socket:
+    if listen is not None:
+        return socket.create_connection(_parse_listen(listen), timeout=timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    sock.connect(socket_path or default_socket_path())
+    return sock
+
+
+def request(
+    payloads: Sequence[Mapping[str, Any]],
+    *,
+    socket_path: str | None = None,
+    listen: str | None = None,
+    token: str | None = None,
+    timeout: float = 30.0,
+) -> list[dict[str, Any]]:
+    if token is not None:
+        payloads = [{**payload, "token": token} for payload in payloads]
+    with _connect(socket_path=socket_path, listen=listen, timeout=timeout) as sock:
+        sock.sendall(b"".join(_dumps(payload) for payload in payloads))
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile("rb") as stream:
+            return [json.loads(line) for line in stream if line.strip()]
+
+
+def _add_address_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--socket", help=f"Unix 소켓 경로 (기본 {default_socket_path()})")
+    group.add_argument("--listen", help="Unix 소켓 대신 사용할 localhost TCP 주소 HOST:PORT")
+    parser.add_argument(
+        "--token-file",
+        default=default_token_path(),
+        help=f"--listen에서 쓰는 인증 토큰 파일 (기본 {default_token_path()})",
+    )
+
+
+def _build_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bitthumb-cli serve", description="빗썸 주문 상주 데몬")
+    _add_address_arguments(parser)
+    parser.add_argument("--dotenv", help="불러올 .env 파일 경로")
+    parser.add_argument("--dry-run", action="store_true", help="모든 요청을 DRY-RUN으로 처리")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=cli.DEFAULT_CONCURRENCY,
+        help=f"연결 풀 크기 하한 (기본 {cli.DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument("--warm", action="append", default=[], help="시작할 때 미리 조회할 마켓 (반복 가능)")
+    parser.add_argument(
+        "--heartbeat",
+        type=float,
+        default=DEFAULT_HEARTBEAT,
+        help=f"--warm 마켓을 다시 조회해 연결을 유지하는 주기(초, 0이면 끔, 기본 {DEFAULT_HEARTBEAT})",
+    )
+    return parser
+
+
+def serve_main(argv: list[str]) -> None:
+    import signal
+
+    parser = _build_serve_parser()
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다.")
+    try:
+        settings = config.load_settings(args.dotenv)
+    except ValueError as exc:
+        parser.error(str(exc))
+        return
+
+    service = TradeService(settings, concurrency=args.concurrency, dry_run=args.dry_run)
+    try:
+        # 마켓 목록도 주문과 같은 연결 풀과 요청 수 제한 훅으로 받는다.
+        service.market_catalog = catalog.load_catalog(settings, client=service.client)
+        # TCP는 시작할 때마다 새 토큰을 만들어 `call`이 같은 파일에서 읽게 한다.
+        token = write_token(args.token_file) if args.listen is not None else None
+        server = build_server(service, socket_path=args.socket, listen=args.listen, token=token)
+        service.warm(args.warm)
+    except Exception as exc:
+        service.close()
+        parser.error(str(exc))
+        return
+    service.start_heartbeat(args.warm, args.heartbeat)
+
+    def _interrupt(*_: object) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _interrupt)
+    print(
+        f"bitthumb-cli 데몬 실행 중: {server.label} ({'DRY-RUN' if args.dry_run else 'LIVE'})",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def _build_call_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bitthumb-cli call", description="실행 중인 데몬에 주문 요청")
+    _add_address_arguments(parser)
+    parser.add_argument("--market", help="주문할 마켓 (예: KRW-BTC)")
+    parser.add_argument("--side", choices=["bid", "ask"], default="bid")
+    parser.add_argument("--amount", type=float, help="주문 금액(매수) 또는 수량(매도)")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--op", choices=["trade", "ping", "stats"], default="trade")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    return parser
+
+
+def call_main(argv: list[str]) -> None:
+    parser = _build_call_parser()
+    args = parser.parse_args(argv)
+    payload: dict[str, Any] = {"op": args.op}
+    if args.op == "trade":
+        if not args.market:
+            parser.error("--market이 필요합니다.")
+        payload.update(market=args.market, side=args.side, dry_run=args.dry_run)
+        if args.amount is not None:
+            payload["amount"] = args.amount
+    try:
+        token = read_token(args.token_file) if args.listen is not None else None
+        responses = request(
+            [payload], socket_path=args.socket, listen=args.listen, token=token, timeout=args.timeout
+        )
+    except (OSError, ValueError) as exc:
+        parser.error(f"데몬에 연결할 수 없습니다: {exc}")
+        return
+    for response in responses:
+        sys.stdout.write(json.dumps(response, ensure_ascii=False, separators=(",", ":")) + "\n")
+    if not responses or not all(response.get("ok") for response in responses):
+        sys.exit(1)
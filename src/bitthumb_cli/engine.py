@@ -0,0 +1,209 @@
+"""동시 실행 엔진 (asyncio / 스레드 풀)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Outcome(Generic[K, T]):
+    key: K
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _ensure_concurrency(concurrency: int) -> int:
+    if concurrency < 1:
+        raise ValueError("동시 실행 수는 1 이상이어야 합니다.")
+    return concurrency
+
+
+def is_overload(exc: BaseException) -> bool:
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+class AdaptiveLimit:
+    """AIMD 방식으로 조절하는 동시 실행 한도.
+
+    작업 시간이 최근 최솟값의 `tolerance`배 안에 머무는 동안 한도 회차마다 1씩
+    늘리고, 429/5xx를 받으면 `decrease`배로 줄인다. 한 번 줄인 뒤에는 그 전에
+    시작한 작업의 실패로 다시 줄이지 않는다. 같은 과부하 신호가 동시에 여러 개
+    돌아오기 때문이다.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        maximum: int,
+        minimum: int = 1,
+        decrease: float = 0.5,
+        tolerance: float = 2.0,
+        window: int = 50,
+        on_change: Callable[[int], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("동시 실행 한도는 1 <= 최소 <= 시작 <= 최대여야 합니다.")
+        if not 0 < decrease < 1:
+            raise ValueError("감소 비율은 0과 1 사이여야 합니다.")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.tolerance = tolerance
+        self._limit = float(initial)
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._last_cut = float("-inf")
+        self._on_change = on_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.increases = 0
+        self.cuts = 0
+        self.peak = initial
+        if on_change is not None:
+            on_change(initial)
+
+    @property
+    def current(self) -> int:
+        return int(self._limit)
+
+    def started(self) -> float:
+        return self._clock()
+
+    def observe(self, started: float, error: BaseException | None = None) -> None:
+        now = self._clock()
+        with self._lock:
+            before = self.current
+            if error is not None:
+                if is_overload(error) and started >= self._last_cut:
+                    self._limit = max(float(self.minimum), self._limit * self.decrease)
+                    self._last_cut = now
+                    self.cuts += 1
+            else:
+                latency = now - started
+                self._latencies.append(latency)
+                if latency <= min(self._latencies) * self.tolerance:
+                    self._limit = min(float(self.maximum), self._limit + 1 / self._limit)
+            after = self.current
+            if after > before:
+                self.increases += 1
+                self.peak = max(self.peak, after)
+        if after != before and self._on_change is not None:
+            self._on_change(after)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "limit": self.current,
+                "peak": self.peak,
+                "maximum": self.maximum,
+                "increases": self.increases,
+                "cuts": self.cuts,
+            }
+
+
+async def run_bounded(
+    keys: Iterable[K],
+    worker: Callable[[K], Awaitable[T]],
+    *,
+    concurrency: int,
+    limit: AdaptiveLimit | None = None,
+) -> list[Outcome[K, T]]:
+    import asyncio
+
+    if limit is None:
+        semaphore = asyncio.Semaphore(_ensure_concurrency(concurrency))
+
+        async def _run(key: K) -> Outcome[K, T]:
+            async with semaphore:
+                try:
+                    value = await worker(key)
+                except Exception as exc:
+                    # 한 작업의 실패가 나머지 작업을 중단시키지 않도록 결과로 수집한다.
+                    return Outcome(key=key, error=exc)
+                return Outcome(key=key, value=value)
+
+        return list(await asyncio.gather(*(_run(key) for key in keys)))
+
+    adaptive = limit
+    gate = asyncio.Condition()
+    in_flight = 0
+
+    async def _run_adaptive(key: K) -> Outcome[K, T]:
+        nonlocal in_flight
+        async with gate:
+            await gate.wait_for(lambda: in_flight < adaptive.current)
+            in_flight += 1
+        started = adaptive.started()
+        try:
+            value = await worker(key)
+        except Exception as exc:
+            adaptive.observe(started, exc)
+            return Outcome(key=key, error=exc)
+        else:
+            adaptive.observe(started)
+            return Outcome(key=key, value=value)
+        finally:
+            async with gate:
+                in_flight -= 1
+                gate.notify_all()
+
+    return list(await asyncio.gather(*(_run_adaptive(key) for key in keys)))
+
+
+def stream_threaded(
+    items: Iterable[K],
+    worker: Callable[[K], T],
+    *,
+    concurrency: int,
+    limit: AdaptiveLimit | None = None,
+) -> Iterator[Outcome[K, T]]:
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+    iterator = iter(items)
+    pending: dict[Future[T], tuple[K, float]] = {}
+    width = limit.maximum if limit is not None else concurrency
+
+    with ThreadPoolExecutor(max_workers=_ensure_concurrency(width)) as pool:
+
+        def _fill() -> None:
+            # 입력은 필요한 만큼만 꺼내므로 대기 중인 작업 수가 한도를 넘지 않는다.
+            while len(pending) < (limit.current if limit is not None else concurrency):
+                for item in iterator:
+                    started = limit.started() if limit is not None else 0.0
+                    pending[pool.submit(worker, item)] = (item, started)
+                    break
+                else:
+                    return
+
+        _fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item, started = pending.pop(future)
+                error = future.exception()
+                if limit is not None:
+                    limit.observe(started, error)
+                if error is None:
+                    yield Outcome(key=item, value=future.result())
+                elif isinstance(error, Exception):
+                    yield Outcome(key=item, error=error)
+                else:
+                    raise error
+            _fill()
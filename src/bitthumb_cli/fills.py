@@ -0,0 +1,121 @@
+"""주문 뒤 체결 확인.
+
+한 회차나 배치에서 나간 주문들을 모아 `GET /v1/orders?uuids[]=...`로 한 번에
+조회한다. 아직 끝나지 않은 주문만 다음 조회에 남기고, 새로 끝난 주문이 없으면
+조회 간격을 두 배씩(최대 `max_interval`) 늘린다. 마감 시각까지 끝나지 않은 주문은
+마지막으로 본 상태를 그대로 돌려준다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from . import orders
+from .config import ApiSettings
+from .types import HttpClient
+
+# `uuids[]`로 한 번에 조회할 수 있는 주문 수
+BULK_LIMIT = orders.LIST_LIMIT
+TERMINAL_STATES = frozenset({"done", "cancel"})
+DEFAULT_DEADLINE = 10.0
+DEFAULT_INTERVAL = 0.1
+DEFAULT_MAX_INTERVAL = 2.0
+
+
+def _number(value: Any) -> float | None:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class Fill:
+    uuid: str
+    state: str
+    volume: float | None = None
+    funds: float | None = None
+    paid_fee: float | None = None
+
+    @property
+    def settled(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    @property
+    def avg_price(self) -> float | None:
+        if not self.volume or self.funds is None:
+            return None
+        return self.funds / self.volume
+
+    def as_record(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "volume": self.volume,
+            "funds": self.funds,
+            "avg_price": self.avg_price,
+            "paid_fee": self.paid_fee,
+        }
+
+
+def parse_fill(order: Mapping[str, Any]) -> Fill:
+    funds = _number(order.get("executed_funds"))
+    trades = order.get("trades")
+    if funds is None and isinstance(trades, list) and trades:
+        # 목록 응답에 체결 금액이 없으면 체결 내역의 금액을 더한다.
+        funds = sum(_number(trade.get("funds")) or 0.0 for trade in trades if isinstance(trade, Mapping))
+    return Fill(
+        uuid=str(order.get("uuid")),
+        state=str(order.get("state") or "unknown"),
+        volume=_number(order.get("executed_volume")),
+        funds=funds,
+        paid_fee=_number(order.get("paid_fee")),
+    )
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def confirm_fills(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    uuids: Iterable[str],
+    deadline: float = DEFAULT_DEADLINE,
+    interval: float = DEFAULT_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, Fill]:
+    """주문들이 끝날 때까지(`deadline`초) 묶어서 조회하고 uuid별 체결 결과를 돌려준다."""
+    pending = list(dict.fromkeys(uuids))
+    found: dict[str, Fill] = {uuid: Fill(uuid=uuid, state="unknown") for uuid in pending}
+    stop = clock() + deadline
+    delay = interval
+    while pending:
+        for chunk in _chunks(pending, BULK_LIMIT):
+            for order in orders.list_orders(
+                client=client,
+                settings=settings,
+                uuids=chunk,
+                states=("wait", "watch", "done", "cancel"),
+                limit=len(chunk),
+            ):
+                fill = parse_fill(order)
+                if fill.uuid in found:
+                    found[fill.uuid] = fill
+        remaining = [uuid for uuid in pending if not found[uuid].settled]
+        left = stop - clock()
+        if not remaining or left <= 0:
+            break
+        # 새로 끝난 주문이 있으면 곧 나머지도 끝날 가능성이 높으므로 간격을 처음으로 되돌린다.
+        if len(remaining) < len(pending):
+            delay = interval
+        pending = remaining
+        sleep(min(delay, left))
+        delay = min(delay * 2, max_interval)
+    return found
@@ -0,0 +1,43 @@
+"""정해진 벽시계 시각에 맞춰 깨어나는 대기 유틸."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+# 이 시간(초) 이내로 남으면 sleep 대신 바쁜 대기로 전환한다.
+DEFAULT_SPIN = 0.002
+# 긴 대기 중 시스템 시계 보정을 따라가도록 한 번에 자는 최대 시간
+_MAX_SLEEP = 1.0
+
+
+def wait_until(
+    target_ts: float,
+    *,
+    spin: float = DEFAULT_SPIN,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> float:
+    while True:
+        now = clock()
+        remaining = target_ts - now
+        if remaining <= 0:
+            return now
+        if remaining > spin:
+            sleep(min(remaining - spin, _MAX_SLEEP))
+
+
+def isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="microseconds")
+
+
+def timing_report(*, target_ts: float, armed_at: float, sent_at: float, done_at: float) -> dict[str, object]:
+    return {
+        "target": isoformat(target_ts),
+        "armed_at": isoformat(armed_at),
+        "sent_at": isoformat(sent_at),
+        "armed_lead_ms": round((target_ts - armed_at) * 1000, 3),
+        "send_delay_ms": round((sent_at - target_ts) * 1000, 3),
+        "response_ms": round((done_at - sent_at) * 1000, 3),
+    }
@@ -0,0 +1,246 @@
+"""`--plan` 실행의 주문 저널 (SQLite WAL).
+
+주문을 보내기 전에 의도(intent)를 디스크에 남기고, 응답을 받으면 결과를 남긴다.
+실행이 중간에 죽어도 어떤 행의 주문이 나갔는지 알 수 있으므로 `--resume`으로
+끝난 행은 건너뛰고, 의도만 있고 결과가 없는 행은 주문 목록 조회 한 번으로
+확인한다.
+
+쓰기는 전용 스레드가 모아서 한 트랜잭션으로 커밋한다(group commit). 의도 기록은
+커밋될 때까지 기다려야 하지만, 동시에 들어온 의도들이 fsync 한 번을 나눠 쓴다.
+결과 기록은 기다리지 않는다. 결과가 유실되면 그 행은 다음 재개 때 확인 대상이 된다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .orders import created_at, is_ambiguous
+
+INTENT = "intent"
+DONE = "done"
+FAILED = "failed"
+# 의도 기록 시각과 거래소 `created_at` 사이에 허용하는 시계 오차(초)
+DEFAULT_SKEW = 5.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS entries ("
+    " line INTEGER PRIMARY KEY,"
+    " market TEXT NOT NULL,"
+    " side TEXT NOT NULL,"
+    " amount REAL,"
+    " state TEXT NOT NULL,"
+    " payload TEXT,"
+    " intent_at REAL,"
+    " result TEXT,"
+    " updated_at REAL NOT NULL"
+    ")",
+)
+_UPSERT = (
+    "INSERT INTO entries (line, market, side, amount, state, payload, intent_at, result, updated_at)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    " ON CONFLICT(line) DO UPDATE SET"
+    " market = excluded.market, side = excluded.side, amount = excluded.amount, state = excluded.state,"
+    " payload = COALESCE(excluded.payload, entries.payload),"
+    " intent_at = COALESCE(excluded.intent_at, entries.intent_at),"
+    " result = excluded.result, updated_at = excluded.updated_at"
+)
+
+
+@dataclass(frozen=True)
+class Entry:
+    line: int
+    market: str
+    side: str
+    amount: float | None
+    state: str
+    payload: dict[str, Any] | None = None
+    intent_at: float | None = None
+    result: Any = None
+
+    @property
+    def identifier(self) -> str | None:
+        return (self.payload or {}).get("identifier")
+
+
+class _Pending:
+    __slots__ = ("params", "done", "error")
+
+    def __init__(self, params: tuple[Any, ...], wait: bool) -> None:
+        self.params = params
+        self.done = threading.Event() if wait else None
+        self.error: BaseException | None = None
+
+
+class Journal:
+    def __init__(self, path: str | os.PathLike[str], *, plan: str | os.PathLike[str]) -> None:
+        import sqlite3
+
+        self._db = sqlite3.connect(os.fspath(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # 의도 기록은 커밋이 디스크에 닿은 뒤에만 주문을 보내야 하므로 FULL로 둔다.
+        self._db.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._bind_plan(os.path.abspath(plan))
+        self._queue: list[_Pending] = []
+        self._cond = threading.Condition()
+        self._closing = False
+        self._intents: set[int] = set()
+        self.writes = 0
+        self.commits = 0
+        self._thread = threading.Thread(target=self._writer, name="bitthumb-journal", daemon=True)
+        self._thread.start()
+
+    def _bind_plan(self, plan: str) -> None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'plan'").fetchone()
+        if row is None:
+            self._db.execute("INSERT INTO meta (key, value) VALUES ('plan', ?)", (plan,))
+        elif row[0] != plan:
+            self._db.close()
+            raise ValueError(f"저널이 다른 주문 계획 파일({row[0]})에 연결되어 있습니다.")
+
+    def entries(self) -> dict[int, Entry]:
+        rows = self._db.execute(
+            "SELECT line, market, side, amount, state, payload, intent_at, result FROM entries"
+        ).fetchall()
+        return {
+            line: Entry(
+                line=line,
+                market=market,
+                side=side,
+                amount=amount,
+                state=state,
+                payload=json.loads(payload) if payload else None,
+                intent_at=intent_at,
+                result=json.loads(result) if result else None,
+            )
+            for line, market, side, amount, state, payload, intent_at, result in rows
+        }
+
+    def _submit(self, params: tuple[Any, ...], *, wait: bool) -> None:
+        pending = _Pending(params, wait)
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("저널이 이미 닫혔습니다.")
+            self._queue.append(pending)
+            self._cond.notify()
+        if pending.done is not None:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+
+    def record_intent(self, line: int, market: str, side: str, amount: float | None, payload: Mapping[str, Any]) -> None:
+        """주문을 보내기 직전에 호출한다. 기록이 디스크에 닿을 때까지 돌아오지 않는다."""
+        now = time.time()
+        self._submit(
+            (line, market, side, amount, INTENT, json.dumps(dict(payload), ensure_ascii=False), now, None, now),
+            wait=True,
+        )
+        with self._cond:
+            self._intents.add(line)
+
+    def record_result(self, line: int, market: str, side: str, amount: float | None, result: Any) -> None:
+        self._submit(
+            (line, market, side, amount, DONE, None, None, json.dumps(result, ensure_ascii=False), time.time()),
+            wait=False,
+        )
+
+    def record_failure(self, line: int, market: str, side: str, amount: float | None, exc: BaseException) -> None:
+        # 의도를 남긴 뒤 결과를 알 수 없게 실패했으면 의도 상태를 그대로 둬 재개 때 확인한다.
+        with self._cond:
+            sent = line in self._intents
+        if sent and is_ambiguous(exc):
+            return
+        error = json.dumps({"error": str(exc) or type(exc).__name__}, ensure_ascii=False)
+        self._submit((line, market, side, amount, FAILED, None, None, error, time.time()), wait=False)
+
+    def _writer(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closing:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                batch, self._queue = self._queue, []
+            error: BaseException | None = None
+            try:
+                self._db.execute("BEGIN")
+                self._db.executemany(_UPSERT, [pending.params for pending in batch])
+                self._db.execute("COMMIT")
+            except BaseException as exc:  # pragma: no cover - 디스크 오류
+                error = exc
+                if self._db.in_transaction:
+                    self._db.execute("ROLLBACK")
+            self.writes += len(batch)
+            self.commits += 1
+            for pending in batch:
+                pending.error = error
+                if pending.done is not None:
+                    pending.done.set()
+
+    def stats(self) -> dict[str, int]:
+        return {"writes": self.writes, "commits": self.commits}
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify()
+        self._thread.join()
+        self._db.close()
+
+    def __enter__(self) -> Journal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _matches(entry: Entry, order: Mapping[str, Any]) -> bool:
+    if entry.identifier is not None:
+        return order.get("identifier") == entry.identifier
+    payload = entry.payload or {}
+    if any(str(order.get(key)) != str(value) for key, value in payload.items() if key in ("market", "side", "ord_type")):
+        return False
+    for field in ("price", "volume"):
+        if field in payload:
+            try:
+                if float(order.get(field) or 0) != float(payload[field]):
+                    return False
+            except (TypeError, ValueError):
+                return False
+    return True
+
+
+def reconcile(
+    ambiguous: Sequence[Entry],
+    placed: Iterable[Mapping[str, Any]],
+    *,
+    skew: float = DEFAULT_SKEW,
+) -> dict[int, Mapping[str, Any]]:
+    """결과가 없는 의도를 거래소 주문 목록과 맞춰 본다.
+
+    클라이언트 식별자가 있는 의도는 같은 식별자의 주문과만 짝짓는다. 식별자가
+    없으면 같은 마켓·방향·유형·금액이고 의도를 남긴 뒤(`skew`초 시계 오차 허용)
+    생성된 주문을 먼저 남긴 의도부터 하나씩 짝짓는다. 짝이 없는 행은 주문이
+    나가지 않은 것으로 본다.
+    """
+    remaining = list(placed)
+    matched: dict[int, Mapping[str, Any]] = {}
+    for entry in sorted(ambiguous, key=lambda item: item.intent_at or 0.0):
+        for index, order in enumerate(remaining):
+            created = created_at(order)
+            if created is not None and entry.intent_at is not None and created + skew < entry.intent_at:
+                continue
+            if _matches(entry, order):
+                matched[entry.line] = remaining.pop(index)
+                break
+    return matched
@@ -0,0 +1,223 @@
+"""단계별 지연 계측과 JSON Lines/Prometheus textfile 출력.
+
+계측이 꺼져 있으면 `NULL_RECORDER`가 미리 만든 빈 컨텍스트를 돌려주므로
+타이머 호출 비용이 사실상 없다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Mapping
+
+# 단계 이름. sign/connect는 chance/order 구간과 겹칠 수 있다.
+PHASES = ("load_settings", "sign", "connect", "chance", "plan", "order", "cycle")
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class _Phase:
+    __slots__ = ("_name", "_recorder", "_started")
+
+    def __init__(self, recorder: Recorder, name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._recorder.add(self._name, time.perf_counter() - self._started)
+
+
+class Recorder:
+    enabled = True
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        # 헤징된 조회는 작업 스레드 두 곳에서 같은 기록기에 sign 구간을 더한다.
+        self._lock = threading.Lock()
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _NullRecorder:
+    __slots__ = ()
+    enabled = False
+    phases: Mapping[str, float] = {}
+
+    def phase(self, name: str) -> _NullPhase:
+        return _NULL_PHASE
+
+    def add(self, name: str, seconds: float) -> None:
+        return None
+
+
+NULL_RECORDER: Recorder = _NullRecorder()  # type: ignore[assignment]
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[int]:
+        running = 0
+        result: list[int] = []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+def _format_le(bound: float) -> str:
+    return repr(float(bound))
+
+
+class MetricsSink:
+    def __init__(
+        self,
+        *,
+        jsonl_path: str | os.PathLike[str] | None = None,
+        prom_path: str | os.PathLike[str] | None = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self._jsonl = open(jsonl_path, "a", encoding="utf-8") if jsonl_path else None
+        self._prom_path = Path(prom_path) if prom_path else None
+        self._buckets = buckets
+        self._histograms: dict[str, Histogram] = {}
+        self._results = {"ok": 0, "error": 0}
+        self._gauges: dict[str, float] = {}
+        self._pending: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._jsonl is not None or self._prom_path is not None
+
+    def recorder(self) -> Recorder:
+        return Recorder() if self.enabled else NULL_RECORDER
+
+    def add_startup_phase(self, name: str, seconds: float) -> None:
+        # 실행당 한 번 측정되는 구간은 첫 번째 회차 기록에 합친다.
+        if self.enabled:
+            with self._lock:
+                self._pending[name] = seconds
+
+    def set_gauge(self, name: str, value: float) -> None:
+        if self.enabled:
+            with self._lock:
+                self._gauges[name] = value
+
+    def record_cycle(
+        self,
+        recorder: Recorder,
+        *,
+        market: str,
+        side: str,
+        dry_run: bool,
+        error: Mapping[str, Any] | None = None,
+        **fields: Any,
+    ) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            phases = {**self._pending, **recorder.phases}
+            self._pending.clear()
+            for name, seconds in phases.items():
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = self._histograms[name] = Histogram(self._buckets)
+                histogram.observe(seconds)
+            self._results["error" if error else "ok"] += 1
+            if self._jsonl is not None:
+                record: dict[str, Any] = {
+                    "ts": datetime.now(timezone.utc).isoformat(),
+                    "market": market,
+                    "side": side,
+                    "dry_run": dry_run,
+                    "ok": error is None,
+                    "phases": {name: round(seconds, 6) for name, seconds in phases.items()},
+                    **fields,
+                }
+                if error is not None:
+                    record["error"] = dict(error)
+                self._jsonl.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP bitthumb_phase_seconds Per-phase latency of bitthumb-cli trade cycles.",
+            "# TYPE bitthumb_phase_seconds histogram",
+        ]
+        ordered = [name for name in PHASES if name in self._histograms]
+        ordered += sorted(name for name in self._histograms if name not in PHASES)
+        for name in ordered:
+            histogram = self._histograms[name]
+            for bound, count in zip(histogram.buckets, histogram.cumulative()):
+                lines.append(f'bitthumb_phase_seconds_bucket{{phase="{name}",le="{_format_le(bound)}"}} {count}')
+            lines.append(f'bitthumb_phase_seconds_bucket{{phase="{name}",le="+Inf"}} {histogram.count}')
+            lines.append(f'bitthumb_phase_seconds_sum{{phase="{name}"}} {histogram.total!r}')
+            lines.append(f'bitthumb_phase_seconds_count{{phase="{name}"}} {histogram.count}')
+        lines.append("# HELP bitthumb_cycles_total Trade cycles by result.")
+        lines.append("# TYPE bitthumb_cycles_total counter")
+        for result, count in self._results.items():
+            lines.append(f'bitthumb_cycles_total{{result="{result}"}} {count}')
+        for name, value in sorted(self._gauges.items()):
+            lines.append(f"# TYPE bitthumb_{name} gauge")
+            lines.append(f"bitthumb_{name} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+            if self._prom_path is not None:
+                # node_exporter가 쓰다 만 파일을 읽지 않도록 임시 파일을 만든 뒤 교체한다.
+                temp = self._prom_path.with_name(f".{self._prom_path.name}.{os.getpid()}.tmp")
+                temp.write_text(self.render_prometheus(), encoding="utf-8")
+                os.replace(temp, self._prom_path)
+                self._prom_path = None
+
+    def __enter__(self) -> MetricsSink:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+NULL_SINK = MetricsSink()
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Mapping, TypedDict
+from functools import lru_cache
+from typing import Any, Mapping, Sequence, TypedDict
 
-from . import auth
+from . import auth, metrics, retry, singleflight
+from .chance import decode_response
 from .config import ApiSettings
-from .types import HttpClient, Side, ensure_side
+from .types import AsyncHttpClient, HttpClient, Side, ensure_side
 
 DEFAULT_TIMEOUT = 5
+# 주문 목록 조회 한 번에 거래소가 돌려주는 최대 개수(`limit`, `uuids[]`, `identifiers[]`)
+LIST_LIMIT = 100
+
+# 같은 계정·마켓의 chance 조회가 동시에 겹치면 요청 하나로 합친다.
+CHANCE_FLIGHT = singleflight.SingleFlight()
 
 
 class OrderPayload(TypedDict, total=False):
@@ -18,6 +29,14 @@ class OrderPayload(TypedDict, total=False):
     ord_type: str
     price: str
     volume: str
+    identifier: str
+
+
+@dataclass(frozen=True)
+class PreparedOrder:
+    url: str
+    payload: OrderPayload
+    body: bytes
 
 
 def _format_decimal(value: float | int | str) -> str:
@@ -36,12 +55,21 @@ def _format_decimal(value: float | int | str) -> str:
     return text
 
 
-def _headers(settings: ApiSettings, params: Mapping[str, Any] | None) -> dict[str, str]:
-    token = auth.generate_jwt(
-        access_key=settings.access_key,
-        secret_key=settings.secret_key,
-        params=params,
+@lru_cache(maxsize=32)
+def _signer(access_key: str, secret_key: str) -> auth.Signer:
+    return auth.Signer(access_key=access_key, secret_key=secret_key)
+
+
+@lru_cache(maxsize=32)
+def _retrier(settings: ApiSettings) -> retry.Retrier:
+    # 헤징 백분위에 쓰는 지연 표본은 같은 설정으로 실행되는 동안 계속 쌓인다.
+    return retry.Retrier(
+        retry.RetryPolicy(attempts=settings.retry_attempts, hedge_percentile=settings.hedge_percentile)
     )
+
+
+def _headers(settings: ApiSettings, params: Mapping[str, Any] | None) -> dict[str, str]:
+    token = _signer(settings.access_key, settings.secret_key).sign(params)
     return {"Authorization": f"Bearer {token}"}
 
 
@@ -52,21 +80,321 @@ def _build_url(base_url: str, path: str, params: Mapping[str, Any] | None) -> st
     return f"{base_url}{path}?{query}"
 
 
+def _flight_key(settings: ApiSettings, market: str) -> tuple[str, str, str]:
+    return settings.base_url, settings.access_key, market
+
+
+def _chance_request(settings: ApiSettings, market: str) -> tuple[str, dict[str, str]]:
+    params = {"market": market}
+    return _build_url(settings.base_url, "/v1/orders/chance", params), _headers(settings, params)
+
+
+def new_identifier() -> str:
+    """주문마다 새로 만드는 클라이언트 주문 식별자."""
+    return uuid.uuid4().hex
+
+
+def build_order_payload(
+    *,
+    market: str,
+    amount: float,
+    side: Side | str,
+    identifier: str | None = None,
+) -> OrderPayload:
+    side_value = ensure_side(side)
+
+    payload: OrderPayload = {
+        "market": market,
+        "side": side_value,
+    }
+    if side_value == "bid":
+        payload["ord_type"] = "price"
+        payload["price"] = _format_decimal(amount)
+    else:
+        payload["ord_type"] = "market"
+        payload["volume"] = _format_decimal(amount)
+    if identifier is not None:
+        payload["identifier"] = identifier
+    return payload
+
+
 def fetch_order_chance(
     *,
     client: HttpClient,
     settings: ApiSettings,
     market: str,
     timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    retrier: retry.Retrier | None = None,
 ) -> dict[str, Any]:
-    params = {"market": market}
-    response = client.get(
-        _build_url(settings.base_url, "/v1/orders/chance", params),
-        headers=_headers(settings, params),
-        timeout=timeout,
-    )
+    """`timeout`은 시도마다 적용되며 재시도와 헤징 요청은 매번 새 nonce로 서명한다.
+
+    같은 계정·마켓으로 진행 중인 조회가 있으면 새로 보내지 않고 그 결과를 함께 받는다.
+    """
+
+    def _send() -> dict[str, Any]:
+        with recorder.phase("sign"):
+            url, headers = _chance_request(settings, market)
+        response = client.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return decode_response(response)
+
+    with recorder.phase("chance"):
+        return CHANCE_FLIGHT.do(
+            _flight_key(settings, market),
+            lambda: (retrier or _retrier(settings)).call(_send),
+        )
+
+
+async def fetch_order_chance_async(
+    *,
+    client: AsyncHttpClient,
+    settings: ApiSettings,
+    market: str,
+    timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, Any]:
+    async def _send() -> dict[str, Any]:
+        with recorder.phase("sign"):
+            url, headers = _chance_request(settings, market)
+        response = await client.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return decode_response(response)
+
+    with recorder.phase("chance"):
+        return await CHANCE_FLIGHT.do_async(
+            _flight_key(settings, market),
+            lambda: (retrier or _retrier(settings)).call_async(_send),
+        )
+
+
+def _ticker_url(settings: ApiSettings, markets: Sequence[str]) -> str:
+    return _build_url(settings.base_url, "/v1/ticker", {"markets": ",".join(markets)})
+
+
+def parse_ticker_prices(payload: Any) -> dict[str, float]:
+    """`/v1/ticker` 응답에서 마켓별 최근 체결가(`trade_price`)를 읽는다."""
+    if not isinstance(payload, list):
+        raise ValueError("ticker 응답 형식이 올바르지 않습니다.")
+    prices: dict[str, float] = {}
+    for item in payload:
+        if not isinstance(item, dict) or not isinstance(item.get("market"), str):
+            raise ValueError("ticker 응답 형식이 올바르지 않습니다.")
+        try:
+            prices[item["market"]] = float(item["trade_price"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"ticker 응답의 {item['market']} 현재가가 숫자가 아닙니다.") from exc
+    return prices
+
+
+def fetch_ticker_prices(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    markets: Sequence[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, float]:
+    """여러 마켓의 현재가를 한 번에 조회한다. 공개 API라 서명하지 않는다.
+
+    chance의 ask `min_total`은 KRW 금액이므로 매도 수량으로 환산할 때 쓴다.
+    """
+
+    def _send() -> dict[str, float]:
+        response = client.get(_ticker_url(settings, markets), timeout=timeout)
+        response.raise_for_status()
+        return parse_ticker_prices(decode_response(response))
+
+    with recorder.phase("ticker"):
+        return (retrier or _retrier(settings)).call(_send)
+
+
+async def fetch_ticker_prices_async(
+    *,
+    client: AsyncHttpClient,
+    settings: ApiSettings,
+    markets: Sequence[str],
+    timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, float]:
+    async def _send() -> dict[str, float]:
+        response = await client.get(_ticker_url(settings, markets), timeout=timeout)
+        response.raise_for_status()
+        return parse_ticker_prices(decode_response(response))
+
+    with recorder.phase("ticker"):
+        return await (retrier or _retrier(settings)).call_async(_send)
+
+
+def fetch_accounts(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    retrier: retry.Retrier | None = None,
+) -> list[dict[str, Any]]:
+    """전체 계좌 잔고(`/v1/accounts`)를 조회한다. 파라미터가 없어 query_hash 없이 서명한다."""
+
+    def _send() -> list[dict[str, Any]]:
+        with recorder.phase("sign"):
+            headers = _headers(settings, None)
+        response = client.get(f"{settings.base_url}/v1/accounts", headers=headers, timeout=timeout)
+        response.raise_for_status()
+        return decode_response(response)
+
+    with recorder.phase("accounts"):
+        return (retrier or _retrier(settings)).call(_send)
+
+
+def list_orders(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    market: str | None = None,
+    states: tuple[str, ...] = ("wait", "done", "cancel"),
+    uuids: Sequence[str] = (),
+    identifiers: Sequence[str] = (),
+    limit: int = LIST_LIMIT,
+    page: int = 1,
+    timeout: int = DEFAULT_TIMEOUT,
+    retrier: retry.Retrier | None = None,
+) -> list[dict[str, Any]]:
+    """주문 목록(`GET /v1/orders`)을 최신순으로 조회한다. 한 번에 `LIST_LIMIT`개까지 받는다."""
+    if not 1 <= limit <= LIST_LIMIT:
+        raise ValueError(f"limit은 1 이상 {LIST_LIMIT} 이하여야 합니다.")
+    params: dict[str, Any] = {"market": market, "states": list(states), "limit": limit, "order_by": "desc"}
+    if page != 1:
+        params["page"] = page
+    if uuids:
+        params["uuids"] = list(uuids)
+    if identifiers:
+        params["identifiers"] = list(identifiers)
+
+    def _send() -> list[dict[str, Any]]:
+        response = client.get(
+            _build_url(settings.base_url, "/v1/orders", params),
+            headers=_headers(settings, params),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return decode_response(response)
+
+    return (retrier or _retrier(settings)).call(_send)
+
+
+def list_orders_since(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    since: float,
+    states: tuple[str, ...] = ("wait", "done", "cancel"),
+    timeout: int = DEFAULT_TIMEOUT,
+    retrier: retry.Retrier | None = None,
+) -> list[dict[str, Any]]:
+    """`since`(epoch 초) 이후 생성된 주문이 모두 나올 때까지 페이지를 넘기며 조회한다."""
+    found: list[dict[str, Any]] = []
+    page = 1
+    while True:
+        chunk = list_orders(
+            client=client,
+            settings=settings,
+            states=states,
+            limit=LIST_LIMIT,
+            page=page,
+            timeout=timeout,
+            retrier=retrier,
+        )
+        found.extend(chunk)
+        # 최신순이므로 페이지의 마지막 주문이 `since`보다 오래됐으면 더 볼 필요가 없다.
+        oldest = created_at(chunk[-1]) if chunk else None
+        if len(chunk) < LIST_LIMIT or oldest is None or oldest < since:
+            return found
+        page += 1
+
+
+def _order_request(
+    settings: ApiSettings,
+    *,
+    order_uuid: str | None,
+    identifier: str | None,
+) -> tuple[str, dict[str, str]]:
+    if (order_uuid is None) == (identifier is None):
+        raise ValueError("uuid와 identifier 중 하나만 지정해야 합니다.")
+    params = {"uuid": order_uuid} if order_uuid is not None else {"identifier": identifier}
+    return _build_url(settings.base_url, "/v1/order", params), _headers(settings, params)
+
+
+def _found_order(response: Any) -> dict[str, Any] | None:
+    if response.status_code == 404:
+        return None
     response.raise_for_status()
-    return response.json()
+    return decode_response(response)
+
+
+def fetch_order(
+    *,
+    client: HttpClient,
+    settings: ApiSettings,
+    order_uuid: str | None = None,
+    identifier: str | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, Any] | None:
+    """개별 주문(`GET /v1/order`)을 uuid나 클라이언트 식별자로 조회한다. 없으면 None."""
+
+    def _send() -> dict[str, Any] | None:
+        url, headers = _order_request(settings, order_uuid=order_uuid, identifier=identifier)
+        return _found_order(client.get(url, headers=headers, timeout=timeout))
+
+    return (retrier or _retrier(settings)).call(_send)
+
+
+async def fetch_order_async(
+    *,
+    client: AsyncHttpClient,
+    settings: ApiSettings,
+    order_uuid: str | None = None,
+    identifier: str | None = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, Any] | None:
+    async def _send() -> dict[str, Any] | None:
+        url, headers = _order_request(settings, order_uuid=order_uuid, identifier=identifier)
+        return _found_order(await client.get(url, headers=headers, timeout=timeout))
+
+    return await (retrier or _retrier(settings)).call_async(_send)
+
+
+def is_ambiguous(exc: BaseException) -> bool:
+    """주문 요청이 거래소에 닿았는지 알 수 없는 실패인지 판단한다."""
+    import httpx
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        # 연결 자체를 맺지 못했으면 요청은 나가지 않았다.
+        return False
+    return isinstance(exc, httpx.TransportError)
+
+
+def created_at(order: Mapping[str, Any]) -> float | None:
+    """주문의 `created_at`을 epoch 초로 바꾼다. 읽을 수 없으면 None."""
+    try:
+        return datetime.fromisoformat(str(order.get("created_at"))).timestamp()
+    except ValueError:
+        return None
+
+
+def _is_rejected(exc: BaseException) -> bool:
+    import httpx
+
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    return 400 <= exc.response.status_code < 500 and exc.response.status_code != 429
 
 
 def place_market_order(
@@ -78,28 +406,147 @@ def place_market_order(
     side: Side | str,
     dry_run: bool,
     timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    identifier: str | None = None,
+    retrier: retry.Retrier | None = None,
 ) -> dict[str, Any]:
-    side_value = ensure_side(side)
+    """시장가 주문을 보낸다.
 
-    payload: OrderPayload = {
-        "market": market,
-        "side": side_value,
-    }
-    if side_value == "bid":
-        payload["ord_type"] = "price"
-        payload["price"] = _format_decimal(amount)
-    else:
-        payload["ord_type"] = "market"
-        payload["volume"] = _format_decimal(amount)
+    주문마다 클라이언트 식별자(`identifier`)를 붙이고, 네트워크 오류나 5xx로 실패하면
+    다시 보내기 전에 그 식별자로 주문을 조회한다. 이미 접수되어 있으면 그 주문을
+    돌려주므로 같은 주문이 두 번 들어가지 않는다.
+    """
+    if dry_run:
+        return {"dry_run": True, **build_order_payload(market=market, amount=amount, side=side)}
 
+    identifier = identifier or new_identifier()
+    payload = build_order_payload(market=market, amount=amount, side=side, identifier=identifier)
+    retrier = retrier or _retrier(settings)
+
+    def _lookup() -> dict[str, Any] | None:
+        return fetch_order(client=client, settings=settings, identifier=identifier, timeout=timeout, retrier=retrier)
+
+    maybe_sent = False
+    for attempt in range(retrier.policy.attempts):
+        if attempt:
+            retrier.pause(attempt - 1)
+            if maybe_sent:
+                with recorder.phase("order"):
+                    existing = _lookup()
+                if existing is not None:
+                    return existing
+        with recorder.phase("sign"):
+            headers = _headers(settings, payload)
+        try:
+            with recorder.phase("order"):
+                response = client.post(
+                    f"{settings.base_url}/v1/orders",
+                    json=payload,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+                return response.json()
+        except Exception as exc:
+            # 확인 뒤 다시 보낸 주문이 중복 식별자로 거절되면 그사이 앞선 주문이 접수된 것이다.
+            if maybe_sent and _is_rejected(exc):
+                existing = _lookup()
+                if existing is not None:
+                    return existing
+            if attempt + 1 >= retrier.policy.attempts or not retry.is_retryable(exc):
+                raise
+            maybe_sent = maybe_sent or is_ambiguous(exc)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+async def place_market_order_async(
+    *,
+    client: AsyncHttpClient,
+    settings: ApiSettings,
+    market: str,
+    amount: float,
+    side: Side | str,
+    dry_run: bool,
+    timeout: int = DEFAULT_TIMEOUT,
+    recorder: metrics.Recorder = metrics.NULL_RECORDER,
+    identifier: str | None = None,
+    retrier: retry.Retrier | None = None,
+) -> dict[str, Any]:
     if dry_run:
-        return {"dry_run": True, **payload}
+        return {"dry_run": True, **build_order_payload(market=market, amount=amount, side=side)}
+
+    identifier = identifier or new_identifier()
+    payload = build_order_payload(market=market, amount=amount, side=side, identifier=identifier)
+    retrier = retrier or _retrier(settings)
+
+    async def _lookup() -> dict[str, Any] | None:
+        return await fetch_order_async(
+            client=client, settings=settings, identifier=identifier, timeout=timeout, retrier=retrier
+        )
+
+    maybe_sent = False
+    for attempt in range(retrier.policy.attempts):
+        if attempt:
+            await retrier.pause_async(attempt - 1)
+            if maybe_sent:
+                with recorder.phase("order"):
+                    existing = await _lookup()
+                if existing is not None:
+                    return existing
+        with recorder.phase("sign"):
+            headers = _headers(settings, payload)
+        try:
+            with recorder.phase("order"):
+                response = await client.post(
+                    f"{settings.base_url}/v1/orders",
+                    json=payload,
+                    headers=headers,
+                    timeout=timeout,
+                )
+                response.raise_for_status()
+                return response.json()
+        except Exception as exc:
+            if maybe_sent and _is_rejected(exc):
+                existing = await _lookup()
+                if existing is not None:
+                    return existing
+            if attempt + 1 >= retrier.policy.attempts or not retry.is_retryable(exc):
+                raise
+            maybe_sent = maybe_sent or is_ambiguous(exc)
+    raise AssertionError("unreachable")  # pragma: no cover
 
-    response = client.post(
-        f"{settings.base_url}/v1/orders",
-        json=payload,
-        headers=_headers(settings, payload),
-        timeout=timeout,
+
+def prepare_market_order(
+    *,
+    settings: ApiSettings,
+    market: str,
+    amount: float,
+    side: Side | str,
+    identifier: str | None = None,
+) -> PreparedOrder:
+    payload = build_order_payload(market=market, amount=amount, side=side, identifier=identifier)
+    # 발사 시점에 다시 계산하지 않도록 query_hash 캐시를 미리 채워 둔다.
+    _signer(settings.access_key, settings.secret_key).query_hash(payload)
+    return PreparedOrder(
+        url=f"{settings.base_url}/v1/orders",
+        payload=payload,
+        body=json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
     )
+
+
+def sign_prepared_order(settings: ApiSettings, prepared: PreparedOrder) -> dict[str, str]:
+    headers = _headers(settings, prepared.payload)
+    headers["Content-Type"] = "application/json"
+    return headers
+
+
+def post_prepared_order(
+    *,
+    client: HttpClient,
+    prepared: PreparedOrder,
+    headers: Mapping[str, str],
+    timeout: int = DEFAULT_TIMEOUT,
+) -> dict[str, Any]:
+    response = client.post(prepared.url, content=prepared.body, headers=headers, timeout=timeout)
     response.raise_for_status()
     return response.json()
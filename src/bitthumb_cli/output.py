@@ -0,0 +1,155 @@
+"""실행 결과 출력 방식.
+
+`human`은 기존의 안내 문구와 들여쓴 JSON을, `json`은 실행이 끝날 때 JSON 문서
+하나를, `jsonl`은 회차마다 한 줄짜리 레코드를, `quiet`는 아무것도 출력하지 않는다.
+기계용 출력은 콘솔 서식 비용을 피하도록 버퍼에 모았다가 한 번에 내보낸다.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import IO, Any, Mapping, Sequence
+
+OUTPUT_MODES = ("human", "json", "jsonl", "quiet")
+# jsonl은 레코드가 이만큼 쌓이거나 이 시간(초)이 지나면 내보내 `tail -f`로도 진행 상황을 볼 수 있게 한다.
+_FLUSH_EVERY = 256
+_FLUSH_INTERVAL = 1.0
+
+
+def _compact(payload: Any) -> str:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def print_section(label: str, payload: Any, stream: IO[str] | None = None) -> None:
+    text = json.dumps(payload, ensure_ascii=False, indent=2)
+    print(f"\n[{label}]\n{text}", file=stream or sys.stdout)
+
+
+class Reporter:
+    """사람이 읽는 기본 출력."""
+
+    # 회차 레코드에 단계별 시간을 담아야 하는지 여부
+    timings = False
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        self._stream = stream
+
+    @property
+    def stream(self) -> IO[str]:
+        return self._stream or sys.stdout
+
+    def status(self, text: str) -> None:
+        print(text, file=self.stream)
+
+    def section(self, kind: str, label: str, payload: Any) -> None:
+        print_section(label, payload, self.stream)
+
+    def cycle(self, record: Mapping[str, Any]) -> None:
+        index = record.get("index")
+        if index is not None:
+            print(f"\n[{index}회차]", file=self.stream)
+        currency = record.get("currency")
+        print(f"- 금액: {record.get('amount')} {currency}", file=self.stream)
+        print(f"- 사용 가능: {record.get('available')} {currency}", file=self.stream)
+        if record.get("account") is not None:
+            print_section("주문 가능 정보", record["account"], self.stream)
+        print_section("주문 결과", record.get("result"), self.stream)
+        if "firing" in record:
+            print_section("발사 지연", record["firing"], self.stream)
+        if "fill" in record:
+            print_section("체결 결과", record["fill"], self.stream)
+
+    def results(self, label: str, records: Sequence[Mapping[str, Any]]) -> None:
+        print_section(label, list(records), self.stream)
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class QuietReporter(Reporter):
+    def status(self, text: str) -> None:
+        return None
+
+    def section(self, kind: str, label: str, payload: Any) -> None:
+        return None
+
+    def cycle(self, record: Mapping[str, Any]) -> None:
+        return None
+
+    def results(self, label: str, records: Sequence[Mapping[str, Any]]) -> None:
+        return None
+
+
+class JsonLinesReporter(QuietReporter):
+    timings = True
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        super().__init__(stream)
+        self._buffer: list[str] = []
+        self._drained = time.monotonic()
+
+    def _emit(self, record: Mapping[str, Any]) -> None:
+        self._buffer.append(_compact(record))
+        if len(self._buffer) >= _FLUSH_EVERY or time.monotonic() - self._drained >= _FLUSH_INTERVAL:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buffer:
+            self._buffer.append("")
+            self.stream.write("\n".join(self._buffer))
+            self.stream.flush()
+            self._buffer.clear()
+        self._drained = time.monotonic()
+
+    def section(self, kind: str, label: str, payload: Any) -> None:
+        self._emit({"type": kind, **payload} if isinstance(payload, Mapping) else {"type": kind, "data": payload})
+
+    def cycle(self, record: Mapping[str, Any]) -> None:
+        self._emit({"type": "cycle", **record})
+
+    def results(self, label: str, records: Sequence[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.cycle(record)
+
+    def close(self) -> None:
+        self._drain()
+        self.stream.flush()
+
+
+class JsonReporter(QuietReporter):
+    timings = True
+
+    def __init__(self, stream: IO[str] | None = None) -> None:
+        super().__init__(stream)
+        self._document: dict[str, Any] | None = {"cycles": []}
+
+    def section(self, kind: str, label: str, payload: Any) -> None:
+        if self._document is not None:
+            self._document[kind] = payload
+
+    def cycle(self, record: Mapping[str, Any]) -> None:
+        if self._document is not None:
+            self._document["cycles"].append(dict(record))
+
+    def results(self, label: str, records: Sequence[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.cycle(record)
+
+    def close(self) -> None:
+        if self._document is None:
+            return
+        self.stream.write(_compact(self._document) + "\n")
+        self.stream.flush()
+        self._document = None
+
+
+def build_reporter(mode: str, stream: IO[str] | None = None) -> Reporter:
+    if mode == "json":
+        return JsonReporter(stream)
+    if mode == "jsonl":
+        return JsonLinesReporter(stream)
+    if mode == "quiet":
+        return QuietReporter(stream)
+    return Reporter(stream)
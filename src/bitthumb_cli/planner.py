@@ -0,0 +1,169 @@
+"""계좌 조회 한 번으로 여러 마켓의 주문 계획을 세운다.
+
+마켓마다 `orders/chance`를 부르는 대신 `/v1/accounts`로 전체 잔고를 한 번 읽고,
+최소 주문 금액과 수수료율은 chance 캐시, 실행 사이에 디스크에 남긴 마켓 정보
+(`catalog.MarketInfoStore`), `BITTHUMB_FALLBACK_AMOUNT` 순으로 찾고, 어디에도
+없는 마켓만 chance로 조회한다. 계획은 요청 순서대로 한 번 훑으며 세우고, 앞 주문이 쓸 금액(매수는
+수수료 포함)을 같은 통화 잔고에서 미리 빼 두어 뒤 마켓이 같은 KRW를 다시 쓰지
+않게 한다. 금액 결정과 잔고 검사는 `build_order_plan` 규칙을 그대로 따른다. 매도
+마켓은 KRW 최소 금액을 수량으로 바꾸려고 공개 현재가(`/v1/ticker`)를 한 번 더 조회한다.
+
+대체 금액만으로 계획해 마켓 정보가 없으면 수수료율도 알 수 없으므로, 매수 예약에는
+보수적인 기본 수수료율(`DEFAULT_BID_FEE`)을 쓴다. 앞 주문의 예약이 뒤 주문의 잔고를
+정하는 순차 의존이 있고 마켓 수도 적어서, 계획은 벡터 연산 대신 파이썬 루프 한
+번으로 세운다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from . import cache, catalog, cli, config, engine, orders
+from .chance import ChanceSnapshot
+from .types import HttpClient
+
+_ACCOUNTS_INVALID = "accounts 응답 형식이 올바르지 않습니다."
+# 마켓 정보에 수수료율이 없을 때 매수 예약에 쓰는 값. 실제보다 낮게 잡으면 뒤
+# 마켓이 앞 주문의 수수료로 나갈 KRW까지 다시 계획하므로, 실제 수수료율 이상이
+# 되도록 빗썸 기본 수수료율(0.25%)을 쓴다.
+DEFAULT_BID_FEE = 0.0025
+
+
+def parse_balances(payload: Any) -> dict[str, float]:
+    # `balance`는 주문에 묶인 `locked`를 뺀 사용 가능 잔고다.
+    if not isinstance(payload, list):
+        raise ValueError(_ACCOUNTS_INVALID)
+    balances: dict[str, float] = {}
+    for item in payload:
+        if not isinstance(item, dict) or not isinstance(item.get("currency"), str):
+            raise ValueError(_ACCOUNTS_INVALID)
+        try:
+            balances[item["currency"]] = float(item.get("balance") or 0)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"accounts 응답의 {item['currency']} 잔고가 숫자가 아닙니다.") from exc
+    return balances
+
+
+def _bid_fee(info: Mapping[str, Any]) -> float:
+    try:
+        return float(info["bid_fee"])
+    except (KeyError, TypeError, ValueError):
+        return DEFAULT_BID_FEE
+
+
+def plan_orders(
+    *,
+    configs: Sequence[cli.ExecutionConfig],
+    balances: Mapping[str, float],
+    market_info: Mapping[str, Mapping[str, Any]],
+    fallback_amount: float | None,
+    failures: Mapping[str, Exception] | None = None,
+    prices: Mapping[str, float] | None = None,
+) -> list[engine.Outcome[str, cli.OrderPlan]]:
+    remaining = dict(balances)
+    outcomes: list[engine.Outcome[str, cli.OrderPlan]] = []
+    for item in configs:
+        if failures and item.market in failures:
+            outcomes.append(engine.Outcome(key=item.market, error=failures[item.market]))
+            continue
+        unit, _, coin = item.market.partition("-")
+        currency = unit if item.side == "bid" else coin
+        info = market_info.get(item.market, {})
+        chance = {**info, f"{item.side}_account": {"currency": currency, "balance": remaining.get(currency, 0.0)}}
+        try:
+            plan = cli.build_order_plan(
+                chance=chance,
+                side=item.side,
+                market=item.market,
+                fallback_amount=fallback_amount,
+                dry_run=item.dry_run,
+                amount=item.amount,
+                price=(prices or {}).get(item.market),
+            )
+        except ValueError as exc:
+            outcomes.append(engine.Outcome(key=item.market, error=exc))
+            continue
+        spent = plan.amount * (1 + _bid_fee(info)) if item.side == "bid" else plan.amount
+        remaining[currency] = max(remaining.get(currency, 0.0) - spent, 0.0)
+        outcomes.append(engine.Outcome(key=item.market, value=plan))
+    return outcomes
+
+
+def _has_ask_minimum(info: Mapping[str, Any] | None) -> bool:
+    return bool(info) and ChanceSnapshot.parse(info).ask.min_total is not None
+
+
+def _strip_accounts(chance: Mapping[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in chance.items() if key not in ("bid_account", "ask_account")}
+
+
+def collect_market_info(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    markets: Sequence[str],
+    chance_cache: cache.ChanceCache | None,
+    concurrency: int,
+    info_store: catalog.MarketInfoStore | None = None,
+) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
+    """캐시와 디스크에 없는 마켓 정보만 chance로 채운다. 대체 금액이 설정되어 있으면 조회하지 않는다."""
+    info: dict[str, dict[str, Any]] = {}
+    failures: dict[str, Exception] = {}
+    missing: list[str] = []
+    for market in markets:
+        cached = chance_cache.market_info(settings.access_key, market) if chance_cache is not None else None
+        if cached is None and info_store is not None:
+            cached = info_store.get(market)
+        if cached is not None:
+            info[market] = cached
+        elif settings.fallback_amount is None:
+            missing.append(market)
+
+    def _fetch(market: str) -> dict[str, Any]:
+        return orders.fetch_order_chance(client=client, settings=settings, market=market)
+
+    for outcome in engine.stream_threaded(missing, _fetch, concurrency=concurrency):
+        if outcome.error is not None:
+            failures[outcome.key] = outcome.error
+            continue
+        assert outcome.value is not None
+        if chance_cache is not None:
+            chance_cache.store(settings.access_key, outcome.key, outcome.value)
+        info[outcome.key] = _strip_accounts(outcome.value)
+        if info_store is not None:
+            info_store.put(outcome.key, info[outcome.key])
+    return info, failures
+
+
+def plan_markets(
+    *,
+    client: HttpClient,
+    settings: config.ApiSettings,
+    configs: Sequence[cli.ExecutionConfig],
+    chance_cache: cache.ChanceCache | None = None,
+    concurrency: int = cli.DEFAULT_CONCURRENCY,
+    info_store: catalog.MarketInfoStore | None = None,
+) -> list[engine.Outcome[str, cli.OrderPlan]]:
+    balances = parse_balances(orders.fetch_accounts(client=client, settings=settings))
+    market_info, failures = collect_market_info(
+        client=client,
+        settings=settings,
+        markets=[item.market for item in configs],
+        chance_cache=chance_cache,
+        concurrency=concurrency,
+        info_store=info_store,
+    )
+    # ask의 min_total은 KRW이므로 매도 마켓 현재가를 한 번에 조회해 수량으로 환산한다.
+    priced = sorted(
+        {item.market for item in configs if item.side == "ask" and _has_ask_minimum(market_info.get(item.market))}
+    )
+    prices = orders.fetch_ticker_prices(client=client, settings=settings, markets=priced) if priced else {}
+    return plan_orders(
+        configs=configs,
+        balances=balances,
+        market_info=market_info,
+        fallback_amount=settings.fallback_amount,
+        failures=failures,
+        prices=prices,
+    )
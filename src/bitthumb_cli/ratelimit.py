@@ -0,0 +1,123 @@
+"""요청 수 제한을 지키기 위한 토큰 버킷.
+
+조회용과 주문용 버킷을 분리하고, httpx 이벤트 훅으로 동기/비동기 클라이언트의
+모든 요청 앞에서 토큰을 기다리게 한다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from urllib.parse import urlsplit
+
+from .config import ApiSettings
+
+if TYPE_CHECKING:
+    import httpx
+
+_ORDER_ENDPOINTS = {("POST", "/v1/orders"), ("DELETE", "/v1/order")}
+
+
+class TokenBucket:
+    """예약형 토큰 버킷.
+
+    토큰이 모자라면 잔량을 음수로 예약하고 기다릴 시간을 돌려준다. 잠금은 계산하는
+    동안만 잡으므로 스레드와 이벤트 루프 양쪽에서 같은 버킷을 쓸 수 있다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("초당 요청 수는 0보다 커야 합니다.")
+        if capacity < 1:
+            raise ValueError("버킷 용량은 1 이상이어야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def penalize(self, seconds: float) -> None:
+        # 429를 받으면 이미 예약된 대기열 뒤로 seconds만큼 더 미룬다.
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        import asyncio
+
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    raw = response.headers.get("Retry-After")
+    if not raw:
+        return default
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return default
+
+
+class RateLimiter:
+    def __init__(self, *, query_rate: float, order_rate: float, burst: float = 1.0) -> None:
+        self.query = TokenBucket(query_rate, capacity=burst)
+        self.order = TokenBucket(order_rate, capacity=burst)
+
+    @classmethod
+    def from_settings(cls, settings: ApiSettings) -> RateLimiter:
+        return cls(query_rate=settings.query_rate_limit, order_rate=settings.order_rate_limit)
+
+    def bucket_for(self, method: str, url: str) -> TokenBucket:
+        if (method.upper(), urlsplit(url).path) in _ORDER_ENDPOINTS:
+            return self.order
+        return self.query
+
+    def _on_response(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            bucket = self.bucket_for(response.request.method, str(response.request.url))
+            bucket.penalize(_retry_after(response, 1.0))
+
+    def _before_request(self, request: httpx.Request) -> None:
+        self.bucket_for(request.method, str(request.url)).acquire()
+
+    async def _before_request_async(self, request: httpx.Request) -> None:
+        await self.bucket_for(request.method, str(request.url)).acquire_async()
+
+    async def _on_response_async(self, response: httpx.Response) -> None:
+        self._on_response(response)
+
+    def event_hooks(self) -> dict[str, list[Callable[[Any], None]]]:
+        return {"request": [self._before_request], "response": [self._on_response]}
+
+    def async_event_hooks(self) -> dict[str, list[Callable[[Any], Awaitable[None]]]]:
+        return {"request": [self._before_request_async], "response": [self._on_response_async]}
@@ -0,0 +1,189 @@
+"""멱등 조회 요청용 재시도와 헤징.
+
+재시도마다 요청을 새로 서명하도록 `send`는 매번 요청 전체를 다시 만드는 함수로
+받는다. 주문(POST)처럼 멱등하지 않은 요청에는 `call`을 쓰지 않는다. 주문은
+`orders`가 식별자로 중복을 확인하면서 `pause`로 재시도 간격만 빌려 쓴다.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# 헤징 지연을 백분위로 정하려면 이만큼의 표본이 먼저 쌓여야 한다.
+MIN_HEDGE_SAMPLES = 20
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    # 첫 요청이 최근 지연의 이 백분위를 넘기면 같은 요청을 하나 더 보낸다. None이면 끈다.
+    hedge_percentile: float | None = None
+    window: int = 200
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise ValueError("재시도 횟수는 1 이상이어야 합니다.")
+        if self.hedge_percentile is not None and not 0 < self.hedge_percentile < 1:
+            raise ValueError("헤징 백분위는 0과 1 사이여야 합니다.")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    import httpx
+
+    # 429는 요청 수 제한 훅이 버킷을 늦춰 두므로 다음 시도가 알아서 기다린다.
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+class Retrier:
+    def __init__(
+        self,
+        policy: RetryPolicy = RetryPolicy(),
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.policy = policy
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._latencies: deque[float] = deque(maxlen=policy.window)
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.hedges = 0
+
+    def backoff(self, attempt: int) -> float:
+        # full jitter: 여러 작업자가 같은 순간에 다시 몰리지 않게 한다.
+        ceiling = min(self.policy.max_delay, self.policy.base_delay * 2**attempt)
+        return self._rng.uniform(0, ceiling)
+
+    def hedge_delay(self) -> float | None:
+        percentile = self.policy.hedge_percentile
+        if percentile is None:
+            return None
+        with self._lock:
+            if len(self._latencies) < MIN_HEDGE_SAMPLES:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(int(len(ordered) * percentile), len(ordered) - 1)]
+
+    def _observe(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def _count_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def _count_hedge(self) -> None:
+        with self._lock:
+            self.hedges += 1
+
+    def pause(self, attempt: int) -> None:
+        self._count_retry()
+        self._sleep(self.backoff(attempt))
+
+    async def pause_async(self, attempt: int) -> None:
+        import asyncio
+
+        self._count_retry()
+        await asyncio.sleep(self.backoff(attempt))
+
+    def call(self, send: Callable[[], T]) -> T:
+        for attempt in range(self.policy.attempts):
+            try:
+                return self._send(send)
+            except Exception as exc:
+                if attempt + 1 >= self.policy.attempts or not is_retryable(exc):
+                    raise
+            self.pause(attempt)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _send(self, send: Callable[[], T]) -> T:
+        delay = self.hedge_delay()
+        started = time.perf_counter()
+        if delay is None:
+            result = send()
+            self._observe(time.perf_counter() - started)
+            return result
+
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        # 경주마다 실행기를 만들고 끝나면 바로 내려놓는다. 늦게 끝나는 쪽은 기다리지 않으며,
+        # 연결 풀 제한 시간 안에 스스로 끝나면 작업 스레드도 함께 정리된다.
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bitthumb-hedge")
+        try:
+            pending = {executor.submit(send)}
+            done, pending = wait(pending, timeout=delay)
+            if not done:
+                self._count_hedge()
+                pending.add(executor.submit(send))
+            error: BaseException | None = None
+            while True:
+                for future in done:
+                    exc = future.exception()
+                    if exc is None:
+                        self._observe(time.perf_counter() - started)
+                        return future.result()
+                    error = exc
+                if not pending:
+                    assert error is not None
+                    raise error
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        finally:
+            executor.shutdown(wait=False)
+
+    async def call_async(self, send: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(self.policy.attempts):
+            try:
+                return await self._send_async(send)
+            except Exception as exc:
+                if attempt + 1 >= self.policy.attempts or not is_retryable(exc):
+                    raise
+            await self.pause_async(attempt)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _send_async(self, send: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        delay = self.hedge_delay()
+        started = time.perf_counter()
+        if delay is None:
+            result = await send()
+            self._observe(time.perf_counter() - started)
+            return result
+
+        pending = {asyncio.ensure_future(send())}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done:
+                self._count_hedge()
+                pending.add(asyncio.ensure_future(send()))
+            error: BaseException | None = None
+            while True:
+                for task in done:
+                    exc = task.exception()
+                    if exc is None:
+                        self._observe(time.perf_counter() - started)
+                        return task.result()
+                    error = exc
+                if not pending:
+                    assert error is not None
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict[str, int]:
+        return {"retries": self.retries, "hedges": self.hedges}
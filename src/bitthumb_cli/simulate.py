@@ -0,0 +1,303 @@
+"""기록된 호가 스냅샷으로 `--dry-run` 주문을 체결해 보는 오프라인 시뮬레이터.
+
+스냅샷은 마켓마다 두 개의 `.npy` 파일로 저장한다::
+
+    <root>/KRW-BTC.ts.npy     # (N,) float64, 오름차순 epoch 초
+    <root>/KRW-BTC.book.npy   # (N, depth, 4) float64, 열은 매도 호가, 매도 잔량, 매수 호가, 매수 잔량
+    <root>/meta.json          # {"balances": {"KRW": 1000000}, "fee": 0.0025, "min_total": 5000} (선택)
+
+파일은 메모리 매핑으로 열어 주문이 참조하는 스냅샷 행만 읽는다. 호가를 따라
+내려가며 체결하는 계산은 마켓별로 모든 주문을 한 번에 NumPy 배열 연산으로 하고,
+잔고 차감만 주문 시각 순서대로 한 건씩 한다. 잔고 검사는 시뮬레이션 잔고로 만든
+chance 응답을 `build_order_plan`에 넘겨 실제 실행과 같은 규칙을 따른다.
+
+NumPy가 필요하다(`pip install .[sim]`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from . import batch, engine
+from .types import Side
+
+ASK_PRICE, ASK_SIZE, BID_PRICE, BID_SIZE = range(4)
+DEFAULT_FEE = 0.0025
+DEFAULT_MIN_TOTAL = 5000.0
+_TS_SUFFIX = ".ts.npy"
+_BOOK_SUFFIX = ".book.npy"
+
+
+@dataclass(frozen=True)
+class BookTape:
+    market: str
+    # (N,) 오름차순 시각
+    timestamps: np.ndarray
+    # (N, depth, 4)
+    books: np.ndarray
+
+    def locate(self, ts: np.ndarray) -> np.ndarray:
+        """각 시각에 유효한(그 시각이나 그 전의 마지막) 스냅샷 행 번호. 없으면 -1."""
+        return np.searchsorted(self.timestamps, ts, side="right") - 1
+
+
+def write_tape(root: str | os.PathLike[str], market: str, timestamps: Any, books: Any) -> None:
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    books = np.asarray(books, dtype=np.float64)
+    if books.ndim != 3 or books.shape[2] != 4 or books.shape[0] != timestamps.shape[0]:
+        raise ValueError("호가 스냅샷은 (시각 수, 깊이, 4) 배열이어야 합니다.")
+    if timestamps.size and np.any(np.diff(timestamps) < 0):
+        raise ValueError("스냅샷 시각은 오름차순이어야 합니다.")
+    target = Path(root)
+    target.mkdir(parents=True, exist_ok=True)
+    np.save(target / f"{market}{_TS_SUFFIX}", timestamps)
+    np.save(target / f"{market}{_BOOK_SUFFIX}", books)
+
+
+def open_tapes(root: str | os.PathLike[str]) -> dict[str, BookTape]:
+    tapes: dict[str, BookTape] = {}
+    for path in sorted(Path(root).glob(f"*{_TS_SUFFIX}")):
+        market = path.name[: -len(_TS_SUFFIX)]
+        book_path = path.with_name(f"{market}{_BOOK_SUFFIX}")
+        if not book_path.exists():
+            raise ValueError(f"{market} 호가 파일이 없습니다: {book_path}")
+        tapes[market] = BookTape(
+            market=market,
+            timestamps=np.load(path, mmap_mode="r"),
+            books=np.load(book_path, mmap_mode="r"),
+        )
+    if not tapes:
+        raise ValueError(f"호가 스냅샷이 없습니다: {root}")
+    return tapes
+
+
+def fill_orders(books: np.ndarray, is_bid: np.ndarray, amounts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """주문들을 각자의 호가 스냅샷에 한 번에 체결한다.
+
+    매수는 `amounts`를 KRW 금액으로 보고 매도 호가를, 매도는 코인 수량으로 보고
+    매수 호가를 위에서부터 먹는다. 호가가 모자라면 남은 만큼은 체결되지 않는다.
+    (체결 수량, 체결 금액) 배열을 돌려준다.
+    """
+    bid = is_bid[:, None]
+    price = np.where(bid, books[:, :, ASK_PRICE], books[:, :, BID_PRICE])
+    size = np.where(bid, books[:, :, ASK_SIZE], books[:, :, BID_SIZE])
+    # 각 호가 단계의 크기를 주문 단위(매수는 금액, 매도는 수량)로 맞춘다.
+    depth = np.where(bid, price * size, size)
+    before = np.cumsum(depth, axis=1) - depth
+    taken = np.clip(amounts[:, None] - before, 0.0, depth)
+    volume = np.where(bid, np.divide(taken, price, out=np.zeros_like(taken), where=price > 0), taken)
+    funds = np.where(bid, taken, taken * price)
+    return volume.sum(axis=1), funds.sum(axis=1)
+
+
+@dataclass(frozen=True)
+class SimOrder:
+    ts: float
+    market: str
+    side: Side
+    amount: float | None = None
+
+
+class Simulator:
+    def __init__(
+        self,
+        tapes: Mapping[str, BookTape],
+        *,
+        balances: Mapping[str, float] | None = None,
+        fee: float = DEFAULT_FEE,
+        min_total: float = DEFAULT_MIN_TOTAL,
+    ) -> None:
+        self.tapes = dict(tapes)
+        self.balances = {currency: float(value) for currency, value in (balances or {}).items()}
+        self.fee = fee
+        self.min_total = min_total
+        self.fees_paid: dict[str, float] = {}
+        self.filled = 0
+
+    @classmethod
+    def open(cls, root: str | os.PathLike[str]) -> Simulator:
+        meta_path = Path(root) / "meta.json"
+        meta: dict[str, Any] = {}
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"meta.json 형식이 올바르지 않습니다: {exc}") from exc
+        return cls(
+            open_tapes(root),
+            balances=meta.get("balances"),
+            fee=float(meta.get("fee", DEFAULT_FEE)),
+            min_total=float(meta.get("min_total", DEFAULT_MIN_TOTAL)),
+        )
+
+    def _account(self, currency: str, unit: str) -> dict[str, Any]:
+        return {"currency": currency, "balance": repr(self.balances.get(currency, 0.0)), "unit_currency": unit}
+
+    def chance(self, market: str) -> dict[str, Any]:
+        """시뮬레이션 잔고로 만든 `orders/chance` 응답. 거래소처럼 매도 최소 금액도 KRW로 내려준다."""
+        unit, _, coin = market.partition("-")
+        return {
+            "bid_fee": repr(self.fee),
+            "ask_fee": repr(self.fee),
+            "market": {
+                "id": market,
+                "bid": {"currency": unit, "min_total": repr(self.min_total)},
+                "ask": {"currency": coin, "min_total": repr(self.min_total)},
+            },
+            "bid_account": self._account(unit, unit),
+            "ask_account": self._account(coin, unit),
+        }
+
+    def _quote(self, orders: Sequence[SimOrder]) -> tuple[np.ndarray, ...]:
+        """마켓별로 주문의 스냅샷을 찾아 체결량을 한 번에 계산한다.
+
+        (스냅샷 행, 스냅샷 시각, 최우선 호가, 체결 수량, 체결 금액) 배열을 돌려준다.
+        """
+        count = len(orders)
+        rows = np.full(count, -1, dtype=np.int64)
+        best = np.zeros(count)
+        volume = np.zeros(count)
+        funds = np.zeros(count)
+        snapshot_ts = np.full(count, np.nan)
+        by_market: dict[str, list[int]] = {}
+        for index, order in enumerate(orders):
+            by_market.setdefault(order.market, []).append(index)
+        for market, members in by_market.items():
+            tape = self.tapes.get(market)
+            if tape is None:
+                continue
+            picks = np.asarray(members)
+            found = tape.locate(np.asarray([orders[index].ts for index in members], dtype=np.float64))
+            valid = found >= 0
+            picks, found = picks[valid], found[valid]
+            if not picks.size:
+                continue
+            books = np.asarray(tape.books[found])
+            is_bid = np.asarray([orders[index].side == "bid" for index in picks])
+            amounts = np.asarray([orders[index].amount or 0.0 for index in picks], dtype=np.float64)
+            rows[picks] = found
+            snapshot_ts[picks] = np.asarray(tape.timestamps[found])
+            best[picks] = np.where(is_bid, books[:, 0, ASK_PRICE], books[:, 0, BID_PRICE])
+            volume[picks], funds[picks] = fill_orders(books, is_bid, amounts)
+        return rows, snapshot_ts, best, volume, funds
+
+    def replay(self, orders: Sequence[SimOrder]) -> list[engine.Outcome[int, Any]]:
+        """주문들을 시각 순서대로 체결하고 잔고를 갱신한다. 결과는 입력 순서를 따른다."""
+        from . import cli
+
+        resolved = [self._resolve_amount(order) for order in orders]
+        rows, snapshot_ts, best, volume, funds = self._quote(resolved)
+        outcomes: list[engine.Outcome[int, Any] | None] = [None] * len(orders)
+        for index in sorted(range(len(orders)), key=lambda position: orders[position].ts):
+            order = resolved[index]
+            if rows[index] < 0:
+                outcomes[index] = engine.Outcome(key=index, error=ValueError(self._missing(order)))
+                continue
+            try:
+                best_bid = self._best_bid(order, rows[index])
+                plan = cli.build_order_plan(
+                    chance=self.chance(order.market),
+                    side=order.side,
+                    market=order.market,
+                    fallback_amount=None,
+                    dry_run=True,
+                    amount=order.amount,
+                    price=best_bid,
+                )
+                result = self._settle(order, plan.amount, float(volume[index]), float(funds[index]), float(best[index]))
+            except ValueError as exc:
+                outcomes[index] = engine.Outcome(key=index, error=exc)
+                continue
+            result["snapshot_ts"] = float(snapshot_ts[index])
+            outcomes[index] = engine.Outcome(key=index, value=(plan, None, result))
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    def _best_bid(self, order: SimOrder, row: int) -> float:
+        return float(self.tapes[order.market].books[row, 0, BID_PRICE])
+
+    def _missing(self, order: SimOrder) -> str:
+        if order.market not in self.tapes:
+            return f"{order.market} 호가 스냅샷이 없습니다."
+        return f"{order.market}에 {order.ts} 이전 호가 스냅샷이 없습니다."
+
+    def _resolve_amount(self, order: SimOrder) -> SimOrder:
+        """금액이 없는 주문은 실제 실행처럼 최소 주문 금액으로 채운다."""
+        if order.amount is not None or order.market not in self.tapes:
+            return order
+        tape = self.tapes[order.market]
+        row = int(tape.locate(np.asarray([order.ts]))[0])
+        if row < 0:
+            return order
+        if order.side == "bid":
+            return SimOrder(order.ts, order.market, order.side, self.min_total)
+        best_bid = self._best_bid(order, row)
+        return SimOrder(order.ts, order.market, order.side, self.min_total / best_bid if best_bid > 0 else None)
+
+    def _settle(self, order: SimOrder, amount: float, volume: float, funds: float, best: float) -> dict[str, Any]:
+        unit, _, coin = order.market.partition("-")
+        fee = funds * self.fee
+        if order.side == "bid":
+            cost = funds + fee
+            if self.balances.get(unit, 0.0) + 1e-9 < cost:
+                raise ValueError(f"주문가능한 금액({unit})이 부족합니다.")
+            self.balances[unit] = self.balances.get(unit, 0.0) - cost
+            self.balances[coin] = self.balances.get(coin, 0.0) + volume
+        else:
+            self.balances[coin] = self.balances.get(coin, 0.0) - volume
+            self.balances[unit] = self.balances.get(unit, 0.0) + funds - fee
+        self.fees_paid[unit] = self.fees_paid.get(unit, 0.0) + fee
+        self.filled += 1
+        avg_price = funds / volume if volume > 0 else None
+        slippage = None
+        if avg_price is not None and best > 0:
+            # 최우선 호가보다 불리하게 체결된 비율(양수일수록 불리)
+            slippage = (avg_price / best - 1) if order.side == "bid" else (1 - avg_price / best)
+        requested = "price" if order.side == "bid" else "volume"
+        return {
+            "simulated": True,
+            "market": order.market,
+            "side": order.side,
+            "ord_type": "price" if order.side == "bid" else "market",
+            requested: amount,
+            "state": "done" if volume > 0 else "cancel",
+            "executed_volume": volume,
+            "executed_funds": funds,
+            "avg_price": avg_price,
+            "slippage": slippage,
+            "paid_fee": fee,
+        }
+
+    def stats(self) -> dict[str, Any]:
+        return {"filled": self.filled, "fees": dict(self.fees_paid), "balances": dict(self.balances)}
+
+
+def run_backtest(
+    rows: Iterator[batch.PlanRow] | Sequence[batch.PlanRow],
+    simulator: Simulator,
+) -> list[engine.Outcome[batch.PlanRow, Any]]:
+    """주문 계획 행들을 시뮬레이터로 재생한다. `ts`가 없는 행은 실패로 기록한다."""
+    plan_rows = list(rows)
+    playable = [
+        (position, SimOrder(ts=row.ts, market=row.market, side=row.side, amount=row.amount))
+        for position, row in enumerate(plan_rows)
+        if row.error is None and row.ts is not None
+    ]
+    replayed = simulator.replay([order for _, order in playable])
+    results = {playable[outcome.key][0]: outcome for outcome in replayed}
+    outcomes: list[engine.Outcome[batch.PlanRow, Any]] = []
+    for position, row in enumerate(plan_rows):
+        outcome = results.get(position)
+        if row.error is not None:
+            outcomes.append(engine.Outcome(key=row, error=ValueError(row.error)))
+        elif outcome is None:
+            outcomes.append(engine.Outcome(key=row, error=ValueError("--simulate에는 각 행의 ts 값이 필요합니다.")))
+        else:
+            outcomes.append(engine.Outcome(key=row, value=outcome.value, error=outcome.error))
+    return outcomes
@@ -0,0 +1,85 @@
+"""같은 키로 동시에 들어온 조회를 요청 하나로 합친다.
+
+먼저 온 호출(leader)만 실제로 요청을 보내고, 진행 중에 같은 키로 들어온 호출은
+그 결과나 예외를 함께 받는다. 요청이 끝나면 키를 지우므로 결과를 캐시하지는
+않는다. 합쳐진 호출은 같은 결과 객체를 받으므로 꺼낸 값을 고치지 않아야 한다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[Any]] = {}
+        # 이벤트 루프마다 따로 둔다. asyncio Future는 만든 루프 밖에서 기다릴 수 없다.
+        self._tasks: dict[tuple[int, Hashable], asyncio.Future[Any]] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return cast(T, call.value)
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return cast(T, call.value)
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        flight_key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            task = self._tasks.get(flight_key)
+            if task is None:
+                task = self._tasks[flight_key] = asyncio.ensure_future(fn())
+                self.leaders += 1
+
+                def _forget(_: asyncio.Future[Any]) -> None:
+                    with self._lock:
+                        self._tasks.pop(flight_key, None)
+
+                task.add_done_callback(_forget)
+            else:
+                self.shared += 1
+        # 기다리던 호출 하나가 취소되어도 나머지가 받을 요청은 계속 진행한다.
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"requests": self.leaders, "coalesced": self.shared}
@@ -0,0 +1,605 @@
+"""오프라인 부하/지연 테스트용 로컬 빗썸 대역 서버.
+
+`/v1/market/all`, `/v1/ticker`, `/v1/accounts`, `/v1/orders/chance`, `/v1/order`,
+`/v1/orders`(조회·주문)를
+구현하고, 거래소와 같은 방식으로 JWT의 query_hash를 검증한다.
+`BITTHUMB_BASE_URL`을 이 서버 주소로 지정하면 네트워크 없이 CLI를 실행할 수 있다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+import jwt
+
+from . import auth
+
+DEFAULT_ACCESS_KEY = "standin-access"
+DEFAULT_SECRET_KEY = "standin-secret-key-for-local-testing"
+DEFAULT_PRICES = {"KRW-BTC": "100000000", "KRW-ETH": "4000000", "KRW-XRP": "800"}
+DEFAULT_BALANCES = {"KRW": "1000000"}
+
+_LATENCY_KINDS = {
+    "fixed": 1,
+    "uniform": 2,
+    "normal": 2,
+    "lognormal": 2,
+    "exp": 1,
+}
+
+
+class ExchangeError(Exception):
+    def __init__(self, status: int, name: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.name = name
+        self.message = message
+
+    def body(self) -> dict[str, Any]:
+        return {"error": {"name": self.name, "message": self.message}}
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    kind: str = "fixed"
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyModel:
+        kind, _, raw = spec.partition(":")
+        arity = _LATENCY_KINDS.get(kind)
+        if arity is None:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {kind}")
+        try:
+            params = tuple(float(item) for item in raw.split(",")) if raw else ()
+        except ValueError as exc:
+            raise ValueError(f"지연 분포 파라미터가 숫자가 아닙니다: {spec}") from exc
+        if len(params) != arity:
+            raise ValueError(f"{kind} 분포에는 파라미터 {arity}개가 필요합니다: {spec}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        elif self.kind == "normal":
+            value = rng.gauss(*self.params)
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(*self.params)
+        else:
+            value = rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        return max(value, 0.0)
+
+
+@dataclass(frozen=True)
+class FaultModel:
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+
+    def pick(self, rng: random.Random) -> ExchangeError | None:
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            return ExchangeError(429, "too_many_requests", "요청 수 제한을 초과했습니다.")
+        if roll < self.rate_limit_rate + self.server_error_rate:
+            status = rng.choice((500, 502, 503))
+            return ExchangeError(status, "server_error", "일시적인 서버 오류입니다.")
+        return None
+
+
+@dataclass
+class Account:
+    secret_key: str
+    balances: dict[str, Decimal] = field(default_factory=dict)
+
+    def balance(self, currency: str) -> Decimal:
+        return self.balances.get(currency, Decimal(0))
+
+
+class Exchange:
+    def __init__(
+        self,
+        *,
+        accounts: Mapping[str, Account],
+        prices: Mapping[str, str | Decimal],
+        min_total: str | Decimal = "5000",
+        fee: str | Decimal = "0.0025",
+    ) -> None:
+        self.accounts = dict(accounts)
+        self.prices = {market: _parse_decimal(price, f"{market} 가격", positive=True) for market, price in prices.items()}
+        self.min_total = _parse_decimal(min_total, "최소 주문 금액")
+        self.fee = _parse_decimal(fee, "수수료율")
+        self.orders: dict[str, dict[str, Any]] = {}
+        # (access_key, identifier) -> uuid
+        self.identifiers: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def account(self, access_key: str) -> Account:
+        account = self.accounts.get(access_key)
+        if account is None:
+            raise ExchangeError(401, "invalid_access_key", "잘못된 엑세스 키입니다.")
+        return account
+
+    def _price(self, market: str) -> Decimal:
+        price = self.prices.get(market)
+        if price is None:
+            raise ExchangeError(404, "market_does_not_exist", f"마켓이 존재하지 않습니다: {market}")
+        return price
+
+    def _account_view(self, account: Account, currency: str, unit: str) -> dict[str, Any]:
+        return {
+            "currency": currency,
+            "balance": _text(account.balance(currency)),
+            "locked": "0",
+            "avg_buy_price": "0",
+            "avg_buy_price_modified": False,
+            "unit_currency": unit,
+        }
+
+    def market_list(self) -> list[dict[str, Any]]:
+        return [
+            {"market": market, "korean_name": market, "english_name": market}
+            for market in sorted(self.prices)
+        ]
+
+    def balances(self, access_key: str) -> list[dict[str, Any]]:
+        with self._lock:
+            account = self.account(access_key)
+            return [self._account_view(account, currency, "KRW") for currency in sorted(account.balances)]
+
+    def ticker(self, markets: list[str]) -> list[dict[str, Any]]:
+        return [{"market": market, "trade_price": _text(self._price(market))} for market in markets]
+
+    def chance(self, access_key: str, market: str) -> dict[str, Any]:
+        self._price(market)
+        unit, _, coin = market.partition("-")
+        with self._lock:
+            account = self.account(access_key)
+            return {
+                "bid_fee": _text(self.fee),
+                "ask_fee": _text(self.fee),
+                "market": {
+                    "id": market,
+                    "name": f"{coin}/{unit}",
+                    "order_types": ["limit", "price", "market"],
+                    "order_sides": ["ask", "bid"],
+                    "bid": {"currency": unit, "min_total": _text(self.min_total)},
+                    "ask": {"currency": coin, "min_total": _text(self.min_total)},
+                    "max_total": "1000000000",
+                    "state": "active",
+                },
+                "bid_account": self._account_view(account, unit, unit),
+                "ask_account": self._account_view(account, coin, unit),
+            }
+
+    def place(self, access_key: str, payload: Mapping[str, Any]) -> dict[str, Any]:
+        market = str(payload.get("market", ""))
+        side = payload.get("side")
+        ord_type = payload.get("ord_type")
+        price = self._price(market)
+        unit, _, coin = market.partition("-")
+
+        identifier = payload.get("identifier")
+
+        with self._lock:
+            account = self.account(access_key)
+            if identifier is not None and (access_key, str(identifier)) in self.identifiers:
+                raise ExchangeError(400, "duplicate_identifier", "이미 사용한 주문 식별자입니다.")
+            if side == "bid" and ord_type == "price":
+                funds = _decimal_field(payload, "price")
+                if funds < self.min_total:
+                    raise ExchangeError(400, "under_min_total_bid", "최소 주문 금액 미만입니다.")
+                cost = funds * (1 + self.fee)
+                if account.balance(unit) < cost:
+                    raise ExchangeError(400, "insufficient_funds_bid", f"주문가능한 금액({unit})이 부족합니다.")
+                volume = funds / price
+                account.balances[unit] = account.balance(unit) - cost
+                account.balances[coin] = account.balance(coin) + volume
+                paid_fee = funds * self.fee
+            elif side == "ask" and ord_type == "market":
+                volume = _decimal_field(payload, "volume")
+                if volume * price < self.min_total:
+                    raise ExchangeError(400, "under_min_total_ask", "최소 주문 금액 미만입니다.")
+                if account.balance(coin) < volume:
+                    raise ExchangeError(400, "insufficient_funds_ask", f"주문가능한 수량({coin})이 부족합니다.")
+                funds = volume * price
+                paid_fee = funds * self.fee
+                account.balances[coin] = account.balance(coin) - volume
+                account.balances[unit] = account.balance(unit) + funds - paid_fee
+            else:
+                raise ExchangeError(400, "invalid_parameter", "지원하지 않는 주문 유형입니다.")
+
+            order = {
+                "uuid": str(uuid4()),
+                "side": side,
+                "ord_type": ord_type,
+                "price": payload.get("price"),
+                "state": "wait",
+                "market": market,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "volume": payload.get("volume"),
+                "remaining_volume": payload.get("volume"),
+                "reserved_fee": _text(paid_fee),
+                "remaining_fee": _text(paid_fee),
+                "paid_fee": "0",
+                "locked": _text(funds),
+                "executed_volume": "0",
+                "trades_count": 0,
+            }
+            if identifier is not None:
+                order["identifier"] = str(identifier)
+                self.identifiers[(access_key, str(identifier))] = order["uuid"]
+            # 시장가 주문은 즉시 체결된 것으로 기록한다.
+            self.orders[order["uuid"]] = {
+                **order,
+                "state": "done",
+                "remaining_volume": "0",
+                "remaining_fee": "0",
+                "paid_fee": _text(paid_fee),
+                "locked": "0",
+                "executed_volume": _text(volume),
+                "executed_funds": _text(funds),
+                "trades_count": 1,
+                "access_key": access_key,
+            }
+            return order
+
+    def order(self, access_key: str, query: Mapping[str, list[str]]) -> dict[str, Any]:
+        order_uuid = (query.get("uuid") or [None])[0]
+        identifier = (query.get("identifier") or [None])[0]
+        with self._lock:
+            self.account(access_key)
+            if order_uuid is None and identifier is not None:
+                order_uuid = self.identifiers.get((access_key, identifier))
+            order = self.orders.get(order_uuid or "")
+            if order is None or order["access_key"] != access_key:
+                raise ExchangeError(404, "order_not_found", "주문을 찾을 수 없습니다.")
+            return _public_order(order)
+
+    def list_orders(self, access_key: str, query: Mapping[str, list[str]]) -> list[dict[str, Any]]:
+        market = (query.get("market") or [None])[0]
+        states = set(query.get("states[]") or query.get("state") or ["wait"])
+        uuids = set(query.get("uuids[]") or ())
+        identifiers = set(query.get("identifiers[]") or ())
+        limit = min(_query_int(query, "limit", 100), 100)
+        page = _query_int(query, "page", 1)
+        with self._lock:
+            self.account(access_key)
+            found = [
+                _public_order(order)
+                for order in self.orders.values()
+                if order["access_key"] == access_key
+                and order["state"] in states
+                and (market is None or order["market"] == market)
+                and (not uuids or order["uuid"] in uuids)
+                and (not identifiers or order.get("identifier") in identifiers)
+            ]
+        found.sort(key=lambda order: order["created_at"], reverse=(query.get("order_by") or ["desc"])[0] == "desc")
+        return found[(page - 1) * limit : page * limit]
+
+
+def _public_order(order: Mapping[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in order.items() if key != "access_key"}
+
+
+def _query_int(query: Mapping[str, list[str]], name: str, default: int) -> int:
+    raw = (query.get(name) or [str(default)])[0]
+    try:
+        value = int(raw)
+    except ValueError as exc:
+        raise ExchangeError(400, "invalid_parameter", f"{name} 값이 올바르지 않습니다.") from exc
+    if value < 1:
+        raise ExchangeError(400, "invalid_parameter", f"{name} 값은 1 이상이어야 합니다.")
+    return value
+
+
+def _parse_decimal(value: str | Decimal, label: str, *, positive: bool = False) -> Decimal:
+    try:
+        number = Decimal(str(value))
+    except ArithmeticError as exc:
+        raise ValueError(f"{label}이(가) 숫자가 아닙니다: {value}") from exc
+    if not number.is_finite() or number < 0 or (positive and number == 0):
+        raise ValueError(f"{label}은(는) {'0보다 커야' if positive else '0 이상이어야'} 합니다: {value}")
+    return number
+
+
+def _text(value: Decimal) -> str:
+    return format(value, "f")
+
+
+def _decimal_field(payload: Mapping[str, Any], name: str) -> Decimal:
+    try:
+        value = Decimal(str(payload[name]))
+    except (KeyError, ArithmeticError) as exc:
+        raise ExchangeError(400, "invalid_parameter", f"{name} 값이 올바르지 않습니다.") from exc
+    if value <= 0:
+        raise ExchangeError(400, "invalid_parameter", f"{name} 값은 0보다 커야 합니다.")
+    return value
+
+
+def verify_token(
+    exchange: Exchange,
+    authorization: str | None,
+    query: str,
+) -> str:
+    if not authorization or not authorization.startswith("Bearer "):
+        raise ExchangeError(401, "jwt_verification", "인증 토큰이 없습니다.")
+    token = authorization[len("Bearer "):]
+    try:
+        unverified = jwt.decode(token, options={"verify_signature": False})
+        account = exchange.account(str(unverified.get("access_key")))
+        claims = jwt.decode(token, account.secret_key, algorithms=["HS256", "HS384", "HS512"])
+    except jwt.PyJWTError as exc:
+        raise ExchangeError(401, "jwt_verification", "JWT 서명 검증에 실패했습니다.") from exc
+
+    if not claims.get("nonce") or not claims.get("timestamp"):
+        raise ExchangeError(401, "jwt_verification", "nonce/timestamp가 필요합니다.")
+    if query:
+        algorithm = claims.get("query_hash_alg", "SHA512")
+        try:
+            expected = auth.hash_query_string(query, algorithm=algorithm)
+        except ValueError as exc:
+            raise ExchangeError(401, "invalid_query_payload", "지원하지 않는 query_hash_alg입니다.") from exc
+        if claims.get("query_hash") != expected:
+            raise ExchangeError(401, "invalid_query_payload", "query_hash가 요청 파라미터와 일치하지 않습니다.")
+    return str(claims["access_key"])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandinHttpServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: Any) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError as exc:
+            raise ExchangeError(400, "invalid_body", "Content-Length 값이 올바르지 않습니다.") from exc
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError as exc:
+            raise ExchangeError(400, "invalid_body", "JSON 본문을 해석할 수 없습니다.") from exc
+        if not isinstance(body, dict):
+            raise ExchangeError(400, "invalid_body", "JSON 객체 본문이 필요합니다.")
+        return body
+
+    def _dispatch(self, method: str) -> None:
+        # 본문은 실패 여부와 관계없이 먼저 읽어야 keep-alive 연결이 어긋나지 않는다.
+        body = self._read_json() if method == "POST" else {}
+        time.sleep(self.server.sample_latency())
+        fault = self.server.sample_fault()
+        if fault is not None:
+            raise fault
+
+        split = urlsplit(self.path)
+        exchange = self.server.exchange
+        if method == "GET" and split.path == "/v1/market/all":
+            self._send(200, exchange.market_list())
+        elif method == "GET" and split.path == "/v1/ticker":
+            markets = parse_qs(split.query).get("markets", [""])[0]
+            self._send(200, exchange.ticker([market for market in markets.split(",") if market]))
+        elif method == "GET" and split.path == "/v1/accounts":
+            access_key = verify_token(exchange, self.headers.get("Authorization"), split.query)
+            self._send(200, exchange.balances(access_key))
+        elif method == "GET" and split.path == "/v1/orders/chance":
+            access_key = verify_token(exchange, self.headers.get("Authorization"), split.query)
+            market = parse_qs(split.query).get("market", [""])[0]
+            self._send(200, exchange.chance(access_key, market))
+        elif method == "GET" and split.path == "/v1/order":
+            access_key = verify_token(exchange, self.headers.get("Authorization"), split.query)
+            self._send(200, exchange.order(access_key, parse_qs(split.query)))
+        elif method == "GET" and split.path == "/v1/orders":
+            access_key = verify_token(exchange, self.headers.get("Authorization"), split.query)
+            self._send(200, exchange.list_orders(access_key, parse_qs(split.query)))
+        elif method == "POST" and split.path == "/v1/orders":
+            access_key = verify_token(exchange, self.headers.get("Authorization"), auth.serialize_query(body))
+            self._send(201, exchange.place(access_key, body))
+        else:
+            raise ExchangeError(404, "not_found", f"지원하지 않는 경로입니다: {method} {split.path}")
+
+    def _handle(self, method: str) -> None:
+        try:
+            self._dispatch(method)
+        except ExchangeError as exc:
+            self._send(exc.status, exc.body())
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler 규약
+        self._handle("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._handle("POST")
+
+
+class StandinHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        *,
+        exchange: Exchange,
+        latency: LatencyModel = LatencyModel(),
+        faults: FaultModel = FaultModel(),
+        seed: int | None = None,
+        verbose: bool = False,
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.exchange = exchange
+        self.latency = latency
+        self.faults = faults
+        self.verbose = verbose
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def sample_latency(self) -> float:
+        with self._rng_lock:
+            return self.latency.sample(self._rng)
+
+    def sample_fault(self) -> ExchangeError | None:
+        with self._rng_lock:
+            return self.faults.pick(self._rng)
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(
+            target=self.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="bitthumb-standin",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _parse_pairs(items: list[str] | None, label: str) -> dict[str, str]:
+    pairs: dict[str, str] = {}
+    for item in items or []:
+        key, sep, value = item.partition("=")
+        if not sep or not key or not value:
+            raise ValueError(f"{label}은 KEY=VALUE 형식이어야 합니다: {item}")
+        pairs[key] = value
+    return pairs
+
+
+def _parse_accounts(items: list[str] | None, balances: Mapping[str, str]) -> dict[str, Account]:
+    specs = items or [f"{DEFAULT_ACCESS_KEY}:{DEFAULT_SECRET_KEY}"]
+    accounts: dict[str, Account] = {}
+    for spec in specs:
+        access_key, sep, secret_key = spec.partition(":")
+        if not sep or not access_key or not secret_key:
+            raise ValueError(f"--account는 ACCESS:SECRET 형식이어야 합니다: {spec}")
+        accounts[access_key] = Account(
+            secret_key=secret_key,
+            balances={currency: _parse_decimal(amount, f"{currency} 잔고") for currency, amount in balances.items()},
+        )
+    return accounts
+
+
+def build_server(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    accounts: Mapping[str, Account] | None = None,
+    prices: Mapping[str, str] | None = None,
+    latency: LatencyModel = LatencyModel(),
+    faults: FaultModel = FaultModel(),
+    min_total: str = "5000",
+    fee: str = "0.0025",
+    seed: int | None = None,
+    verbose: bool = False,
+) -> StandinHttpServer:
+    exchange = Exchange(
+        accounts=accounts if accounts is not None else _parse_accounts(None, DEFAULT_BALANCES),
+        prices=prices if prices is not None else DEFAULT_PRICES,
+        min_total=min_total,
+        fee=fee,
+    )
+    return StandinHttpServer(
+        (host, port),
+        exchange=exchange,
+        latency=latency,
+        faults=faults,
+        seed=seed,
+        verbose=verbose,
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="로컬 빗썸 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--account",
+        action="append",
+        help=f"ACCESS:SECRET 형식의 계정 (반복 가능, 기본 {DEFAULT_ACCESS_KEY}:{DEFAULT_SECRET_KEY})",
+    )
+    parser.add_argument("--balance", action="append", help="초기 잔고 CURRENCY=AMOUNT (반복 가능)")
+    parser.add_argument("--price", action="append", help="체결 기준가 MARKET=PRICE (반복 가능)")
+    parser.add_argument(
+        "--latency",
+        default="fixed:0",
+        help="응답 지연 분포(초): fixed:S, uniform:A,B, normal:MU,SIGMA, lognormal:MU,SIGMA, exp:MEAN",
+    )
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="5xx 응답 비율 (0~1)")
+    parser.add_argument("--min-total", default="5000", help="최소 주문 금액")
+    parser.add_argument("--fee", default="0.0025", help="수수료율")
+    parser.add_argument("--seed", type=int, help="지연/장애 주입 난수 시드")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        balances = _parse_pairs(args.balance, "--balance") or DEFAULT_BALANCES
+        prices = _parse_pairs(args.price, "--price") or DEFAULT_PRICES
+        accounts = _parse_accounts(args.account, balances)
+        latency = LatencyModel.parse(args.latency)
+    except ValueError as exc:
+        parser.error(str(exc))
+        return
+    if not 0 <= args.rate_limit_rate + args.server_error_rate <= 1:
+        parser.error("--rate-limit-rate와 --server-error-rate의 합은 0~1 사이여야 합니다.")
+
+    try:
+        server = build_server(
+            host=args.host,
+            port=args.port,
+            accounts=accounts,
+            prices=prices,
+            latency=latency,
+            faults=FaultModel(args.rate_limit_rate, args.server_error_rate),
+            min_total=args.min_total,
+            fee=args.fee,
+            seed=args.seed,
+            verbose=args.verbose,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+        return
+    print(f"빗썸 대역 서버 실행 중: {server.base_url}")
+    print(f"- 계정: {', '.join(accounts)}")
+    print(f"- 마켓: {', '.join(prices)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
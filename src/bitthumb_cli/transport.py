@@ -0,0 +1,87 @@
+"""HTTP 연결 풀 구성과 연결 통계 수집."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from .config import ApiSettings
+
+if TYPE_CHECKING:
+    import httpx
+
+_CONNECT_EVENTS = ("connection.connect_tcp", "connection.start_tls")
+_WAIT_EVENTS = ("http11.receive_response_headers", "http2.receive_response_headers")
+
+
+def merge_hooks(*hooks: dict[str, list[Any]]) -> dict[str, list[Any]]:
+    merged: dict[str, list[Any]] = {}
+    for item in hooks:
+        for event, callbacks in item.items():
+            merged.setdefault(event, []).extend(callbacks)
+    return merged
+
+
+def pool_limits(settings: ApiSettings, *, concurrency: int = 1) -> httpx.Limits:
+    import httpx
+
+    # 동시 작업 수보다 연결 풀이 작으면 작업자들이 연결을 기다리며 줄을 선다.
+    return httpx.Limits(
+        max_connections=max(settings.max_connections, concurrency),
+        max_keepalive_connections=max(settings.max_keepalive_connections, concurrency),
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections: int = 0
+    connect_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _record(self, event: str, elapsed: float) -> None:
+        with self._lock:
+            if event == "connection.connect_tcp":
+                self.connections += 1
+            if event in _CONNECT_EVENTS:
+                self.connect_seconds += elapsed
+            else:
+                self.wait_seconds += elapsed
+
+    def _tracer(self) -> Callable[[str, dict[str, Any]], None]:
+        # 요청마다 시작 시각을 따로 보관해야 동시 요청에서도 구간이 섞이지 않는다.
+        started: dict[str, float] = {}
+
+        def trace(name: str, info: dict[str, Any]) -> None:
+            event, _, stage = name.rpartition(".")
+            if event not in _CONNECT_EVENTS and event not in _WAIT_EVENTS:
+                return
+            if stage == "started":
+                started[event] = time.perf_counter()
+            elif event in started:
+                self._record(event, time.perf_counter() - started.pop(event))
+
+        return trace
+
+    def attach(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests += 1
+        request.extensions["trace"] = self._tracer()
+
+    def event_hooks(self) -> dict[str, list[Callable[[httpx.Request], None]]]:
+        return {"request": [self.attach]}
+
+    def summary(self, *, cycles: int, elapsed: float) -> dict[str, Any]:
+        return {
+            "cycles": cycles,
+            "elapsed_sec": round(elapsed, 6),
+            "cycles_per_sec": round(cycles / elapsed, 3) if elapsed > 0 else None,
+            "requests": self.requests,
+            "connections_opened": self.connections,
+            "connect_sec": round(self.connect_seconds, 6),
+            "server_wait_sec": round(self.wait_seconds, 6),
+        }
@@ -28,6 +28,29 @@ class HttpClient(Protocol):
         ...
 
     def post(
+        self,
+        url: str,
+        *,
+        content: bytes | None = None,
+        json: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: int | float | None = None,
+    ) -> SupportsJsonResponse:
+        ...
+
+
+class AsyncHttpClient(Protocol):
+    async def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: int | float | None = None,
+    ) -> SupportsJsonResponse:
+        ...
+
+    async def post(
         self,
         url: str,
         *,
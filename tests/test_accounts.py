@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+import pytest
+
+from bitthumb_cli import accounts, cli, config, standin
+
+
+def test_parse_accounts_reads_inline_and_env_keys(monkeypatch):
+    monkeypatch.setenv("SUB_AK", "sub-ak")
+    monkeypatch.setenv("SUB_SK", "sub-sk")
+
+    parsed = accounts.parse_accounts(
+        {
+            "accounts": {
+                "main": {"access_key": "ak", "secret_key": "sk", "markets": "KRW-BTC, KRW-ETH"},
+                "sub": {"access_key_env": "SUB_AK", "secret_key_env": "SUB_SK", "side": "ask"},
+            }
+        }
+    )
+
+    assert parsed == [
+        accounts.Account(name="main", access_key="ak", secret_key="sk", markets=("KRW-BTC", "KRW-ETH")),
+        accounts.Account(name="sub", access_key="sub-ak", secret_key="sub-sk", side="ask"),
+    ]
+
+
+def test_parse_accounts_requires_keys(monkeypatch):
+    monkeypatch.delenv("MISSING_SK", raising=False)
+
+    with pytest.raises(ValueError, match="secret_key"):
+        accounts.parse_accounts({"accounts": {"main": {"access_key": "ak"}}})
+    with pytest.raises(ValueError, match="MISSING_SK"):
+        accounts.parse_accounts({"accounts": {"main": {"access_key": "ak", "secret_key_env": "MISSING_SK"}}})
+    with pytest.raises(ValueError, match="accounts"):
+        accounts.parse_accounts({})
+
+
+def test_load_accounts_rejects_invalid_toml(tmp_path):
+    path = tmp_path / "accounts.toml"
+    path.write_text("[accounts.main\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="계정 파일 형식"):
+        accounts.load_accounts(path)
+
+
+def test_prepare_account_jobs_falls_back_to_cli_markets():
+    options = cli._parse_cli_options(["--accounts", "accounts.toml", "--markets", "KRW-BTC,KRW-ETH", "--side", "ask"])[1]
+    base = config.ApiSettings(base_url="https://api.bithumb.com", access_key="", secret_key="")
+    listed = [
+        accounts.Account(name="main", access_key="ak", secret_key="sk"),
+        accounts.Account(name="sub", access_key="ak2", secret_key="sk2", markets=("KRW-XRP",), side="bid"),
+    ]
+
+    jobs = cli.prepare_account_jobs(options, base, listed)
+
+    assert [(job.name, job.markets, job.side) for job in jobs] == [
+        ("main", ("KRW-BTC", "KRW-ETH"), "ask"),
+        ("sub", ("KRW-XRP",), "bid"),
+    ]
+    assert jobs[1].settings.access_key == "ak2"
+
+
+def test_accounts_flag_conflicts_with_repeat():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--accounts", "accounts.toml", "--repeat", "2"])
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        ["--adaptive"],
+        ["--single-snapshot"],
+        ["--metrics-out", "m.jsonl"],
+        ["--metrics-prom", "m.prom"],
+    ],
+)
+def test_accounts_flag_rejects_options_workers_ignore(extra, capsys):
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--accounts", "accounts.toml", "--markets", "KRW-BTC,KRW-ETH", *extra])
+
+    assert "--accounts" in capsys.readouterr().err
+
+
+def test_fan_out_places_orders_per_account():
+    balances = {"KRW": Decimal("20000")}
+    server = standin.build_server(
+        accounts={
+            "ak1": standin.Account(secret_key="sk1", balances=dict(balances)),
+            "ak2": standin.Account(secret_key="sk2", balances=dict(balances)),
+        },
+        prices={"KRW-BTC": "100000000"},
+    )
+    server.start()
+    try:
+        base = config.ApiSettings(base_url=server.base_url, access_key="", secret_key="")
+        jobs = [
+            accounts.AccountJob(
+                name=name,
+                settings=accounts.Account(name=name, access_key=ak, secret_key=sk).settings(base),
+                markets=("KRW-BTC",),
+                side="bid",
+                dry_run=False,
+                concurrency=1,
+            )
+            for name, ak, sk in (("main", "ak1", "sk1"), ("sub", "ak2", "sk2"))
+        ]
+
+        records = sorted((record for batch in accounts.fan_out(jobs) for record in batch), key=lambda r: r["account_name"])
+    finally:
+        server.stop()
+
+    assert [(record["account_name"], record["ok"]) for record in records] == [("main", True), ("sub", True)]
+    spent = Decimal("5000") * Decimal("1.0025")
+    for access_key in ("ak1", "ak2"):
+        assert server.exchange.accounts[access_key].balances["KRW"] == Decimal("20000") - spent
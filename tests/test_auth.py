@@ -77,3 +77,85 @@ def test_serialize_query_preserves_safe_characters_in_sequence_keys():
     params = {"field-name": ["value~1"]}
 
     assert auth.serialize_query(params) == "field-name[]=value~1"
+
+
+@pytest.mark.parametrize("params", [
+    None,
+    {},
+    {"market": "KRW-BTC"},
+    {"market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "5500"},
+    {"market": "KRW-BTC", "uuids": ["C1", "C2"], "limit": 50, "empty": None},
+    {"note": "한글 값"},
+])
+@pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+def test_signer_matches_generate_jwt_byte_for_byte(params, algorithm):
+    signer = auth.Signer(access_key="test-access", secret_key="secret", algorithm=algorithm)
+
+    expected = auth.generate_jwt(
+        access_key="test-access",
+        secret_key="secret",
+        params=params,
+        nonce="fixed-nonce",
+        timestamp=1700000000000,
+        algorithm=algorithm,
+    )
+
+    assert signer.sign(params, nonce="fixed-nonce", timestamp=1700000000000) == expected
+
+
+def test_signer_respects_query_hash_algorithm():
+    signer = auth.Signer(access_key="ak", secret_key="secret", query_hash_algorithm="MD5")
+    params = {"market": "KRW-BTC"}
+
+    expected = auth.generate_jwt(
+        access_key="ak",
+        secret_key="secret",
+        params=params,
+        nonce="n",
+        timestamp=1,
+        query_hash_algorithm="MD5",
+    )
+
+    assert signer.sign(params, nonce="n", timestamp=1) == expected
+
+
+def test_signer_caches_query_hash(mocker):
+    signer = auth.Signer(access_key="ak", secret_key="secret")
+    hasher = mocker.spy(auth, "hash_query_string")
+
+    first = signer.query_hash({"market": "KRW-BTC"})
+    second = signer.query_hash({"market": "KRW-BTC"})
+    signer.query_hash({"market": "KRW-XRP"})
+
+    assert first == second == auth.hash_query_string("market=KRW-BTC")
+    assert hasher.call_count == 3
+
+
+def test_signer_cache_distinguishes_equal_but_differently_serialized_values():
+    signer = auth.Signer(access_key="ak", secret_key="secret")
+
+    for value in (1, 1.0, True, [1, 1.0], [True, 1]):
+        params = {"volume": value}
+        assert signer.query_hash(params) == auth.hash_query_string(auth.serialize_query(params))
+
+
+def test_signer_generates_fresh_nonce_per_call():
+    signer = auth.Signer(access_key="ak", secret_key="secret")
+
+    first = jwt.decode(signer.sign({"market": "KRW-BTC"}), "secret", algorithms=["HS256"])
+    second = jwt.decode(signer.sign({"market": "KRW-BTC"}), "secret", algorithms=["HS256"])
+
+    assert first["nonce"] != second["nonce"]
+    assert first["query_hash"] == second["query_hash"]
+
+
+def test_signer_handles_unhashable_params():
+    signer = auth.Signer(access_key="ak", secret_key="secret")
+    params = {"meta": {"a": 1}}
+
+    assert signer.query_hash(params) == auth.hash_query_string(auth.serialize_query(params))
+
+
+def test_signer_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        auth.Signer(access_key="ak", secret_key="secret", algorithm="RS256")
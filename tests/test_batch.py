@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+from bitthumb_cli import batch
+
+
+def test_read_plan_streams_rows_and_flags_invalid_lines(tmp_path):
+    plan = tmp_path / "orders.jsonl"
+    plan.write_text(
+        "\n".join(
+            [
+                '{"market": "KRW-BTC", "side": "bid", "amount": 6000}',
+                "",
+                "# comment",
+                '{"market": "KRW-XRP"}',
+                "not-json",
+                '{"market": "KRW-ETH", "side": "hold"}',
+                '{"market": "KRW-ETH", "amount": "-1"}',
+                "[1, 2]",
+            ]
+        )
+    )
+
+    rows = list(batch.read_plan(plan, default_side="ask"))
+
+    assert rows[0] == batch.PlanRow(line=1, market="KRW-BTC", side="bid", amount=6000.0)
+    assert rows[1] == batch.PlanRow(line=4, market="KRW-XRP", side="ask", amount=None)
+    assert rows[2].line == 5 and rows[2].error == "JSON 형식이 아닙니다."
+    assert rows[3].market == "KRW-ETH" and rows[3].error
+    assert rows[4].error == "amount 값은 0보다 커야 합니다."
+    assert rows[5].error == "각 행은 JSON 객체여야 합니다."
+
+
+@pytest.mark.parametrize("raw", [{}, {"market": ""}, {"market": 3}])
+def test_parse_row_requires_market(raw):
+    with pytest.raises(ValueError):
+        batch.parse_row(1, raw, "bid")
+
+
+def test_result_writer_counts_failures():
+    stream = io.StringIO()
+    writer = batch.ResultWriter(stream)
+
+    writer.write({"line": 1, "ok": True})
+    writer.write({"line": 2, "ok": False, "error": "x"})
+
+    assert writer.written == 2
+    assert writer.failed == 1
+    assert stream.getvalue().splitlines()[1] == '{"line":2,"ok":false,"error":"x"}'
+
+
+@pytest.mark.parametrize("value,expected", [
+    (1_700_000_000, 1_700_000_000.0),
+    ("2023-11-14T22:13:20+00:00", 1_700_000_000.0),
+    (None, None),
+])
+def test_parse_row_reads_ts(value, expected):
+    assert batch.parse_row(1, {"market": "KRW-BTC", "ts": value}, "bid").ts == expected
+
+
+@pytest.mark.parametrize("value", ["2023-11-14T22:13:20", "soon", True])
+def test_parse_row_rejects_ambiguous_ts(value):
+    with pytest.raises(ValueError, match="ts"):
+        batch.parse_row(1, {"market": "KRW-BTC", "ts": value}, "bid")
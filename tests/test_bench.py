@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from bitthumb_cli import bench
+
+
+def _report(**best_us):
+    return {"results": {name: {"best_us": value} for name, value in best_us.items()}}
+
+
+def test_compare_flags_regressions_past_threshold():
+    rows = bench.compare(
+        _report(fast=10.0, slow=13.0, new=1.0),
+        _report(fast=10.0, slow=10.0),
+        threshold=0.2,
+    )
+
+    by_case = {row["case"]: row for row in rows}
+    assert set(by_case) == {"fast", "slow"}
+    assert by_case["fast"]["regression"] is False
+    assert by_case["slow"]["regression"] is True
+    assert by_case["slow"]["change"] == pytest.approx(0.3)
+
+
+def test_fake_client_cycle_cases_run():
+    cases = {case.name: case for case in bench.build_cases()}
+
+    plan, _, result = cases["execute_trade_cycle.fake_client"].func()
+
+    assert plan.amount == pytest.approx(5000.0)
+    assert result == {"uuid": "bench-order", "state": "wait"}
+    assert cases["execute_trade_cycle.markets"].units == 64
+
+
+def test_main_writes_results_and_exits_on_regression(tmp_path):
+    output = tmp_path / "bench.json"
+    bench.main(["--filter", "format_decimal", "--repeat", "1", "--target", "0.001", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert set(report["results"]) == {"format_decimal.int", "format_decimal.float"}
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_report(**{"format_decimal.int": 1e-6})))
+    with pytest.raises(SystemExit) as excinfo:
+        bench.main(
+            ["--filter", "format_decimal.int", "--repeat", "1", "--target", "0.001", "--baseline", str(baseline)]
+        )
+    assert excinfo.value.code == 1
@@ -0,0 +1,122 @@
+import pytest
+
+from bitthumb_cli import cache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def chance():
+    return {
+        "bid_fee": "0.0025",
+        "market": {"bid": {"currency": "KRW", "min_total": "5000"}},
+        "bid_account": {"currency": "KRW", "balance": "20000", "locked": "0"},
+        "ask_account": {"currency": "BTC", "balance": "0.001", "locked": "0"},
+    }
+
+
+def test_get_returns_stored_chance_until_account_ttl(chance):
+    clock = _Clock()
+    store = cache.ChanceCache(market_ttl=60, account_ttl=5, clock=clock)
+    store.store("ak", "KRW-BTC", chance)
+
+    assert store.get("ak", "KRW-BTC", "bid") == chance
+    assert store.get("other", "KRW-BTC", "bid") is None
+
+    clock.now = 5.0
+    assert store.get("ak", "KRW-BTC", "bid") is None
+    assert store.stats() == {"hits": 1, "misses": 2}
+
+
+def test_market_ttl_expires_independently(chance):
+    clock = _Clock()
+    store = cache.ChanceCache(market_ttl=1, account_ttl=5, clock=clock)
+    store.store("ak", "KRW-BTC", chance)
+
+    clock.now = 1.0
+    assert store.get("ak", "KRW-BTC", "bid") is None
+
+
+def test_get_returns_copies(chance):
+    store = cache.ChanceCache()
+    store.store("ak", "KRW-BTC", chance)
+
+    store.get("ak", "KRW-BTC", "bid")["bid_account"]["balance"] = "0"
+
+    assert store.get("ak", "KRW-BTC", "bid")["bid_account"]["balance"] == "20000"
+
+
+def test_apply_bid_deducts_fee_and_expires_ask_side(chance):
+    store = cache.ChanceCache()
+    store.store("ak", "KRW-BTC", chance)
+
+    store.apply_order("ak", "KRW-BTC", "bid", 5000)
+
+    cached = store.get("ak", "KRW-BTC", "bid")
+    assert cached["bid_account"]["balance"] == "14987.5"
+    assert "ask_account" not in cached
+    assert store.get("ak", "KRW-BTC", "ask") is None
+
+
+def test_apply_ask_deducts_volume(chance):
+    store = cache.ChanceCache()
+    store.store("ak", "KRW-BTC", chance)
+
+    store.apply_order("ak", "KRW-BTC", "ask", 0.0004)
+
+    assert store.get("ak", "KRW-BTC", "ask")["ask_account"]["balance"] == "0.0006"
+    assert store.get("ak", "KRW-BTC", "bid") is None
+
+
+def test_apply_order_updates_shared_currency_across_markets(chance):
+    store = cache.ChanceCache()
+    eth = {**chance, "ask_account": {"currency": "ETH", "balance": "0.5", "locked": "0"}}
+    store.store("ak", "KRW-BTC", chance)
+    store.store("ak", "KRW-ETH", eth)
+    store.store("other", "KRW-ETH", eth)
+
+    store.apply_order("ak", "KRW-BTC", "bid", 5000)
+
+    # 같은 키의 KRW 잔고는 다른 마켓 항목에서도 함께 줄어든다.
+    assert store.get("ak", "KRW-ETH", "bid")["bid_account"]["balance"] == "14987.5"
+    assert store.get("ak", "KRW-ETH", "ask")["ask_account"]["balance"] == "0.5"
+    assert store.get("other", "KRW-ETH", "bid")["bid_account"]["balance"] == "20000"
+
+    store.apply_order("ak", "KRW-ETH", "ask", 0.1)
+
+    # 매도로 받는 KRW는 체결 금액을 알 수 없으므로 모든 마켓에서 만료된다.
+    assert store.get("ak", "KRW-BTC", "bid") is None
+    assert store.get("ak", "KRW-ETH", "bid") is None
+    assert store.get("ak", "KRW-ETH", "ask")["ask_account"]["balance"] == "0.4"
+
+
+def test_apply_bid_on_uncached_market_expires_krw_balances(chance):
+    store = cache.ChanceCache()
+    store.store("ak", "KRW-ETH", chance)
+
+    store.apply_order("ak", "KRW-BTC", "bid", 5000)
+
+    assert store.get("ak", "KRW-ETH", "bid") is None
+
+
+def test_invalidate_by_account(chance):
+    store = cache.ChanceCache()
+    store.store("ak", "KRW-BTC", chance)
+    store.store("ak", "KRW-ETH", chance)
+    store.store("other", "KRW-BTC", chance)
+
+    store.invalidate("ak")
+
+    assert store.get("ak", "KRW-ETH", "bid") is None
+    assert store.get("other", "KRW-BTC", "bid") is not None
+
+
+def test_rejects_negative_ttl():
+    with pytest.raises(ValueError):
+        cache.ChanceCache(account_ttl=-1)
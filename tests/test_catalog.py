@@ -0,0 +1,129 @@
+import httpx
+import pytest
+
+from bitthumb_cli import catalog, standin
+from bitthumb_cli.config import ApiSettings
+
+
+@pytest.fixture
+def markets():
+    return catalog.MarketCatalog.build(["KRW-ETH", "KRW-BTC", "BTC-ETH", "KRW-XRP", "KRW-BTC"], 100.0)
+
+
+def test_build_sorts_and_deduplicates(markets):
+    assert markets.markets == ("BTC-ETH", "KRW-BTC", "KRW-ETH", "KRW-XRP")
+    assert "KRW-BTC" in markets
+    assert "KRW-BTCC" not in markets
+
+
+def test_expand_prefix_and_glob_patterns(markets):
+    assert markets.expand("KRW-*") == ("KRW-BTC", "KRW-ETH", "KRW-XRP")
+    assert markets.expand("*-ETH") == ("BTC-ETH", "KRW-ETH")
+    assert markets.expand("KRW-BTC") == ("KRW-BTC",)
+    assert markets.expand("USDT-*") == ()
+
+
+def test_resolve_keeps_order_and_suggests_typos(markets):
+    assert markets.resolve(["KRW-XRP", "KRW-*"]) == ("KRW-XRP", "KRW-BTC", "KRW-ETH")
+    with pytest.raises(ValueError, match="KRW-BTC을\\(를\\) 의도했나요"):
+        markets.resolve(["KRW-BTCC"])
+    with pytest.raises(ValueError, match="패턴과 일치하는 마켓이 없습니다"):
+        markets.resolve(["USDT-*"])
+
+
+def test_catalog_round_trips_through_disk(tmp_path, markets):
+    path = tmp_path / "nested" / "markets.txt"
+
+    catalog.write_catalog(path, markets)
+
+    assert catalog.read_catalog(path) == markets
+    assert path.read_text(encoding="utf-8").splitlines()[1:] == list(markets.markets)
+
+
+def test_read_catalog_ignores_unknown_format(tmp_path):
+    path = tmp_path / "markets.txt"
+    path.write_text("something else\nKRW-BTC\n", encoding="utf-8")
+
+    assert catalog.read_catalog(path) is None
+    assert catalog.read_catalog(tmp_path / "missing.txt") is None
+
+
+def test_load_catalog_uses_fresh_disk_copy(mocker, tmp_path, markets):
+    path = tmp_path / "markets.txt"
+    catalog.write_catalog(path, markets)
+    fetch = mocker.patch("bitthumb_cli.catalog.fetch_catalog")
+    settings = ApiSettings(base_url="https://api.test.com", access_key="", secret_key="", market_cache_ttl=60)
+
+    assert catalog.load_catalog(settings, client=mocker.Mock(), path=path, clock=lambda: 150.0) == markets
+    fetch.assert_not_called()
+
+
+def test_load_catalog_falls_back_to_stale_copy_when_fetch_fails(mocker, tmp_path, markets):
+    path = tmp_path / "markets.txt"
+    catalog.write_catalog(path, markets)
+    mocker.patch("bitthumb_cli.catalog.fetch_catalog", side_effect=httpx.ConnectError("down"))
+    settings = ApiSettings(base_url="https://api.test.com", access_key="", secret_key="", market_cache_ttl=60)
+
+    client = mocker.Mock()
+
+    assert catalog.load_catalog(settings, client=client, path=path, clock=lambda: 1000.0) == markets
+    assert catalog.load_catalog(settings, client=client, path=tmp_path / "missing.txt", clock=lambda: 1000.0) is None
+
+
+def test_load_catalog_fetches_from_standin(tmp_path):
+    server = standin.build_server(accounts={}, prices={"KRW-BTC": "100000000", "KRW-ETH": "5000000"})
+    server.start()
+    try:
+        settings = ApiSettings(base_url=server.base_url, access_key="", secret_key="")
+        path = tmp_path / "markets.txt"
+        requested = []
+
+        with httpx.Client(event_hooks={"request": [lambda request: requested.append(request.url.path)]}) as client:
+            loaded = catalog.load_catalog(settings, client=client, path=path, clock=lambda: 500.0)
+    finally:
+        server.stop()
+
+    # 목록도 호출한 쪽 클라이언트(연결 풀, 요청 수 제한 훅)를 거친다.
+    assert requested == [catalog.MARKET_ALL_PATH]
+    assert loaded == catalog.MarketCatalog(markets=("KRW-BTC", "KRW-ETH"), fetched_at=500.0)
+    assert catalog.read_catalog(path) == loaded
+
+
+def test_default_cache_path_is_keyed_by_base_url(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    live = ApiSettings(base_url="https://api.bithumb.com", access_key="", secret_key="")
+    local = ApiSettings(base_url="http://127.0.0.1:8765", access_key="", secret_key="")
+
+    assert catalog.default_cache_path(live).parent == tmp_path / "bitthumb-cli"
+    assert catalog.default_cache_path(live) != catalog.default_cache_path(local)
+
+
+def test_market_info_store_round_trips_with_ttl(tmp_path):
+    path = tmp_path / "nested" / "info.json"
+    now = [100.0]
+    store = catalog.MarketInfoStore.open(path, ttl=60, clock=lambda: now[0])
+    store.put("KRW-BTC", {"bid_fee": "0.0025", "market": {"bid": {"min_total": "5000"}}})
+    store.save()
+
+    reopened = catalog.MarketInfoStore.open(path, ttl=60, clock=lambda: now[0])
+    assert reopened.get("KRW-BTC")["bid_fee"] == "0.0025"
+    assert reopened.get("KRW-ETH") is None
+
+    now[0] = 160.0
+    assert reopened.get("KRW-BTC") is None
+
+
+def test_market_info_store_ignores_unknown_format(tmp_path):
+    path = tmp_path / "info.json"
+    path.write_text('{"markets": {"KRW-BTC": {}}}', encoding="utf-8")
+
+    assert catalog.MarketInfoStore.open(path, ttl=60).get("KRW-BTC") is None
+
+
+def test_info_path_is_per_account_next_to_catalog(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    first = ApiSettings(base_url="https://api.test.com", access_key="a", secret_key="")
+    second = ApiSettings(base_url="https://api.test.com", access_key="b", secret_key="")
+
+    assert catalog.default_info_path(first).parent == catalog.default_cache_path(first).parent
+    assert catalog.default_info_path(first) != catalog.default_info_path(second)
@@ -0,0 +1,84 @@
+import httpx
+import pytest
+
+from bitthumb_cli import chance as chance_module
+from bitthumb_cli.chance import ChanceSnapshot
+
+
+@pytest.fixture
+def raw():
+    return {
+        "market": {
+            "bid": {"currency": "KRW", "min_total": "5500"},
+            "ask": {"currency": "BTC", "min_total": "0.001"},
+        },
+        "bid_account": {"currency": "KRW", "balance": "7500.5", "locked": "0"},
+        "ask_account": {"currency": "BTC", "available": "0.015"},
+    }
+
+
+def test_parse_reads_both_sides(raw):
+    snapshot = ChanceSnapshot.parse(raw)
+
+    assert snapshot.min_total("bid") == 5500.0
+    assert snapshot.min_total("ask") == 0.001
+    assert snapshot.available("bid") == 7500.5
+    assert snapshot.available("ask") == 0.015
+    assert snapshot.account("bid") is raw["bid_account"]
+    assert snapshot.currency_label("bid", "KRW-BTC") == "KRW"
+    assert snapshot.currency_label("ask", "KRW-XRP") == "BTC"
+
+
+def test_errors_are_raised_only_for_requested_side(raw):
+    raw["ask_account"] = None
+    raw["market"]["ask"]["min_total"] = "abc"
+
+    snapshot = ChanceSnapshot.parse(raw)
+
+    assert snapshot.available("bid") == 7500.5
+    with pytest.raises(ValueError, match="계좌 정보를 찾을 수 없습니다"):
+        snapshot.available("ask")
+    with pytest.raises(ValueError, match="최소 주문 금액이 숫자가 아닙니다"):
+        snapshot.min_total("ask")
+
+
+@pytest.mark.parametrize(
+    ("account", "message"),
+    [
+        ({"available": ""}, "사용 가능 잔액 정보가 없습니다"),
+        ({"available": "x"}, "사용 가능 금액이 숫자가 아닙니다"),
+    ],
+)
+def test_available_errors(raw, account, message):
+    raw["bid_account"] = account
+
+    with pytest.raises(ValueError, match=message):
+        ChanceSnapshot.parse(raw).available("bid")
+
+
+def test_currency_label_falls_back_to_market_code():
+    snapshot = ChanceSnapshot.parse({})
+
+    assert snapshot.currency_label("bid", "KRW-ETH") == "KRW"
+    assert snapshot.currency_label("ask", "KRW-ETH") == "ETH"
+    assert snapshot.min_total("bid") is None
+
+
+def test_of_returns_existing_snapshot(raw):
+    snapshot = ChanceSnapshot.parse(raw)
+
+    assert ChanceSnapshot.of(snapshot) is snapshot
+
+
+def test_decode_response_uses_fast_decoder_when_available(mocker):
+    response = httpx.Response(200, json={"market": {"id": "KRW-BTC"}})
+    mocker.patch.object(chance_module, "_fast_loads", return_value=lambda content: {"fast": content})
+
+    assert chance_module.decode_response(response) == {"fast": response.content}
+
+
+def test_decode_response_falls_back_to_json(mocker):
+    response = httpx.Response(200, json={"market": {"id": "KRW-BTC"}})
+    mocker.patch.object(chance_module, "_fast_loads", return_value=None)
+
+    assert chance_module.decode_response(response) == {"market": {"id": "KRW-BTC"}}
@@ -1,11 +1,26 @@
-from types import SimpleNamespace
+import asyncio
+import json
 
+import httpx
 import pytest
 
-from bitthumb_cli import cli
+from bitthumb_cli import catalog, cli, engine
 from bitthumb_cli.config import ApiSettings
 
 
+def _namespace(**overrides):
+    namespace = cli._build_parser().parse_args([])
+    for key, value in overrides.items():
+        setattr(namespace, key, value)
+    return namespace
+
+
+@pytest.fixture(autouse=True)
+def offline_catalog(mocker):
+    # 마켓 목록을 받으러 네트워크에 나가지 않게 한다. None이면 검증 없이 그대로 쓴다.
+    return mocker.patch("bitthumb_cli.catalog.load_catalog", return_value=None)
+
+
 @pytest.fixture
 def settings():
     return ApiSettings(
@@ -21,7 +36,7 @@ def chance():
     return {
         "market": {
             "bid": {"currency": "KRW", "min_total": "5500"},
-            "ask": {"currency": "BTC", "min_total": "0.001"},
+            "ask": {"currency": "BTC", "min_total": "5000"},
         },
         "bid_account": {"available": "7500.5"},
         "ask_account": {"available": "0.015"},
@@ -51,7 +66,7 @@ def test_order_min_total_reads_bid_section(chance):
 
 
 def test_order_min_total_reads_ask_section(chance):
-    assert cli._order_min_total(chance, "ask") == pytest.approx(0.001)
+    assert cli._order_min_total(chance, "ask") == pytest.approx(5000.0)
 
 
 def test_resolve_amount_prefers_guide():
@@ -106,7 +121,7 @@ def test_parse_cli_options_accepts_dry_run_flag():
 
 def test_main_handles_ask_side(mocker, settings, chance):
     parser = mocker.Mock()
-    parser.parse_args.return_value = SimpleNamespace(
+    parser.parse_args.return_value = _namespace(
         market=None,
         side="ask",
         dotenv=None,
@@ -147,7 +162,7 @@ def test_main_handles_ask_side(mocker, settings, chance):
 
 def test_main_converts_value_error_to_cli_error(mocker, settings):
     parser = mocker.Mock()
-    parser.parse_args.return_value = SimpleNamespace(
+    parser.parse_args.return_value = _namespace(
         market=None,
         side="bid",
         dotenv=None,
@@ -198,6 +213,7 @@ def test_build_order_plan_handles_ask_side_currency(settings, chance):
         market="KRW-XRP",
         fallback_amount=6400,
         dry_run=False,
+        price=5_000_000,
     )
 
     assert plan.currency_label == "BTC"
@@ -205,6 +221,18 @@ def test_build_order_plan_handles_ask_side_currency(settings, chance):
     assert plan.dry_run is False
 
 
+def test_build_order_plan_rounds_ask_minimum_up_to_volume_step(chance):
+    plan = cli.build_order_plan(chance=chance, side="ask", market="KRW-BTC", fallback_amount=None, dry_run=True, price=3_000_000)
+
+    # 5000 / 3000000 = 0.0016666…이므로 최소 금액 아래로 내려가지 않게 올린다.
+    assert plan.amount == 0.00166667
+
+
+def test_build_order_plan_requires_price_for_ask_minimum(chance):
+    with pytest.raises(ValueError, match="현재가"):
+        cli.build_order_plan(chance=chance, side="ask", market="KRW-BTC", fallback_amount=None, dry_run=True)
+
+
 def test_build_order_plan_validates_balance(settings, chance):
     chance["bid_account"]["available"] = "1000"
 
@@ -245,3 +273,422 @@ def test_execute_trade_cycle_returns_plan_and_snapshots(mocker, settings, chance
     assert plan.side == "bid"
     assert account_snapshot == chance["bid_account"]
     assert result == {"uuid": "placed"}
+
+
+def test_parse_cli_options_splits_markets():
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC, KRW-XRP,KRW-BTC,"])
+
+    assert options.markets == ("KRW-BTC", "KRW-XRP")
+    assert options.market is None
+
+
+def test_parse_cli_options_rejects_market_and_markets_together():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--market", "KRW-BTC", "--markets", "KRW-XRP"])
+
+
+def test_parse_cli_options_rejects_empty_markets():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--markets", " , "])
+
+
+@pytest.mark.parametrize("extra", [[], ["--dry-run", "--simulate", "snapshots"]])
+def test_parse_cli_options_rejects_output_with_plan(extra):
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--plan", "orders.jsonl", "--output", "jsonl", *extra])
+
+
+def test_parse_cli_options_defaults_output_to_human():
+    assert cli._parse_cli_options(["--plan", "orders.jsonl"])[1].output == "human"
+
+
+def test_parse_cli_options_rejects_non_positive_concurrency():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--markets", "KRW-BTC", "--concurrency", "0"])
+
+
+def test_execute_trade_cycle_async_returns_plan_and_snapshots(mocker, settings, chance):
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance_async", mocker.AsyncMock(return_value=chance))
+    ticker = mocker.patch(
+        "bitthumb_cli.orders.fetch_ticker_prices_async", mocker.AsyncMock(return_value={"KRW-BTC": 5_000_000.0})
+    )
+    mocker.patch(
+        "bitthumb_cli.orders.place_market_order_async",
+        mocker.AsyncMock(return_value={"uuid": "placed"}),
+    )
+
+    config = cli.ExecutionConfig(market="KRW-BTC", side="ask", dry_run=False)
+
+    plan, account_snapshot, result = asyncio.run(
+        cli.execute_trade_cycle_async(client=mocker.Mock(), settings=settings, config=config)
+    )
+
+    assert plan.side == "ask"
+    assert plan.amount == pytest.approx(0.001)
+    assert ticker.await_args.kwargs["markets"] == ["KRW-BTC"]
+    assert account_snapshot == chance["ask_account"]
+    assert result == {"uuid": "placed"}
+
+
+def test_run_markets_collects_failures_without_aborting(mocker, settings, chance):
+    request = httpx.Request("GET", "https://api.test.com/v1/orders/chance")
+
+    async def fake_fetch(*, client, settings, market, **_):
+        if market == "KRW-BAD":
+            raise httpx.HTTPStatusError(
+                "bad", request=request, response=httpx.Response(400, request=request, text="nope")
+            )
+        return chance
+
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance_async", side_effect=fake_fetch)
+    mocker.patch(
+        "bitthumb_cli.orders.place_market_order_async",
+        mocker.AsyncMock(return_value={"uuid": "placed"}),
+    )
+
+    configs = [
+        cli.ExecutionConfig(market=market, side="bid", dry_run=True)
+        for market in ("KRW-BTC", "KRW-BAD", "KRW-XRP")
+    ]
+
+    outcomes = asyncio.run(cli.run_markets(settings=settings, configs=configs, concurrency=2))
+
+    assert [outcome.key for outcome in outcomes] == ["KRW-BTC", "KRW-BAD", "KRW-XRP"]
+    assert [outcome.ok for outcome in outcomes] == [True, False, True]
+    summary = cli.summarize_outcome(outcomes[1])
+    assert summary == {"market": "KRW-BAD", "ok": False, "status_code": 400, "body": "nope"}
+
+
+def test_main_runs_markets_and_exits_on_failure(mocker, settings):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    outcomes = [
+        engine.Outcome(key="KRW-BTC", value=(
+            cli.OrderPlan(
+                market="KRW-BTC",
+                side="bid",
+                amount=5500.0,
+                available=7500.0,
+                currency_label="KRW",
+                dry_run=True,
+            ),
+            {"available": "7500"},
+            {"dry_run": True},
+        )),
+        engine.Outcome(key="KRW-XRP", error=ValueError("bad-data")),
+    ]
+    run_mock = mocker.patch("bitthumb_cli.cli.run_markets", mocker.AsyncMock(return_value=outcomes))
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--markets", "KRW-BTC,KRW-XRP", "--dry-run", "--concurrency", "3"])
+
+    assert excinfo.value.code == 1
+    kwargs = run_mock.call_args.kwargs
+    assert [item.market for item in kwargs["configs"]] == ["KRW-BTC", "KRW-XRP"]
+    assert kwargs["concurrency"] == 3
+
+
+def test_parse_cli_options_reads_loop_flags():
+    _, options = cli._parse_cli_options(
+        ["--repeat", "3", "--interval", "0.5", "--until", "2026-10-20T10:00:00+09:00"]
+    )
+
+    assert options.repeat == 3
+    assert options.interval == 0.5
+    assert options.until.utcoffset().total_seconds() == 9 * 3600
+    assert options.looping is True
+
+
+def test_parse_cli_options_rejects_invalid_until():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--until", "tomorrow"])
+
+
+def test_parse_cli_options_parses_fire_at():
+    _, options = cli._parse_cli_options(["--fire-at", "2026-10-20T10:00:00+09:00", "--arm-lead", "1.5"])
+
+    assert options.fire_at.utcoffset().total_seconds() == 9 * 3600
+    assert options.arm_lead == 1.5
+    assert options.looping is False
+
+
+def test_parse_cli_options_rejects_fire_at_with_repeat():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--fire-at", "2026-10-20T10:00:00+09:00", "--repeat", "2"])
+
+
+def test_parse_cli_options_rejects_repeat_with_markets():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--markets", "KRW-BTC", "--repeat", "2"])
+
+
+def test_run_repeated_cycles_reuses_client(mocker, settings, chance):
+    fetch = mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+    sleep = mocker.patch("bitthumb_cli.cli.time.sleep")
+    client = mocker.Mock()
+
+    config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=True)
+    results = list(
+        cli.run_repeated_cycles(client=client, settings=settings, config=config, repeat=3, interval=0.2)
+    )
+
+    assert len(results) == 3
+    assert all(call.kwargs["client"] is client for call in fetch.call_args_list)
+    assert sleep.call_count == 2
+
+
+def test_run_repeated_cycles_uses_chance_cache(mocker, settings, chance):
+    chance = {**chance, "bid_account": {"balance": "20000"}}
+    fetch = mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    place = mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+    chance_cache = cli.cache.ChanceCache()
+
+    config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+    results = list(
+        cli.run_repeated_cycles(
+            client=mocker.Mock(), settings=settings, config=config, repeat=3, chance_cache=chance_cache
+        )
+    )
+
+    assert fetch.call_count == 1
+    assert place.call_count == 3
+    assert [snapshot["balance"] for _, snapshot, _ in results] == ["20000", "14500", "9000"]
+
+
+def test_failed_order_invalidates_chance_cache(mocker, settings, chance):
+    fetch = mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", side_effect=[RuntimeError("boom"), {"uuid": "ok"}])
+    chance_cache = cli.cache.ChanceCache()
+    config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+
+    with pytest.raises(RuntimeError):
+        cli.execute_trade_cycle(client=mocker.Mock(), settings=settings, config=config, chance_cache=chance_cache)
+    cli.execute_trade_cycle(client=mocker.Mock(), settings=settings, config=config, chance_cache=chance_cache)
+
+    assert fetch.call_count == 2
+
+
+def test_run_repeated_cycles_stops_at_until(mocker, settings, chance):
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+
+    config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=True)
+    past = cli._parse_moment("2000-01-01T00:00:00+00:00")
+
+    results = list(
+        cli.run_repeated_cycles(client=mocker.Mock(), settings=settings, config=config, repeat=None, until=past)
+    )
+
+    assert results == []
+
+
+def test_main_loop_prints_throughput_summary(mocker, settings, chance, capsys):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    client_ctx = mocker.MagicMock()
+    client_cls = mocker.patch("bitthumb_cli.cli.httpx.Client", return_value=client_ctx)
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+
+    cli.main(["--market", "KRW-BTC", "--repeat", "2", "--dry-run"])
+
+    client_cls.assert_called_once()
+    output = capsys.readouterr().out
+    assert "[2회차]" in output
+    assert "[처리량 요약]" in output
+    assert '"cycles": 2' in output
+
+
+def test_main_loop_jsonl_output_writes_one_record_per_cycle(mocker, settings, chance, capsys):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    mocker.patch("bitthumb_cli.cli.httpx.Client", return_value=mocker.MagicMock())
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+
+    cli.main(["--market", "KRW-BTC", "--repeat", "2", "--dry-run", "--output", "jsonl"])
+
+    lines = capsys.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [record["type"] for record in records] == ["cycle", "cycle", "throughput"]
+    assert records[0]["index"] == 1
+    assert records[0]["market"] == "KRW-BTC"
+    assert records[0]["result"] == {"uuid": "placed"}
+    assert {"cycle", "plan"} <= set(records[0]["timings"])
+    assert records[2]["cycles"] == 2
+
+
+def test_main_json_output_prints_single_document(mocker, settings, chance, capsys):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    mocker.patch("bitthumb_cli.cli.httpx.Client", return_value=mocker.MagicMock())
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+
+    cli.main(["--market", "KRW-BTC", "--dry-run", "--output", "json"])
+
+    out = capsys.readouterr().out
+    document = json.loads(out)
+    assert out.count("\n") == 1
+    assert document["cycles"][0]["result"]["dry_run"] is True
+    assert document["cycles"][0]["amount"] == pytest.approx(5500.0)
+
+
+def test_main_quiet_output_prints_nothing(mocker, settings, chance, capsys):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    mocker.patch("bitthumb_cli.cli.httpx.Client", return_value=mocker.MagicMock())
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+
+    cli.main(["--market", "KRW-BTC", "--dry-run", "--output", "quiet"])
+
+    assert capsys.readouterr().out == ""
+
+
+def test_main_writes_cycle_metrics(mocker, settings, chance, tmp_path):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    mocker.patch("bitthumb_cli.cli.httpx.Client", return_value=mocker.MagicMock())
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+    jsonl = tmp_path / "metrics.jsonl"
+    prom = tmp_path / "metrics.prom"
+
+    cli.main([
+        "--market", "KRW-BTC", "--repeat", "2", "--dry-run",
+        "--metrics-out", str(jsonl), "--metrics-prom", str(prom),
+    ])
+
+    records = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert len(records) == 2
+    assert {"load_settings", "plan", "cycle", "connect"} <= set(records[0]["phases"])
+    assert "load_settings" not in records[1]["phases"]
+    assert 'bitthumb_cycles_total{result="ok"} 2' in prom.read_text()
+
+
+def test_execute_trade_cycle_records_phases(settings, chance, mocker):
+    response = mocker.Mock()
+    response.json.return_value = chance
+    client = mocker.Mock()
+    client.get.return_value = response
+    recorder = cli.metrics.Recorder()
+
+    cli.execute_trade_cycle(
+        client=client,
+        settings=settings,
+        config=cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=True),
+        recorder=recorder,
+    )
+
+    assert set(recorder.phases) == {"sign", "chance", "plan"}
+
+
+def test_build_order_plan_uses_amount_override(chance):
+    plan = cli.build_order_plan(
+        chance=chance,
+        side="bid",
+        market="KRW-BTC",
+        fallback_amount=None,
+        dry_run=True,
+        amount=7000,
+    )
+
+    assert plan.amount == 7000
+
+
+def test_build_order_plan_rejects_override_below_minimum(chance):
+    with pytest.raises(ValueError):
+        cli.build_order_plan(
+            chance=chance,
+            side="bid",
+            market="KRW-BTC",
+            fallback_amount=None,
+            dry_run=True,
+            amount=5000,
+        )
+
+
+def test_parse_cli_options_rejects_plan_with_market():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--plan", "orders.jsonl", "--market", "KRW-BTC"])
+
+
+def test_parse_cli_options_requires_plan_for_plan_out():
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--plan-out", "out.jsonl"])
+
+
+def test_main_streams_plan_results(mocker, settings, chance, tmp_path):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    mocker.patch("bitthumb_cli.orders.fetch_order_chance", return_value=chance)
+    place = mocker.patch("bitthumb_cli.orders.place_market_order", return_value={"uuid": "placed"})
+    plan = tmp_path / "orders.jsonl"
+    plan.write_text('{"market": "KRW-BTC", "amount": 6000}\n{"market": "KRW-XRP", "amount": 100}\n')
+    out = tmp_path / "results.jsonl"
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--plan", str(plan), "--plan-out", str(out), "--concurrency", "2"])
+
+    assert excinfo.value.code == 1
+    records = sorted((json.loads(line) for line in out.read_text().splitlines()), key=lambda item: item["line"])
+    assert records[0]["ok"] is True and records[0]["amount"] == 6000
+    assert records[1]["ok"] is False and "최소 주문 금액" in records[1]["error"]
+    place.assert_called_once()
+
+
+def test_main_rejects_unknown_market_before_signing(mocker, settings, offline_catalog, capsys):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    offline_catalog.return_value = catalog.MarketCatalog.build(["KRW-BTC", "KRW-ETH"], 0.0)
+    client_cls = mocker.patch("bitthumb_cli.cli.httpx.Client")
+
+    with pytest.raises(SystemExit):
+        cli.main(["--market", "KRW-BTCC", "--dry-run"])
+
+    assert "KRW-BTC을(를) 의도했나요?" in capsys.readouterr().err
+    # 마켓 목록은 같은 클라이언트로 받지만, 서명된 요청은 하나도 보내지 않는다.
+    client = client_cls.return_value.__enter__.return_value
+    assert offline_catalog.call_args.kwargs["client"] is client
+    client.get.assert_not_called()
+    client.post.assert_not_called()
+
+
+def test_main_expands_market_patterns(mocker, settings, offline_catalog):
+    mocker.patch("bitthumb_cli.cli.config.load_settings", return_value=settings)
+    offline_catalog.return_value = catalog.MarketCatalog.build(["BTC-ETH", "KRW-BTC", "KRW-ETH"], 0.0)
+    run_mock = mocker.patch("bitthumb_cli.cli.run_markets", mocker.AsyncMock(return_value=[]))
+
+    cli.main(["--markets", "KRW-*", "--dry-run"])
+
+    configs = run_mock.await_args.kwargs["configs"]
+    assert [item.market for item in configs] == ["KRW-BTC", "KRW-ETH"]
+
+
+def test_market_patterns_require_catalog():
+    with pytest.raises(ValueError, match="펼칠 수 없습니다"):
+        cli._resolve_markets(None, ("KRW-*",))
+    assert cli._resolve_markets(None, ("KRW-BTC",)) == ("KRW-BTC",)
+
+
+def test_parse_cli_options_single_snapshot_requires_markets():
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC,KRW-ETH", "--single-snapshot"])
+    assert options.single_snapshot is True
+
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--market", "KRW-BTC", "--single-snapshot"])
+
+
+def test_parse_cli_options_validates_adaptive_flags():
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC", "--adaptive", "--max-concurrency", "12"])
+    assert (options.adaptive, options.max_concurrency) == (True, 12)
+
+    for argv in (
+        ["--market", "KRW-BTC", "--adaptive"],
+        ["--markets", "KRW-BTC", "--max-concurrency", "12"],
+        ["--markets", "KRW-BTC", "--adaptive", "--concurrency", "8", "--max-concurrency", "4"],
+    ):
+        with pytest.raises(SystemExit):
+            cli._parse_cli_options(argv)
+
+
+def test_adaptive_limit_is_exposed_as_gauge(tmp_path):
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC", "--adaptive", "--concurrency", "3"])
+    sink = cli.metrics.MetricsSink(prom_path=tmp_path / "bitthumb.prom")
+
+    limit = cli.adaptive_limit_for(options, sink)
+
+    assert (limit.current, limit.maximum) == (3, 3 * cli.ADAPTIVE_HEADROOM)
+    assert "bitthumb_concurrency_limit 3" in sink.render_prometheus()
@@ -60,3 +60,97 @@ def test_coerce_fallback_validates(monkeypatch, tmp_path):
 
     with pytest.raises(ValueError):
         config.load_settings(env_file)
+
+
+def _clear_env(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("BITTHUMB_"):
+            monkeypatch.delenv(name)
+
+
+def test_load_settings_reads_pool_limits(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join(
+            [
+                "BITTHUMB_ACCESS_KEY=foo",
+                "BITTHUMB_SECRET_KEY=bar",
+                "BITTHUMB_MAX_CONNECTIONS=3",
+                "BITTHUMB_MAX_KEEPALIVE=2",
+                "BITTHUMB_KEEPALIVE_EXPIRY=60",
+            ]
+        )
+    )
+    _clear_env(monkeypatch)
+
+    settings = config.load_settings(env_file)
+
+    assert settings.max_connections == 3
+    assert settings.max_keepalive_connections == 2
+    assert settings.keepalive_expiry == 60
+
+
+def test_load_settings_rejects_invalid_pool_limit(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_MAX_CONNECTIONS=0")
+    _clear_env(monkeypatch)
+
+    with pytest.raises(ValueError):
+        config.load_settings(env_file)
+
+
+def test_load_settings_keepalive_expiry_keeps_zero_and_rejects_negative(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    env_file = tmp_path / ".env"
+    env_file.write_text("BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_KEEPALIVE_EXPIRY=0")
+
+    assert config.load_settings(env_file).keepalive_expiry == 0
+
+    env_file.write_text("BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_KEEPALIVE_EXPIRY=-1")
+    with pytest.raises(ValueError, match="BITTHUMB_KEEPALIVE_EXPIRY"):
+        config.load_settings(env_file)
+
+
+def test_load_settings_reads_rate_limits(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_QUERY_RPS=15\nBITTHUMB_ORDER_RPS=2.5"
+    )
+
+    settings = config.load_settings(env_file)
+
+    assert settings.query_rate_limit == 15
+    assert settings.order_rate_limit == 2.5
+
+
+def test_load_settings_rejects_non_positive_rate_limit(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    env_file = tmp_path / ".env"
+    env_file.write_text("BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_ORDER_RPS=0")
+
+    with pytest.raises(ValueError):
+        config.load_settings(env_file)
+
+
+def test_load_settings_reads_chance_cache_ttls(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\n"
+        "BITTHUMB_CHANCE_MARKET_TTL=60\nBITTHUMB_CHANCE_ACCOUNT_TTL=0"
+    )
+
+    settings = config.load_settings(env_file)
+
+    assert settings.chance_market_ttl == 60
+    assert settings.chance_account_ttl == 0
+
+
+def test_load_settings_rejects_invalid_hedge_percentile(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    env_file = tmp_path / ".env"
+    env_file.write_text("BITTHUMB_ACCESS_KEY=foo\nBITTHUMB_SECRET_KEY=bar\nBITTHUMB_HEDGE_PERCENTILE=95")
+
+    with pytest.raises(ValueError):
+        config.load_settings(env_file)
@@ -0,0 +1,159 @@
+import json
+import os
+from decimal import Decimal
+
+import pytest
+
+from bitthumb_cli import catalog, cli, config, daemon, standin
+
+
+@pytest.fixture
+def exchange_server():
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("20000")})}
+    instance = standin.build_server(accounts=accounts, prices={"KRW-BTC": "100000000"})
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+@pytest.fixture
+def service(exchange_server):
+    settings = config.ApiSettings(base_url=exchange_server.base_url, access_key="ak", secret_key="sk")
+    instance = daemon.TradeService(settings, concurrency=2)
+    yield instance
+    instance.close()
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "d.sock")
+
+
+@pytest.fixture
+def unix_server(service, socket_path):
+    server = daemon.build_server(service, socket_path=socket_path)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_trade_over_unix_socket(exchange_server, unix_server, socket_path):
+    responses = daemon.request(
+        [
+            {"op": "ping"},
+            {"id": "t1", "market": "KRW-BTC", "side": "bid"},
+            {"id": "t2", "market": "KRW-BTC", "side": "bid", "amount": 6000, "dry_run": True},
+        ],
+        socket_path=socket_path,
+    )
+
+    assert responses[0] == {"ok": True, "op": "ping"}
+    assert responses[1]["id"] == "t1"
+    assert responses[1]["ok"] is True
+    assert responses[1]["result"]["state"] == "wait"
+    assert "cycle" in responses[1]["timings"]
+    assert responses[2]["result"]["dry_run"] is True
+    assert responses[2]["amount"] == 6000
+    balances = exchange_server.exchange.accounts["ak"].balances
+    assert balances["KRW"] == Decimal("20000") - Decimal("5000") * Decimal("1.0025")
+
+
+def test_invalid_requests_return_errors(unix_server, socket_path):
+    responses = daemon.request(
+        [{"op": "nope"}, {"side": "bid"}, {"market": "KRW-BTC", "amount": 1}],
+        socket_path=socket_path,
+    )
+
+    assert [response["ok"] for response in responses] == [False, False, False]
+    assert "market" in responses[1]["error"]
+    assert responses[2]["market"] == "KRW-BTC"
+
+
+@pytest.mark.parametrize("dry_run", ["false", "true", 1, None])
+def test_non_bool_dry_run_is_rejected(exchange_server, dry_run):
+    settings = config.ApiSettings(base_url=exchange_server.base_url, access_key="ak", secret_key="sk")
+    instance = daemon.TradeService(settings)
+    try:
+        response = instance.handle({"id": "t1", "market": "KRW-BTC", "dry_run": dry_run})
+    finally:
+        instance.close()
+
+    assert response == {"id": "t1", "ok": False, "error": "dry_run은 true 또는 false여야 합니다."}
+    assert exchange_server.exchange.orders == {}
+
+
+def test_unknown_market_is_rejected_before_signing(exchange_server):
+    settings = config.ApiSettings(base_url=exchange_server.base_url, access_key="ak", secret_key="sk")
+    known = catalog.MarketCatalog.build(["KRW-BTC"], 0.0)
+    instance = daemon.TradeService(settings, market_catalog=known)
+    try:
+        response = instance.handle({"id": "t1", "market": "KRW-BTCC"})
+    finally:
+        instance.close()
+
+    assert response["ok"] is False
+    assert "KRW-BTC을(를) 의도했나요?" in response["error"]
+    assert exchange_server.exchange.orders == {}
+
+
+def test_stats_reports_cycles(unix_server, socket_path):
+    daemon.request([{"market": "KRW-BTC", "dry_run": True}], socket_path=socket_path)
+
+    (stats,) = daemon.request([{"op": "stats"}], socket_path=socket_path)
+
+    assert stats["cycles"] == 1
+    assert stats["requests"] == 1
+
+
+def test_stale_socket_is_replaced_but_live_one_is_not(service, socket_path):
+    first = daemon.build_server(service, socket_path=socket_path)
+    first.start()
+    try:
+        with pytest.raises(ValueError):
+            daemon.build_server(service, socket_path=socket_path)
+    finally:
+        first.shutdown()
+        first.socket.close()
+
+    second = daemon.build_server(service, socket_path=socket_path)
+    second.server_close()
+
+
+def test_tcp_listen_requires_loopback_and_token(service):
+    with pytest.raises(ValueError):
+        daemon.build_server(service, listen="0.0.0.0:0", token="secret")
+    with pytest.raises(ValueError, match="토큰"):
+        daemon.build_server(service, listen="127.0.0.1:0")
+
+    server = daemon.build_server(service, listen="127.0.0.1:0", token="secret")
+    server.start()
+    try:
+        host, port = server.server_address[:2]
+        address = f"{host}:{port}"
+        (missing,) = daemon.request([{"op": "ping"}], listen=address)
+        (wrong,) = daemon.request([{"op": "ping"}], listen=address, token="guess")
+        (response,) = daemon.request([{"op": "ping"}], listen=address, token="secret")
+    finally:
+        server.stop()
+
+    assert missing["ok"] is False and "토큰" in missing["error"]
+    assert wrong["ok"] is False
+    assert response == {"ok": True, "op": "ping"}
+
+
+def test_token_file_is_private(tmp_path):
+    path = str(tmp_path / "d.token")
+
+    token = daemon.write_token(path)
+
+    assert daemon.read_token(path) == token
+    assert os.stat(path).st_mode & 0o777 == 0o600
+    assert daemon.write_token(path) != token
+
+
+def test_cli_call_prints_response(unix_server, socket_path, capsys):
+    cli.main(["call", "--socket", socket_path, "--market", "KRW-BTC", "--dry-run"])
+
+    response = json.loads(capsys.readouterr().out)
+    assert response["ok"] is True
+    assert response["result"]["dry_run"] is True
@@ -0,0 +1,170 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bitthumb_cli import engine
+
+
+def test_run_bounded_preserves_order_and_collects_errors():
+    async def worker(key):
+        if key == 2:
+            raise ValueError("boom")
+        await asyncio.sleep(0.001 * (5 - key))
+        return key * 10
+
+    outcomes = asyncio.run(engine.run_bounded(range(5), worker, concurrency=2))
+
+    assert [outcome.key for outcome in outcomes] == [0, 1, 2, 3, 4]
+    assert [outcome.value for outcome in outcomes] == [0, 10, None, 30, 40]
+    assert not outcomes[2].ok
+    assert str(outcomes[2].error) == "boom"
+
+
+def test_run_bounded_limits_in_flight_workers():
+    in_flight = 0
+    peak = 0
+
+    async def worker(key):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return key
+
+    asyncio.run(engine.run_bounded(range(10), worker, concurrency=3))
+
+    assert peak == 3
+
+
+def test_run_bounded_rejects_invalid_concurrency():
+    async def worker(key):
+        return key
+
+    with pytest.raises(ValueError):
+        asyncio.run(engine.run_bounded([1], worker, concurrency=0))
+
+
+def test_stream_threaded_pulls_items_lazily():
+    pulled = []
+
+    def items():
+        for index in range(20):
+            pulled.append(index)
+            yield index
+
+    stream = engine.stream_threaded(items(), lambda key: key * 2, concurrency=3)
+    first = next(stream)
+
+    assert first.ok
+    assert len(pulled) <= 4
+
+    rest = list(stream)
+    assert sorted(outcome.value for outcome in [first, *rest]) == [index * 2 for index in range(20)]
+
+
+def test_stream_threaded_collects_errors():
+    def worker(key):
+        if key % 2:
+            raise ValueError(f"odd {key}")
+        return key
+
+    outcomes = {outcome.key: outcome for outcome in engine.stream_threaded(range(6), worker, concurrency=2)}
+
+    assert [outcomes[key].ok for key in range(6)] == [True, False, True, False, True, False]
+    assert str(outcomes[3].error) == "odd 3"
+
+
+def _status_error(status):
+    request = httpx.Request("GET", "https://api.test.com/v1/orders/chance")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_adaptive_limit_grows_while_latency_is_flat():
+    clock = _Clock()
+    changes = []
+    limit = engine.AdaptiveLimit(initial=2, maximum=4, clock=clock, on_change=changes.append)
+
+    for _ in range(10):
+        started = limit.started()
+        clock.now += 0.1
+        limit.observe(started)
+
+    assert limit.current == 4
+    assert changes == [2, 3, 4]
+
+
+def test_adaptive_limit_holds_when_latency_rises():
+    clock = _Clock()
+    limit = engine.AdaptiveLimit(initial=2, maximum=8, clock=clock)
+    limit.observe(clock.now - 0.1)
+
+    for _ in range(10):
+        started = limit.started()
+        clock.now += 0.5
+        limit.observe(started)
+
+    assert limit.current == 2
+
+
+def test_adaptive_limit_cuts_once_per_overload_burst():
+    clock = _Clock()
+    limit = engine.AdaptiveLimit(initial=8, maximum=8, clock=clock)
+    burst = [limit.started() for _ in range(3)]
+    clock.now += 0.1
+
+    for started in burst:
+        limit.observe(started, _status_error(429))
+    limit.observe(limit.started(), ValueError("잔고 부족"))
+
+    assert limit.current == 4
+    limit.observe(limit.started(), _status_error(503))
+    assert limit.current == 2
+    assert limit.stats()["cuts"] == 2
+
+
+def test_run_bounded_follows_adaptive_limit():
+    limit = engine.AdaptiveLimit(initial=4, maximum=4, clock=_Clock())
+    in_flight = 0
+    peaks = []
+
+    async def worker(key):
+        nonlocal in_flight
+        in_flight += 1
+        peaks.append(in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if key == 0:
+            raise _status_error(429)
+        return key
+
+    outcomes = asyncio.run(engine.run_bounded(range(12), worker, concurrency=1, limit=limit))
+
+    assert [outcome.ok for outcome in outcomes] == [False] + [True] * 11
+    assert max(peaks) == 4
+    assert limit.stats()["cuts"] == 1
+
+
+def test_stream_threaded_follows_adaptive_limit():
+    # 시계가 멈춰 있으면 지연이 늘 최솟값이므로 성공할 때마다 한도가 오른다.
+    limit = engine.AdaptiveLimit(initial=1, maximum=3, clock=_Clock())
+
+    def worker(key):
+        if key == 3:
+            raise _status_error(500)
+        return key
+
+    outcomes = list(engine.stream_threaded(range(8), worker, concurrency=1, limit=limit))
+
+    assert sorted(outcome.key for outcome in outcomes) == list(range(8))
+    assert limit.stats()["cuts"] == 1
+    assert limit.stats()["peak"] == 3
@@ -0,0 +1,144 @@
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from bitthumb_cli import cli, config, fills, metrics, orders, standin, transport
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def settings():
+    return config.ApiSettings(base_url="https://api.test.com", access_key="ak", secret_key="sk")
+
+
+def _order(uuid, state, volume="0.001", funds="5000"):
+    return {"uuid": uuid, "state": state, "executed_volume": volume, "executed_funds": funds, "paid_fee": "12.5"}
+
+
+def test_parse_fill_computes_average_price():
+    fill = fills.parse_fill(_order("a", "done"))
+
+    assert fill.settled
+    assert fill.as_record() == {
+        "state": "done",
+        "volume": 0.001,
+        "funds": 5000.0,
+        "avg_price": pytest.approx(5_000_000.0),
+        "paid_fee": 12.5,
+    }
+
+
+def test_parse_fill_sums_trades_without_executed_funds():
+    order = {"uuid": "a", "state": "done", "executed_volume": "2", "trades": [{"funds": "10"}, {"funds": "30"}]}
+
+    assert fills.parse_fill(order).avg_price == 20.0
+
+
+def test_polling_backs_off_until_progress(mocker, settings):
+    clock = _Clock()
+    mocker.patch(
+        "bitthumb_cli.orders.list_orders",
+        side_effect=[
+            [_order("a", "wait"), _order("b", "wait")],
+            [_order("a", "wait"), _order("b", "wait")],
+            [_order("a", "done"), _order("b", "wait")],
+            [_order("b", "done")],
+        ],
+    )
+
+    found = fills.confirm_fills(
+        client=mocker.Mock(), settings=settings, uuids=["a", "b"], interval=0.1, clock=clock, sleep=clock.sleep
+    )
+
+    assert clock.sleeps == [0.1, 0.2, 0.1]
+    assert {uuid: fill.state for uuid, fill in found.items()} == {"a": "done", "b": "done"}
+    assert orders.list_orders.call_args.kwargs["uuids"] == ["b"]
+
+
+def test_polling_stops_at_deadline(mocker, settings):
+    clock = _Clock()
+    mocker.patch("bitthumb_cli.orders.list_orders", return_value=[_order("a", "wait")])
+
+    found = fills.confirm_fills(
+        client=mocker.Mock(), settings=settings, uuids=["a"], deadline=1.0, interval=0.3,
+        max_interval=0.5, clock=clock, sleep=clock.sleep,
+    )
+
+    assert clock.sleeps == [0.3, 0.5, pytest.approx(0.2)]
+    assert found["a"].state == "wait"
+
+
+def test_lookups_are_grouped_into_bulk_queries(mocker, settings):
+    uuids = [f"u{index}" for index in range(250)]
+    lookup = mocker.patch(
+        "bitthumb_cli.orders.list_orders",
+        side_effect=lambda **kwargs: [_order(uuid, "done") for uuid in kwargs["uuids"]],
+    )
+
+    found = fills.confirm_fills(client=mocker.Mock(), settings=settings, uuids=uuids, sleep=lambda _: None)
+
+    assert [len(call.kwargs["uuids"]) for call in lookup.call_args_list] == [100, 100, 50]
+    assert all(fill.settled for fill in found.values())
+
+
+def test_plan_results_carry_fills_from_standin(tmp_path):
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("100000")})}
+    server = standin.build_server(accounts=accounts, prices={"KRW-BTC": "100000000", "KRW-ETH": "5000000"})
+    server.start()
+    try:
+        settings = config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+        paths = []
+        configs = [cli.ExecutionConfig(market=market, side="bid", dry_run=False) for market in ("KRW-BTC", "KRW-ETH")]
+        with httpx.Client(event_hooks={"request": [lambda request: paths.append(request.url.path)]}) as client:
+            outcomes = cli.run_snapshot_markets(client=client, settings=settings, configs=configs, concurrency=2)
+            records = [cli.summarize_outcome(outcome) for outcome in outcomes]
+            paths.clear()
+            cli.attach_fills(client=client, settings=settings, records=records, deadline=1.0)
+    finally:
+        server.stop()
+
+    assert paths == ["/v1/orders"]
+    assert [record["fill"]["state"] for record in records] == ["done", "done"]
+    assert records[0]["fill"]["avg_price"] == pytest.approx(100_000_000.0)
+    assert records[1]["fill"]["volume"] == pytest.approx(0.001)
+
+
+def test_confirm_fills_flag():
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC,KRW-ETH", "--confirm-fills"])
+    _, timed = cli._parse_cli_options(["--plan", "plan.jsonl", "--confirm-fills", "3"])
+
+    assert options.confirm_fills == fills.DEFAULT_DEADLINE
+    assert timed.confirm_fills == 3.0
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--market", "KRW-BTC", "--confirm-fills", "--dry-run"])
+
+
+def test_run_markets_confirms_fills_through_shared_rate_limiter(mocker):
+    settings = config.ApiSettings(base_url="http://test", access_key="ak", secret_key="sk")
+    _, options = cli._parse_cli_options(["--markets", "KRW-BTC,KRW-ETH", "--confirm-fills", "1"])
+    run = mocker.patch("bitthumb_cli.cli.run_markets", new=mocker.AsyncMock(return_value=[]))
+    attach = mocker.patch("bitthumb_cli.cli.attach_fills")
+    load = mocker.patch("bitthumb_cli.catalog.load_catalog", return_value=None)
+    pool = mocker.spy(transport, "pool_limits")
+
+    cli._run_markets(mocker.Mock(), options, settings, metrics.NULL_SINK, mocker.Mock())
+
+    limiter = run.call_args.kwargs["limiter"]
+    client = attach.call_args.kwargs["client"]
+    # 마켓 목록도 같은 클라이언트로 받는다.
+    assert load.call_args.kwargs["client"] is client
+    assert client.event_hooks["request"] == limiter.event_hooks()["request"]
+    pool.assert_called_once_with(settings)
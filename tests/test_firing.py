@@ -0,0 +1,50 @@
+import pytest
+
+from bitthumb_cli import firing
+
+
+class _FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_wait_until_sleeps_in_chunks_then_spins():
+    clock = _FakeClock(100.0)
+    calls = []
+
+    def time_source():
+        # 바쁜 대기 구간에서도 시간이 흐르도록 호출마다 조금씩 앞당긴다.
+        calls.append(clock.now)
+        clock.now += 0.0005
+        return clock.now
+
+    woke = firing.wait_until(102.5, clock=time_source, sleep=clock.sleep)
+
+    assert woke >= 102.5
+    assert clock.sleeps[:2] == [1.0, 1.0]
+    assert all(seconds <= 1.0 for seconds in clock.sleeps)
+    assert len(calls) > len(clock.sleeps) + 1
+
+
+def test_wait_until_returns_immediately_for_past_target():
+    clock = _FakeClock(100.0)
+
+    assert firing.wait_until(99.0, clock=clock, sleep=clock.sleep) == 100.0
+    assert clock.sleeps == []
+
+
+def test_timing_report_in_milliseconds():
+    report = firing.timing_report(target_ts=10.0, armed_at=7.0, sent_at=10.0015, done_at=10.0415)
+
+    assert report["armed_lead_ms"] == 3000.0
+    assert report["send_delay_ms"] == pytest.approx(1.5)
+    assert report["response_ms"] == pytest.approx(40.0)
+    assert report["target"] == "1970-01-01T00:00:10.000000+00:00"
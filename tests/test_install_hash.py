@@ -0,0 +1,35 @@
+import runpy
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "install_hash.py"
+project_hash = runpy.run_path(str(SCRIPT))["project_hash"]
+
+
+def _project(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'pkg'\n")
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("VALUE = 1\n")
+    return tmp_path
+
+
+def test_hash_ignores_build_artifacts(tmp_path):
+    root = _project(tmp_path)
+    before = project_hash(root)
+
+    (root / "src" / "pkg" / "__pycache__").mkdir()
+    (root / "src" / "pkg" / "__pycache__" / "__init__.cpython-311.pyc").write_bytes(b"\0")
+    (root / "src" / "pkg.egg-info").mkdir()
+    (root / "src" / "pkg.egg-info" / "PKG-INFO").write_text("Name: pkg\n")
+
+    assert project_hash(root) == before
+
+
+def test_hash_changes_with_sources_and_pyproject(tmp_path):
+    root = _project(tmp_path)
+    first = project_hash(root)
+
+    (root / "src" / "pkg" / "__init__.py").write_text("VALUE = 2\n")
+    second = project_hash(root)
+    (root / "pyproject.toml").write_text("[project]\nname = 'pkg'\nversion = '2'\n")
+
+    assert len({first, second, project_hash(root)}) == 3
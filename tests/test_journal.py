@@ -0,0 +1,214 @@
+import threading
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from bitthumb_cli import batch, cli, config, journal, orders, standin
+
+
+def _payload(market="KRW-BTC", price="5000"):
+    return {"market": market, "side": "bid", "ord_type": "price", "price": price}
+
+
+def test_intents_share_group_commits(tmp_path):
+    plan = tmp_path / "plan.txt"
+    with journal.Journal(tmp_path / "j.db", plan=plan) as log:
+        threads = [
+            threading.Thread(target=log.record_intent, args=(line, "KRW-BTC", "bid", 5000.0, _payload()))
+            for line in range(1, 21)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        log.record_result(1, "KRW-BTC", "bid", 5000.0, {"uuid": "u1"})
+
+    with journal.Journal(tmp_path / "j.db", plan=plan) as log:
+        entries = log.entries()
+        assert log.stats() == {"writes": 0, "commits": 0}
+
+    assert len(entries) == 20
+    assert entries[1].state == journal.DONE
+    assert entries[1].result == {"uuid": "u1"}
+    assert entries[1].payload == _payload()
+    assert entries[2].state == journal.INTENT
+
+
+def test_journal_is_bound_to_plan(tmp_path):
+    journal.Journal(tmp_path / "j.db", plan=tmp_path / "a.txt").close()
+
+    with pytest.raises(ValueError, match="다른 주문 계획"):
+        journal.Journal(tmp_path / "j.db", plan=tmp_path / "b.txt")
+
+
+def test_ambiguous_failure_after_intent_stays_pending(tmp_path):
+    request = httpx.Request("POST", "http://test/v1/orders")
+    server_error = httpx.HTTPStatusError("boom", request=request, response=httpx.Response(502, request=request))
+    with journal.Journal(tmp_path / "j.db", plan=tmp_path / "plan.txt") as log:
+        log.record_intent(1, "KRW-BTC", "bid", None, _payload())
+        log.record_failure(1, "KRW-BTC", "bid", None, server_error)
+        log.record_intent(2, "KRW-BTC", "bid", None, _payload())
+        log.record_failure(2, "KRW-BTC", "bid", None, httpx.ConnectError("refused", request=request))
+        log.record_failure(3, "KRW-ETH", "bid", None, server_error)
+    with journal.Journal(tmp_path / "j.db", plan=tmp_path / "plan.txt") as log:
+        entries = log.entries()
+
+    assert entries[1].state == journal.INTENT
+    assert entries[2].state == journal.FAILED
+    # 의도를 남기기 전에 실패했으면 주문은 나가지 않았다.
+    assert entries[3].state == journal.FAILED
+
+
+def test_reconcile_matches_orders_after_intent():
+    entries = [
+        journal.Entry(line=1, market="KRW-BTC", side="bid", amount=None, state=journal.INTENT,
+                      payload=_payload(), intent_at=1_700_000_000.0),
+        journal.Entry(line=2, market="KRW-BTC", side="bid", amount=None, state=journal.INTENT,
+                      payload=_payload(), intent_at=1_700_000_100.0),
+    ]
+    placed = [
+        {"uuid": "old", "market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "5000",
+         "created_at": "2023-11-14T22:00:00+00:00"},
+        {"uuid": "new", "market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "5000.0",
+         "created_at": "2023-11-14T22:13:21+00:00"},
+        {"uuid": "other", "market": "KRW-ETH", "side": "bid", "ord_type": "price", "price": "5000",
+         "created_at": "2023-11-14T22:13:21+00:00"},
+    ]
+
+    matched = journal.reconcile(entries, placed)
+
+    assert {line: order["uuid"] for line, order in matched.items()} == {1: "new"}
+
+
+@pytest.fixture
+def server():
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("100000")})}
+    instance = standin.build_server(accounts=accounts, prices={"KRW-BTC": "100000000", "KRW-ETH": "5000000"})
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def test_resume_skips_done_rows_and_confirms_sent_intents(server, tmp_path):
+    settings = config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+    plan_path = tmp_path / "plan.txt"
+    plan_path.write_text(
+        '{"market": "KRW-BTC", "amount": 5000}\n{"market": "KRW-ETH", "amount": 6000}\n{"market": "KRW-BTC", "amount": 7000}\n',
+        encoding="utf-8",
+    )
+    with httpx.Client() as client:
+        # 1행은 끝났고, 2행은 주문이 나갔지만 결과를 남기기 전에 죽은 상황
+        sent = orders.place_market_order(
+            client=client, settings=settings, market="KRW-ETH", amount=6000, side="bid", dry_run=False
+        )
+        with journal.Journal(tmp_path / "j.db", plan=plan_path) as log:
+            log.record_result(1, "KRW-BTC", "bid", 5000.0, {"uuid": "first"})
+            payload = orders.build_order_payload(market="KRW-ETH", amount=6000, side="bid")
+            log.record_intent(2, "KRW-ETH", "bid", 6000.0, payload)
+
+        with journal.Journal(tmp_path / "j.db", plan=plan_path) as log:
+            with pytest.raises(ValueError, match="--resume"):
+                cli.resume_plan(client=client, settings=settings, order_journal=log, resume=False)
+            completed = cli.resume_plan(client=client, settings=settings, order_journal=log, resume=True)
+            records = []
+
+            class _Writer:
+                def write(self, record):
+                    records.append(record)
+
+            rows = list(cli._pending_rows(batch.read_plan(plan_path), completed, _Writer()))
+            outcomes = list(
+                cli.run_plan(client=client, settings=settings, rows=rows, dry_run=False, concurrency=2, order_journal=log)
+            )
+        with journal.Journal(tmp_path / "j.db", plan=plan_path) as log:
+            entries = log.entries()
+
+    assert sorted(completed) == [1, 2]
+    assert completed[2].result["uuid"] == sent["uuid"]
+    assert [record["line"] for record in records] == [1, 2]
+    assert all(record["resumed"] for record in records)
+    assert [row.line for row in rows] == [3]
+    assert [outcome.ok for outcome in outcomes] == [True]
+    # 2행 주문은 다시 보내지 않는다.
+    assert len(server.exchange.orders) == 2
+    assert {line: entry.state for line, entry in entries.items()} == {1: "done", 2: "done", 3: "done"}
+
+
+def test_journal_flags():
+    _, options = cli._parse_cli_options(["--plan", "plan.txt", "--journal", "j.db", "--resume"])
+
+    assert options.journal == "j.db"
+    assert options.resume
+
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--plan", "plan.txt", "--journal", "j.db", "--dry-run"])
+    with pytest.raises(SystemExit):
+        cli._parse_cli_options(["--plan", "plan.txt", "--resume"])
+
+
+def test_reconcile_prefers_client_identifier():
+    entry = journal.Entry(line=1, market="KRW-BTC", side="bid", amount=None, state=journal.INTENT,
+                          payload={**_payload(), "identifier": "b"}, intent_at=1_700_000_000.0)
+    placed = [
+        {"uuid": "same-amount", "identifier": "a", "market": "KRW-BTC", "side": "bid", "ord_type": "price",
+         "price": "5000", "created_at": "2023-11-14T22:13:21+00:00"},
+        {"uuid": "mine", "identifier": "b", "market": "KRW-BTC", "side": "bid", "ord_type": "price",
+         "price": "5000", "created_at": "2023-11-14T22:13:25+00:00"},
+    ]
+
+    assert journal.reconcile([entry], placed)[1]["uuid"] == "mine"
+
+
+def _intent(line, identifier=None, intent_at=1_700_000_000.0):
+    payload = {**_payload(), "identifier": identifier} if identifier else _payload()
+    return journal.Entry(line=line, market="KRW-BTC", side="bid", amount=None, state=journal.INTENT,
+                         payload=payload, intent_at=intent_at)
+
+
+def test_resume_chunks_identifier_lookups(mocker, tmp_path):
+    settings = config.ApiSettings(base_url="http://test", access_key="ak", secret_key="sk")
+    log = mocker.Mock()
+    log.entries.return_value = {line: _intent(line, identifier=f"id-{line}") for line in range(1, 251)}
+    lookup = mocker.patch(
+        "bitthumb_cli.orders.list_orders",
+        side_effect=lambda identifiers, **_: [{"uuid": f"u-{value}", "identifier": value} for value in identifiers],
+    )
+    paged = mocker.patch("bitthumb_cli.orders.list_orders_since")
+
+    completed = cli.resume_plan(client=mocker.Mock(), settings=settings, order_journal=log, resume=True)
+
+    assert [len(call.kwargs["identifiers"]) for call in lookup.call_args_list] == [100, 100, 50]
+    assert all(call.kwargs["limit"] <= orders.LIST_LIMIT for call in lookup.call_args_list)
+    assert not paged.called
+    assert len(completed) == 250
+    assert completed[250].result["uuid"] == "u-id-250"
+
+
+def test_resume_pages_back_to_earliest_intent_without_identifier():
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("1000000")})}
+    server = standin.build_server(accounts=accounts, prices={"KRW-BTC": "100000000", "KRW-ETH": "5000000"})
+    server.start()
+    settings = config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+    try:
+        with httpx.Client() as client:
+            first = orders.place_market_order(
+                client=client, settings=settings, market="KRW-BTC", amount=5000, side="bid", dry_run=False
+            )
+            for _ in range(orders.LIST_LIMIT + 20):
+                server.exchange.place("ak", {"market": "KRW-ETH", "side": "bid", "ord_type": "price", "price": "5000"})
+            intent_at = orders.created_at(first)
+            placed = orders.list_orders_since(client=client, settings=settings, since=intent_at - 1)
+    finally:
+        server.stop()
+
+    assert len(placed) == orders.LIST_LIMIT + 21
+    assert placed[-1]["uuid"] == first["uuid"]
+    assert journal.reconcile([_intent(1, intent_at=intent_at)], placed)[1]["uuid"] == first["uuid"]
+
+
+def test_list_orders_rejects_limit_above_exchange_cap(mocker):
+    settings = config.ApiSettings(base_url="http://test", access_key="ak", secret_key="sk")
+
+    with pytest.raises(ValueError, match="limit"):
+        orders.list_orders(client=mocker.Mock(), settings=settings, limit=orders.LIST_LIMIT + 1)
@@ -0,0 +1,69 @@
+import json
+
+from bitthumb_cli import metrics
+
+
+def test_recorder_accumulates_repeated_phases(mocker):
+    mocker.patch("bitthumb_cli.metrics.time.perf_counter", side_effect=[0.0, 0.5, 1.0, 1.25])
+    recorder = metrics.Recorder()
+
+    with recorder.phase("sign"):
+        pass
+    with recorder.phase("sign"):
+        pass
+
+    assert recorder.phases == {"sign": 0.75}
+
+
+def test_null_recorder_reuses_shared_phase():
+    recorder = metrics.NULL_RECORDER
+
+    assert recorder.phase("sign") is recorder.phase("order")
+    with recorder.phase("sign"):
+        recorder.add("sign", 1.0)
+    assert dict(recorder.phases) == {}
+
+
+def test_disabled_sink_hands_out_null_recorder():
+    sink = metrics.MetricsSink()
+
+    assert sink.enabled is False
+    assert sink.recorder() is metrics.NULL_RECORDER
+
+
+def test_histogram_uses_cumulative_buckets():
+    histogram = metrics.Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [2, 3]
+    assert histogram.count == 4
+
+
+def test_sink_writes_jsonl_and_prometheus(tmp_path):
+    jsonl = tmp_path / "cycles.jsonl"
+    prom = tmp_path / "bitthumb.prom"
+
+    with metrics.MetricsSink(jsonl_path=jsonl, prom_path=prom, buckets=(0.01, 0.1)) as sink:
+        sink.add_startup_phase("load_settings", 0.02)
+        first = sink.recorder()
+        first.add("chance", 0.005)
+        sink.record_cycle(first, market="KRW-BTC", side="bid", dry_run=True)
+        second = sink.recorder()
+        second.add("chance", 0.05)
+        sink.record_cycle(second, market="KRW-BTC", side="bid", dry_run=True, error={"error": "bad"})
+        sink.set_gauge("concurrency_limit", 4)
+
+    lines = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert lines[0]["phases"] == {"load_settings": 0.02, "chance": 0.005}
+    assert lines[0]["ok"] is True
+    assert lines[1]["phases"] == {"chance": 0.05}
+    assert lines[1]["error"] == {"error": "bad"}
+
+    text = prom.read_text()
+    assert 'bitthumb_phase_seconds_bucket{phase="chance",le="0.01"} 1' in text
+    assert 'bitthumb_phase_seconds_bucket{phase="chance",le="+Inf"} 2' in text
+    assert 'bitthumb_phase_seconds_count{phase="load_settings"} 1' in text
+    assert 'bitthumb_cycles_total{result="error"} 1' in text
+    assert "bitthumb_concurrency_limit 4" in text
+    assert not list(tmp_path.glob(".*.tmp"))
@@ -1,6 +1,9 @@
+import asyncio
+
+import jwt
 import pytest
 
-from bitthumb_cli import config, orders
+from bitthumb_cli import auth, config, orders
 
 
 @pytest.fixture
@@ -14,7 +17,7 @@ def settings():
 
 def test_fetch_order_chance_calls_endpoint(mocker, settings):
     token = "signed-token"
-    mocker.patch("bitthumb_cli.auth.generate_jwt", return_value=token)
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value=token)
 
     mock_response = mocker.Mock()
     mock_response.json.return_value = {"status": "0000"}
@@ -35,7 +38,7 @@ def test_fetch_order_chance_calls_endpoint(mocker, settings):
 
 
 def test_place_market_order_posts_json_for_bid(mocker, settings):
-    mocker.patch("bitthumb_cli.auth.generate_jwt", return_value="token")
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value="token")
 
     mock_response = mocker.Mock()
     mock_response.json.return_value = {"uuid": "order"}
@@ -51,6 +54,7 @@ def test_place_market_order_posts_json_for_bid(mocker, settings):
         amount=6000,
         side="bid",
         dry_run=False,
+        identifier="order-1",
     )
 
     payload = {
@@ -58,6 +62,7 @@ def test_place_market_order_posts_json_for_bid(mocker, settings):
         "side": "bid",
         "ord_type": "price",
         "price": "6000",
+        "identifier": "order-1",
     }
 
     client.post.assert_called_once_with(
@@ -70,7 +75,7 @@ def test_place_market_order_posts_json_for_bid(mocker, settings):
 
 
 def test_place_market_order_builds_payload_for_ask(mocker, settings):
-    mocker.patch("bitthumb_cli.auth.generate_jwt", return_value="token")
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value="token")
 
     mock_response = mocker.Mock()
     mock_response.json.return_value = {"uuid": "ask-order"}
@@ -86,6 +91,7 @@ def test_place_market_order_builds_payload_for_ask(mocker, settings):
         amount=0.015,
         side="ask",
         dry_run=False,
+        identifier="order-2",
     )
 
     payload = {
@@ -93,6 +99,7 @@ def test_place_market_order_builds_payload_for_ask(mocker, settings):
         "side": "ask",
         "ord_type": "market",
         "volume": "0.015",
+        "identifier": "order-2",
     }
 
     client.post.assert_called_once_with(
@@ -149,3 +156,135 @@ def test_place_market_order_rejects_invalid_side(mocker, settings):
             side="sell",
             dry_run=True,
         )
+
+
+def test_fetch_order_chance_async_calls_endpoint(mocker, settings):
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value="signed-token")
+
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {"status": "0000"}
+
+    client = mocker.Mock()
+    client.get = mocker.AsyncMock(return_value=mock_response)
+
+    result = asyncio.run(
+        orders.fetch_order_chance_async(client=client, settings=settings, market="KRW-BTC")
+    )
+
+    args, kwargs = client.get.call_args
+    assert args[0] == "https://api.test.com/v1/orders/chance?market=KRW-BTC"
+    assert kwargs["headers"] == {"Authorization": "Bearer signed-token"}
+    assert result == {"status": "0000"}
+
+
+def test_place_market_order_async_posts_json(mocker, settings):
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value="token")
+
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {"uuid": "order"}
+
+    client = mocker.Mock()
+    client.post = mocker.AsyncMock(return_value=mock_response)
+
+    result = asyncio.run(
+        orders.place_market_order_async(
+            client=client,
+            settings=settings,
+            market="KRW-XRP",
+            amount=0.015,
+            side="ask",
+            dry_run=False,
+            identifier="order-3",
+        )
+    )
+
+    client.post.assert_awaited_once_with(
+        "https://api.test.com/v1/orders",
+        json={"market": "KRW-XRP", "side": "ask", "ord_type": "market", "volume": "0.015", "identifier": "order-3"},
+        headers={"Authorization": "Bearer token"},
+        timeout=5,
+    )
+    assert result == {"uuid": "order"}
+
+
+def test_place_market_order_async_skips_http_when_dry_run(mocker, settings):
+    client = mocker.Mock()
+    client.post = mocker.AsyncMock()
+
+    summary = asyncio.run(
+        orders.place_market_order_async(
+            client=client,
+            settings=settings,
+            market="KRW-BTC",
+            amount=7000,
+            side="bid",
+            dry_run=True,
+        )
+    )
+
+    client.post.assert_not_awaited()
+    assert summary == {"dry_run": True, "market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "7000"}
+
+
+def test_headers_reuse_signer_per_key_pair(settings):
+    headers = orders._headers(settings, {"market": "KRW-BTC"})
+    token = headers["Authorization"].removeprefix("Bearer ")
+
+    decoded = jwt.decode(token, "sk", algorithms=["HS256"])
+
+    assert decoded["access_key"] == "ak"
+    assert decoded["query_hash"] == auth.hash_query_string("market=KRW-BTC")
+    assert orders._signer("ak", "sk") is orders._signer("ak", "sk")
+
+
+def test_prepared_order_posts_compact_body(mocker, settings):
+    mocker.patch("bitthumb_cli.auth.Signer.sign", return_value="signed-token")
+    prepared = orders.prepare_market_order(settings=settings, market="KRW-BTC", amount=5000, side="bid")
+
+    assert prepared.url == "https://api.test.com/v1/orders"
+    assert prepared.body == b'{"market":"KRW-BTC","side":"bid","ord_type":"price","price":"5000"}'
+
+    headers = orders.sign_prepared_order(settings, prepared)
+    assert headers == {"Authorization": "Bearer signed-token", "Content-Type": "application/json"}
+
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {"uuid": "order-1"}
+    client = mocker.Mock()
+    client.post.return_value = mock_response
+
+    result = orders.post_prepared_order(client=client, prepared=prepared, headers=headers)
+
+    assert result == {"uuid": "order-1"}
+    client.post.assert_called_once_with(
+        prepared.url, content=prepared.body, headers=headers, timeout=orders.DEFAULT_TIMEOUT
+    )
+
+
+def test_concurrent_chance_lookups_for_same_market_are_coalesced(mocker, settings):
+    release = asyncio.Event()
+    response = mocker.Mock()
+    response.json.return_value = {"market": {"id": "KRW-BTC"}}
+    response.raise_for_status.return_value = None
+    client = mocker.Mock()
+
+    async def slow_get(*args, **kwargs):
+        await release.wait()
+        return response
+
+    client.get = mocker.AsyncMock(side_effect=slow_get)
+
+    async def scenario():
+        lookups = [
+            asyncio.ensure_future(orders.fetch_order_chance_async(client=client, settings=settings, market=market))
+            for market in ("KRW-BTC", "KRW-BTC", "KRW-BTC", "KRW-ETH")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*lookups)
+
+    before = orders.CHANCE_FLIGHT.stats()["coalesced"]
+    results = asyncio.run(scenario())
+
+    assert client.get.await_count == 2
+    assert results[0] is results[1] is results[2]
+    assert orders.CHANCE_FLIGHT.stats()["coalesced"] - before == 2
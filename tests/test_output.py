@@ -0,0 +1,85 @@
+import io
+import json
+
+from bitthumb_cli import output
+
+
+def _record(**overrides):
+    return {
+        "market": "KRW-BTC",
+        "ok": True,
+        "amount": 5000,
+        "available": 20000.0,
+        "currency": "KRW",
+        "account": {"balance": "20000"},
+        "result": {"uuid": "order-1"},
+        **overrides,
+    }
+
+
+def test_human_reporter_renders_plan_and_result():
+    stream = io.StringIO()
+    reporter = output.build_reporter("human", stream)
+
+    reporter.cycle(_record(index=3))
+
+    text = stream.getvalue()
+    assert "[3회차]" in text
+    assert "- 금액: 5000 KRW" in text
+    assert "[주문 가능 정보]" in text
+    assert '"uuid": "order-1"' in text
+
+
+def test_jsonl_reporter_buffers_until_close(monkeypatch):
+    monkeypatch.setattr(output, "_FLUSH_INTERVAL", 3600.0)
+    stream = io.StringIO()
+    reporter = output.build_reporter("jsonl", stream)
+
+    reporter.status("무시됩니다")
+    reporter.cycle(_record())
+    reporter.section("throughput", "처리량 요약", {"cycles": 1})
+    assert stream.getvalue() == ""
+
+    reporter.close()
+
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["cycle", "throughput"]
+    assert " " not in lines[0]
+
+
+def test_jsonl_reporter_drains_in_batches(monkeypatch):
+    monkeypatch.setattr(output, "_FLUSH_EVERY", 2)
+    monkeypatch.setattr(output, "_FLUSH_INTERVAL", 3600.0)
+    stream = io.StringIO()
+    reporter = output.build_reporter("jsonl", stream)
+
+    reporter.cycle(_record())
+    reporter.cycle(_record())
+
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_json_reporter_writes_one_document_once():
+    stream = io.StringIO()
+    reporter = output.build_reporter("json", stream)
+
+    reporter.results("마켓별 주문 결과", [_record(), _record(market="KRW-ETH")])
+    reporter.section("api_error", "API 오류", {"status_code": 500})
+    reporter.close()
+    reporter.close()
+
+    document = json.loads(stream.getvalue())
+    assert [item["market"] for item in document["cycles"]] == ["KRW-BTC", "KRW-ETH"]
+    assert document["api_error"] == {"status_code": 500}
+    assert stream.getvalue().count("\n") == 1
+
+
+def test_quiet_reporter_writes_nothing():
+    stream = io.StringIO()
+    reporter = output.build_reporter("quiet", stream)
+
+    reporter.status("x")
+    reporter.cycle(_record())
+    reporter.close()
+
+    assert stream.getvalue() == ""
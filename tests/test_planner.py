@@ -0,0 +1,152 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from bitthumb_cli import cache, catalog, cli, config, planner, standin
+
+MARKET_INFO = {
+    "bid_fee": "0.0025",
+    "market": {"bid": {"currency": "KRW", "min_total": "5000"}, "ask": {"currency": "BTC", "min_total": "5000"}},
+}
+
+
+def _bid(market, amount=None):
+    return cli.ExecutionConfig(market=market, side="bid", dry_run=True, amount=amount)
+
+
+def test_parse_balances_reads_available_balance():
+    payload = [
+        {"currency": "KRW", "balance": "12000.5", "locked": "1000"},
+        {"currency": "BTC", "balance": "0.01", "locked": "0"},
+    ]
+
+    assert planner.parse_balances(payload) == {"KRW": 12000.5, "BTC": 0.01}
+
+
+def test_parse_balances_rejects_malformed_payload():
+    with pytest.raises(ValueError, match="accounts 응답 형식"):
+        planner.parse_balances({"currency": "KRW"})
+    with pytest.raises(ValueError, match="KRW 잔고가 숫자가 아닙니다"):
+        planner.parse_balances([{"currency": "KRW", "balance": "many"}])
+
+
+def test_plan_orders_reserves_shared_balance_in_order():
+    markets = ("KRW-BTC", "KRW-ETH", "KRW-XRP")
+
+    outcomes = planner.plan_orders(
+        configs=[_bid(market) for market in markets],
+        balances={"KRW": 12000.0},
+        market_info={market: MARKET_INFO for market in markets},
+        fallback_amount=None,
+    )
+
+    assert [outcome.key for outcome in outcomes] == list(markets)
+    assert [outcome.value.available for outcome in outcomes[:2]] == [12000.0, pytest.approx(6987.5)]
+    assert all(outcome.value.amount == 5000.0 for outcome in outcomes[:2])
+    assert "사용 가능 금액" in str(outcomes[2].error)
+
+
+def test_plan_orders_applies_build_order_plan_rules():
+    outcomes = planner.plan_orders(
+        configs=[_bid("KRW-BTC", amount=4000), _bid("KRW-ETH"), cli.ExecutionConfig("KRW-BTC", "ask", True)],
+        balances={"KRW": 50000.0, "BTC": 0.5},
+        market_info={"KRW-BTC": MARKET_INFO},
+        fallback_amount=6000.0,
+        failures={},
+        prices={"KRW-BTC": 50_000_000.0},
+    )
+
+    assert "최소 주문 금액 5000.0보다 작습니다" in str(outcomes[0].error)
+    # 마켓 정보가 없으면 대체 금액을 쓴다.
+    assert outcomes[1].value.amount == 6000.0
+    assert outcomes[2].value.amount == 0.0001
+    assert outcomes[2].value.currency_label == "BTC"
+
+
+def test_plan_orders_reserves_default_fee_without_market_info():
+    outcomes = planner.plan_orders(
+        configs=[_bid("KRW-BTC"), _bid("KRW-ETH")],
+        balances={"KRW": 12000.0},
+        market_info={},
+        fallback_amount=6000.0,
+    )
+
+    assert outcomes[0].value.amount == 6000.0
+    # 수수료율을 0으로 보면 남은 6000원으로 두 번째 주문도 계획되지만, 실제로는 수수료 때문에 모자란다.
+    assert "사용 가능 금액" in str(outcomes[1].error)
+
+
+def test_plan_orders_reports_market_info_failures():
+    failure = RuntimeError("chance 실패")
+
+    outcomes = planner.plan_orders(
+        configs=[_bid("KRW-BTC")],
+        balances={"KRW": 50000.0},
+        market_info={},
+        fallback_amount=None,
+        failures={"KRW-BTC": failure},
+    )
+
+    assert outcomes[0].error is failure
+
+
+@pytest.fixture
+def server():
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("12000")})}
+    instance = standin.build_server(
+        accounts=accounts, prices={"KRW-BTC": "100000000", "KRW-ETH": "5000000", "KRW-XRP": "1000"}
+    )
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def test_snapshot_markets_use_one_accounts_call(server):
+    settings = config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+    chance_cache = cache.ChanceCache()
+    configs = [replace(_bid(market), dry_run=False) for market in ("KRW-BTC", "KRW-ETH", "KRW-XRP")]
+    paths = []
+
+    with httpx.Client(event_hooks={"request": [lambda request: paths.append(request.url.path)]}) as client:
+        first = cli.run_snapshot_markets(
+            client=client, settings=settings, configs=configs, concurrency=2, chance_cache=chance_cache
+        )
+        paths.clear()
+        server.exchange.accounts["ak"].balances["KRW"] = Decimal("12000")
+        second = cli.run_snapshot_markets(
+            client=client, settings=settings, configs=configs, concurrency=2, chance_cache=chance_cache
+        )
+
+    assert [outcome.ok for outcome in first] == [True, True, False]
+    assert [outcome.ok for outcome in second] == [True, True, False]
+    # 최소 금액이 캐시에 있으면 잔고는 계좌 조회 한 번으로 끝난다.
+    assert sorted(paths) == ["/v1/accounts", "/v1/orders", "/v1/orders"]
+    balance = server.exchange.accounts["ak"].balances["KRW"]
+    assert balance == Decimal("12000") - 2 * Decimal("5000") * Decimal("1.0025")
+
+
+def test_snapshot_markets_reuse_market_info_from_disk_between_runs(server, tmp_path):
+    settings = config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+    configs = [_bid(market) for market in ("KRW-BTC", "KRW-ETH")]
+    path = tmp_path / "info.json"
+    paths = []
+
+    def _run(client):
+        # 실행마다 메모리 캐시는 새로 만들고 디스크 저장소만 이어진다.
+        store = catalog.MarketInfoStore.open(path, ttl=60)
+        cli.run_snapshot_markets(
+            client=client, settings=settings, configs=configs, concurrency=2,
+            chance_cache=cache.ChanceCache(), info_store=store,
+        )
+        store.save()
+
+    with httpx.Client(event_hooks={"request": [lambda request: paths.append(request.url.path)]}) as client:
+        _run(client)
+        first = sorted(paths)
+        paths.clear()
+        _run(client)
+
+    assert first == ["/v1/accounts", "/v1/orders/chance", "/v1/orders/chance"]
+    assert paths == ["/v1/accounts"]
@@ -0,0 +1,96 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bitthumb_cli import config, ratelimit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_paces_requests_after_burst():
+    clock = FakeClock()
+    bucket = ratelimit.TokenBucket(10, capacity=2, clock=clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    clock.now = 1.0
+    assert bucket.reserve() == 0.0
+
+
+def test_bucket_penalize_delays_next_token():
+    clock = FakeClock()
+    bucket = ratelimit.TokenBucket(5, clock=clock)
+
+    bucket.penalize(2.0)
+
+    assert bucket.reserve() == pytest.approx(2.2)
+
+
+@pytest.mark.parametrize("rate,capacity", [(0, 1), (1, 0.5)])
+def test_bucket_rejects_invalid_configuration(rate, capacity):
+    with pytest.raises(ValueError):
+        ratelimit.TokenBucket(rate, capacity=capacity)
+
+
+def test_limiter_routes_order_posts_to_order_bucket():
+    limiter = ratelimit.RateLimiter(query_rate=30, order_rate=8)
+
+    assert limiter.bucket_for("POST", "https://api.test.com/v1/orders") is limiter.order
+    assert limiter.bucket_for("DELETE", "https://api.test.com/v1/order?uuid=x") is limiter.order
+    assert limiter.bucket_for("GET", "https://api.test.com/v1/orders/chance?market=KRW-BTC") is limiter.query
+    assert limiter.bucket_for("GET", "https://api.test.com/v1/orders?uuids[]=x") is limiter.query
+
+
+def test_limiter_from_settings_uses_configured_rates():
+    settings = config.ApiSettings(
+        base_url="https://api.test.com",
+        access_key="ak",
+        secret_key="sk",
+        query_rate_limit=12,
+        order_rate_limit=3,
+    )
+
+    limiter = ratelimit.RateLimiter.from_settings(settings)
+
+    assert limiter.query.rate == 12
+    assert limiter.order.rate == 3
+
+
+def test_sync_hooks_wait_for_tokens(mocker):
+    sleep = mocker.patch("bitthumb_cli.ratelimit.time.sleep")
+    limiter = ratelimit.RateLimiter(query_rate=1, order_rate=1)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+
+    with httpx.Client(transport=transport, event_hooks=limiter.event_hooks()) as client:
+        client.get("https://api.test.com/v1/orders/chance")
+        client.get("https://api.test.com/v1/orders/chance")
+        client.post("https://api.test.com/v1/orders", json={})
+
+    sleep.assert_called_once()
+    assert sleep.call_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+
+def test_async_hooks_penalize_bucket_on_429():
+    limiter = ratelimit.RateLimiter(query_rate=1000, order_rate=1000)
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(429, headers={"Retry-After": "0.05"}, json={})
+    )
+
+    async def scenario():
+        async with httpx.AsyncClient(transport=transport, event_hooks=limiter.async_event_hooks()) as client:
+            await client.get("https://api.test.com/v1/orders/chance")
+
+    asyncio.run(scenario())
+
+    assert limiter.query.reserve() == pytest.approx(0.05, abs=0.01)
+    assert limiter.order.reserve() == 0.0
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from bitthumb_cli import config, metrics, orders, retry
+
+
+@pytest.fixture
+def settings():
+    return config.ApiSettings(base_url="https://api.test.com", access_key="ak", secret_key="sk")
+
+
+def _retrier(**policy):
+    return retry.Retrier(retry.RetryPolicy(**policy), sleep=lambda seconds: None)
+
+
+def test_fetch_order_chance_retries_server_errors_with_new_signature(settings):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        if len(seen) < 3:
+            return httpx.Response(503, json={"error": "busy"})
+        return httpx.Response(200, json={"status": "ok"})
+
+    retrier = _retrier(attempts=3)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        result = orders.fetch_order_chance(client=client, settings=settings, market="KRW-BTC", retrier=retrier)
+
+    assert result == {"status": "ok"}
+    assert len(set(seen)) == 3
+    assert retrier.stats() == {"retries": 2, "hedges": 0}
+
+
+def test_fetch_order_chance_does_not_retry_client_errors(settings):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, json={"error": "bad"})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            orders.fetch_order_chance(
+                client=client, settings=settings, market="KRW-BTC", retrier=_retrier(attempts=5)
+            )
+
+    assert len(calls) == 1
+
+
+def test_retrier_gives_up_after_attempts():
+    calls = []
+
+    def send():
+        calls.append(1)
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(httpx.ConnectError):
+        _retrier(attempts=2).call(send)
+
+    assert len(calls) == 2
+
+
+def test_backoff_is_jittered_and_capped():
+    retrier = retry.Retrier(retry.RetryPolicy(base_delay=0.1, max_delay=0.3))
+
+    delays = [retrier.backoff(attempt) for attempt in range(6) for _ in range(20)]
+
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_rejects_invalid_policy():
+    with pytest.raises(ValueError):
+        retry.RetryPolicy(attempts=0)
+    with pytest.raises(ValueError):
+        retry.RetryPolicy(hedge_percentile=1.5)
+
+
+def _warm(retrier, seconds=0.001):
+    for _ in range(retry.MIN_HEDGE_SAMPLES):
+        retrier._observe(seconds)
+
+
+def test_sync_hedge_sends_second_request_when_first_is_slow():
+    release = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    retrier = _retrier(hedge_percentile=0.9)
+    _warm(retrier)
+
+    assert retrier.call(send) == "fast"
+    release.set()
+    assert retrier.stats()["hedges"] == 1
+    # 경주가 끝나면 실행기를 내려놓으므로 늦은 요청이 끝나면 작업 스레드도 사라진다.
+    for thread in threading.enumerate():
+        if thread.name.startswith("bitthumb-hedge"):
+            thread.join(2)
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("bitthumb-hedge")]
+
+
+def test_hedged_requests_share_recorder_safely():
+    recorder = metrics.Recorder()
+
+    def send():
+        for _ in range(5000):
+            recorder.add("sign", 1.0)
+
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert recorder.phases["sign"] == 20000.0
+
+
+def test_async_hedge_cancels_loser():
+    cancelled = []
+
+    async def scenario():
+        calls = []
+
+        async def send():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(2)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "slow"
+            return "fast"
+
+        retrier = _retrier(hedge_percentile=0.9)
+        _warm(retrier)
+        result = await retrier.call_async(send)
+        await asyncio.sleep(0)
+        return result, retrier.stats()
+
+    result, stats = asyncio.run(scenario())
+
+    assert result == "fast"
+    assert stats["hedges"] == 1
+    assert cancelled == [True]
+
+
+def test_hedge_waits_for_enough_samples():
+    retrier = _retrier(hedge_percentile=0.5)
+
+    assert retrier.hedge_delay() is None
+    _warm(retrier, 0.01)
+    assert retrier.hedge_delay() == pytest.approx(0.01)
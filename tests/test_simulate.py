@@ -0,0 +1,107 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bitthumb_cli import batch, cli, simulate  # noqa: E402
+
+
+def _book(ask_price, bid_price, size=1.0, depth=3, tick=1000.0):
+    levels = np.arange(depth)
+    return np.stack(
+        [ask_price + levels * tick, np.full(depth, size), bid_price - levels * tick, np.full(depth, size)],
+        axis=1,
+    )
+
+
+@pytest.fixture
+def tapes(tmp_path):
+    simulate.write_tape(
+        tmp_path,
+        "KRW-XRP",
+        [100.0, 200.0],
+        [_book(1000.0, 990.0, size=10.0, tick=10.0), _book(1100.0, 1090.0, size=10.0, tick=10.0)],
+    )
+    (tmp_path / "meta.json").write_text(json.dumps({"balances": {"KRW": 50000}, "fee": 0.001, "min_total": 5000}))
+    return tmp_path
+
+
+def test_fill_orders_walks_levels_for_both_sides():
+    books = np.stack([_book(1000.0, 990.0, size=10.0, tick=10.0)] * 3)
+
+    volume, funds = simulate.fill_orders(
+        books, np.array([True, False, True]), np.array([15100.0, 12.0, 1_000_000.0])
+    )
+
+    # 매수 15100원: 1000원 호가 10개(10000원) + 1010원 호가 5100원어치
+    assert volume[0] == pytest.approx(10 + 5100 / 1010)
+    assert funds[0] == pytest.approx(15100.0)
+    # 매도 12개: 990원 10개 + 980원 2개
+    assert volume[1] == pytest.approx(12.0)
+    assert funds[1] == pytest.approx(9900 + 1960)
+    # 호가가 모자라면 있는 만큼만 체결된다.
+    assert volume[2] == pytest.approx(30.0)
+    assert funds[2] == pytest.approx(10 * (1000 + 1010 + 1020))
+
+
+def test_replay_uses_snapshot_at_order_time_and_tracks_balances(tapes):
+    simulator = simulate.Simulator.open(tapes)
+
+    outcomes = simulator.replay(
+        [
+            simulate.SimOrder(ts=250.0, market="KRW-XRP", side="ask", amount=5.0),
+            simulate.SimOrder(ts=150.0, market="KRW-XRP", side="bid", amount=10000.0),
+            simulate.SimOrder(ts=50.0, market="KRW-XRP", side="bid", amount=10000.0),
+        ]
+    )
+
+    ask, bid, early = outcomes
+    assert bid.value[2]["avg_price"] == pytest.approx(1000.0)
+    assert bid.value[2]["snapshot_ts"] == 100.0
+    # 매수가 시각상 먼저 처리되어 매도할 코인이 생긴다.
+    assert ask.value[2]["executed_funds"] == pytest.approx(5 * 1090)
+    assert ask.value[2]["slippage"] == pytest.approx(0.0)
+    assert "스냅샷이 없습니다" in str(early.error)
+    assert simulator.balances["XRP"] == pytest.approx(5.0)
+    assert simulator.balances["KRW"] == pytest.approx(50000 - 10000 * 1.001 + 5 * 1090 * 0.999)
+
+
+def test_replay_rejects_orders_beyond_simulated_balance(tapes):
+    simulator = simulate.Simulator.open(tapes)
+
+    outcomes = simulator.replay(
+        [simulate.SimOrder(ts=100.0 + index, market="KRW-XRP", side="bid", amount=20000.0) for index in range(3)]
+    )
+
+    assert [outcome.ok for outcome in outcomes] == [True, True, False]
+    # 잔고 검사는 build_order_plan 규칙을 그대로 따른다.
+    assert "사용 가능 금액" in str(outcomes[2].error)
+
+
+def test_run_backtest_resolves_default_amount_and_requires_ts(tapes):
+    rows = [
+        batch.PlanRow(line=1, market="KRW-XRP", side="bid", ts=120.0),
+        batch.PlanRow(line=2, market="KRW-XRP", side="bid"),
+        batch.PlanRow(line=3, market="KRW-BTC", side="bid", ts=120.0),
+    ]
+
+    outcomes = simulate.run_backtest(rows, simulate.Simulator.open(tapes))
+
+    assert outcomes[0].value[0].amount == 5000.0
+    assert "ts" in str(outcomes[1].error)
+    assert "KRW-BTC" in str(outcomes[2].error)
+
+
+def test_main_backtests_plan_offline(tapes, tmp_path, capsys):
+    plan = tmp_path / "orders.jsonl"
+    plan.write_text('{"market": "KRW-XRP", "amount": 6000, "ts": 150}\n')
+    out = tmp_path / "results.jsonl"
+
+    cli.main(["--plan", str(plan), "--dry-run", "--simulate", str(tapes), "--plan-out", str(out)])
+
+    record = json.loads(out.read_text())
+    assert record["ok"] is True
+    assert record["result"]["simulated"] is True
+    assert record["result"]["executed_volume"] == pytest.approx(6.0)
+    assert "최종 잔고" in capsys.readouterr().err
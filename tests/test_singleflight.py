@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from bitthumb_cli import singleflight
+
+
+def test_concurrent_threads_share_one_call():
+    flight = singleflight.SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return {"market": "KRW-BTC"}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(flight.do, "KRW-BTC", fetch) for _ in range(4)]
+        while flight.stats()["coalesced"] < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert results == [{"market": "KRW-BTC"}] * 4
+    assert flight.stats() == {"requests": 1, "coalesced": 3}
+
+
+def test_errors_reach_every_waiter_and_key_is_released():
+    flight = singleflight.SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(1)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(flight.do, "k", fail) for _ in range(2)]
+        while flight.stats()["coalesced"] < 1:
+            threading.Event().wait(0.001)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result()
+
+    assert flight.do("k", lambda: "fresh") == "fresh"
+    assert flight.stats()["requests"] == 2
+
+
+def test_async_callers_share_one_task_and_survive_cancellation():
+    flight = singleflight.SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "chance"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do_async("k", fetch))
+        await asyncio.sleep(0)
+        others = [asyncio.ensure_future(flight.do_async("k", fetch)) for _ in range(2)]
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(scenario()) == ["chance", "chance"]
+    assert len(calls) == 1
+    assert flight.stats() == {"requests": 1, "coalesced": 2}
+    assert flight._tasks == {}
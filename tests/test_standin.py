@@ -0,0 +1,279 @@
+import random
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from bitthumb_cli import auth, batch, cli, config, orders, retry, standin
+
+
+@pytest.fixture
+def server():
+    accounts = {"ak": standin.Account(secret_key="sk", balances={"KRW": Decimal("20000")})}
+    instance = standin.build_server(accounts=accounts, prices={"KRW-BTC": "100000000"})
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+@pytest.fixture
+def settings(server):
+    return config.ApiSettings(base_url=server.base_url, access_key="ak", secret_key="sk")
+
+
+def test_trade_cycle_against_standin_deducts_balance(server, settings):
+    exec_config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+
+    with httpx.Client() as client:
+        plan, account_snapshot, result = cli.execute_trade_cycle(
+            client=client, settings=settings, config=exec_config
+        )
+
+    assert plan.amount == pytest.approx(5000.0)
+    assert account_snapshot["balance"] == "20000"
+    assert result["state"] == "wait"
+    balances = server.exchange.accounts["ak"].balances
+    assert balances["KRW"] == Decimal("20000") - Decimal("5000") * Decimal("1.0025")
+    assert balances["BTC"] == Decimal("0.00005")
+
+
+def test_ask_cycle_converts_krw_minimum_with_ticker_price(server, settings):
+    server.exchange.accounts["ak"].balances["BTC"] = Decimal("0.001")
+    exec_config = cli.ExecutionConfig(market="KRW-BTC", side="ask", dry_run=False)
+
+    with httpx.Client() as client:
+        chance = orders.fetch_order_chance(client=client, settings=settings, market="KRW-BTC")
+        plan, _, result = cli.execute_trade_cycle(client=client, settings=settings, config=exec_config)
+
+    # 거래소처럼 매도 최소 금액도 KRW로 내려주고, CLI가 현재가로 수량을 구한다.
+    assert chance["market"]["ask"]["min_total"] == "5000"
+    assert plan.amount == pytest.approx(0.00005)
+    assert result["state"] == "wait"
+    assert server.exchange.accounts["ak"].balances["BTC"] == Decimal("0.00095")
+
+
+def test_standin_rejects_insufficient_balance(server, settings):
+    with httpx.Client() as client:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            orders.place_market_order(
+                client=client, settings=settings, market="KRW-BTC", amount=50000, side="bid", dry_run=False
+            )
+
+    assert excinfo.value.response.status_code == 400
+    assert excinfo.value.response.json()["error"]["name"] == "insufficient_funds_bid"
+
+
+def test_standin_rejects_wrong_secret(server, settings):
+    wrong = config.ApiSettings(base_url=settings.base_url, access_key="ak", secret_key="other")
+
+    with httpx.Client() as client:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            orders.fetch_order_chance(client=client, settings=wrong, market="KRW-BTC")
+
+    assert excinfo.value.response.status_code == 401
+
+
+def test_standin_rejects_query_hash_mismatch(server):
+    token = auth.generate_jwt(access_key="ak", secret_key="sk", params={"market": "KRW-XRP"})
+
+    response = httpx.get(
+        f"{server.base_url}/v1/orders/chance?market=KRW-BTC",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["error"]["name"] == "invalid_query_payload"
+
+
+def test_standin_injects_rate_limit_errors(server, settings):
+    server.faults = standin.FaultModel(rate_limit_rate=1.0)
+
+    with httpx.Client() as client:
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            orders.fetch_order_chance(client=client, settings=settings, market="KRW-BTC")
+
+    assert excinfo.value.response.status_code == 429
+
+
+@pytest.mark.parametrize("spec,expected", [
+    ("fixed:0.05", standin.LatencyModel("fixed", (0.05,))),
+    ("uniform:0.01,0.02", standin.LatencyModel("uniform", (0.01, 0.02))),
+    ("lognormal:-3,0.5", standin.LatencyModel("lognormal", (-3.0, 0.5))),
+])
+def test_latency_model_parse(spec, expected):
+    assert standin.LatencyModel.parse(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["gamma:1", "uniform:1", "fixed:x"])
+def test_latency_model_rejects_invalid_spec(spec):
+    with pytest.raises(ValueError):
+        standin.LatencyModel.parse(spec)
+
+
+def test_latency_model_samples_are_non_negative():
+    model = standin.LatencyModel.parse("normal:0,1")
+    rng = random.Random(0)
+
+    assert all(model.sample(rng) >= 0 for _ in range(100))
+
+
+def test_run_plan_against_standin(server, settings, tmp_path):
+    plan = tmp_path / "orders.jsonl"
+    plan.write_text("".join(f'{{"market": "KRW-BTC", "amount": {5000 + index}}}\n' for index in range(3)))
+
+    with httpx.Client() as client:
+        outcomes = list(
+            cli.run_plan(
+                client=client,
+                settings=settings,
+                rows=batch.read_plan(plan),
+                dry_run=False,
+                concurrency=2,
+            )
+        )
+
+    assert all(outcome.ok for outcome in outcomes)
+    spent = sum(Decimal(5000 + index) for index in range(3)) * Decimal("1.0025")
+    assert server.exchange.accounts["ak"].balances["KRW"] == Decimal("20000") - spent
+
+
+def test_fire_at_against_standin(server, settings, capsys):
+    import time
+
+    from bitthumb_cli import firing
+
+    exec_config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+    target_ts = time.time() + 0.2
+
+    with httpx.Client() as client:
+        plan, _, prepared = cli.arm_order(client=client, settings=settings, config=exec_config)
+        result, timing = cli.fire_armed_order(
+            client=client, settings=settings, plan=plan, prepared=prepared, target_ts=target_ts
+        )
+
+    assert result["state"] == "wait"
+    assert timing["send_delay_ms"] >= 0
+    assert timing["target"] == firing.isoformat(target_ts)
+    assert server.exchange.accounts["ak"].balances["BTC"] == Decimal("0.00005")
+
+
+def test_chance_cache_tracks_standin_balance(server, settings):
+    exec_config = cli.ExecutionConfig(market="KRW-BTC", side="bid", dry_run=False)
+    chance_cache = cli.cache.ChanceCache()
+
+    with httpx.Client() as client:
+        results = list(
+            cli.run_repeated_cycles(
+                client=client, settings=settings, config=exec_config, repeat=3, chance_cache=chance_cache
+            )
+        )
+
+    assert chance_cache.stats() == {"hits": 2, "misses": 1}
+    cached = chance_cache.get("ak", "KRW-BTC", "bid")["bid_account"]["balance"]
+    assert Decimal(cached) == server.exchange.accounts["ak"].balances["KRW"]
+    assert len(results) == 3
+
+
+class _FlakyClient:
+    """실제 연결을 감싸 POST를 지정한 방식으로 실패시킨다."""
+
+    def __init__(self, client, failures):
+        self._client = client
+        self._failures = list(failures)
+        self.paths = []
+
+    def get(self, url, **kwargs):
+        self.paths.append(("GET", httpx.URL(url).path))
+        return self._client.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        self.paths.append(("POST", httpx.URL(url).path))
+        failure = self._failures.pop(0) if self._failures else None
+        if failure == "refused":
+            raise httpx.ConnectError("refused")
+        response = self._client.post(url, **kwargs)
+        if failure == "lost":
+            # 주문은 접수되었지만 응답을 받지 못한 상황
+            raise httpx.ReadTimeout("timed out")
+        return response
+
+
+def _no_wait_retrier():
+    return retry.Retrier(retry.RetryPolicy(attempts=3), sleep=lambda _: None)
+
+
+def test_lost_order_response_is_recovered_without_resending(server, settings):
+    with httpx.Client() as client:
+        flaky = _FlakyClient(client, ["lost"])
+        result = orders.place_market_order(
+            client=flaky,
+            settings=settings,
+            market="KRW-BTC",
+            amount=5000,
+            side="bid",
+            dry_run=False,
+            identifier="order-1",
+            retrier=_no_wait_retrier(),
+        )
+
+    assert result["identifier"] == "order-1"
+    assert flaky.paths == [("POST", "/v1/orders"), ("GET", "/v1/order")]
+    assert len(server.exchange.orders) == 1
+
+
+def test_unsent_order_is_resent_without_lookup(server, settings):
+    with httpx.Client() as client:
+        flaky = _FlakyClient(client, ["refused"])
+        result = orders.place_market_order(
+            client=flaky,
+            settings=settings,
+            market="KRW-BTC",
+            amount=5000,
+            side="bid",
+            dry_run=False,
+            retrier=_no_wait_retrier(),
+        )
+
+    assert flaky.paths == [("POST", "/v1/orders"), ("POST", "/v1/orders")]
+    assert server.exchange.orders[result["uuid"]]["identifier"] == result["identifier"]
+
+
+def test_standin_rejects_duplicate_identifier(server, settings):
+    with httpx.Client() as client:
+        orders.place_market_order(
+            client=client, settings=settings, market="KRW-BTC", amount=5000, side="bid", dry_run=False,
+            identifier="order-1",
+        )
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            orders.place_market_order(
+                client=client, settings=settings, market="KRW-BTC", amount=5000, side="bid", dry_run=False,
+                identifier="order-1",
+            )
+        missing = orders.fetch_order(client=client, settings=settings, identifier="order-2")
+
+    assert excinfo.value.response.json()["error"]["name"] == "duplicate_identifier"
+    assert missing is None
+    assert len(server.exchange.orders) == 1
+
+
+@pytest.mark.parametrize("query", ["limit=abc", "limit=0", "page=x"])
+def test_standin_rejects_malformed_list_parameters(server, query):
+    params = dict([query.split("=")])
+    token = auth.generate_jwt(access_key="ak", secret_key="sk", params=params)
+
+    response = httpx.get(f"{server.base_url}/v1/orders?{query}", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["name"] == "invalid_parameter"
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--balance", "KRW=lots"], ["--price", "KRW-BTC=0"], ["--fee", "abc"], ["--min-total", "-1"]],
+)
+def test_standin_main_reports_invalid_numbers_as_usage_errors(argv, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        standin.main(["--port", "0", *argv])
+
+    assert excinfo.value.code == 2
+    assert "error:" in capsys.readouterr().err
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# 느린 CI에서도 흔들리지 않을 만큼 여유를 둔 import 시간 예산 (마이크로초)
+IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ("httpx", "jwt", "dotenv", "asyncio")
+
+
+def _run_python(*args):
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+
+
+def _import_times(stderr):
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return times
+
+
+def test_cli_import_skips_heavy_dependencies():
+    result = _run_python("-X", "importtime", "-c", "import bitthumb_cli.cli")
+
+    assert result.returncode == 0, result.stderr
+    times = _import_times(result.stderr)
+    assert "bitthumb_cli.cli" in times
+    for module in HEAVY_MODULES:
+        assert module not in times, f"{module}가 CLI import 시점에 로드됩니다."
+
+
+def test_cli_import_time_within_budget():
+    # 첫 실행은 .pyc 생성 비용이 섞이므로 한 번 데운 뒤 측정한다.
+    _run_python("-c", "import bitthumb_cli.cli")
+    result = _run_python("-X", "importtime", "-c", "import bitthumb_cli.cli")
+
+    cumulative = _import_times(result.stderr)["bitthumb_cli.cli"]
+    assert cumulative < IMPORT_BUDGET_US, f"bitthumb_cli.cli import에 {cumulative}us가 걸렸습니다."
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["--side", "hold"], ["--repeat", "0"]])
+def test_help_and_argument_errors_stay_on_fast_path(argv):
+    code = (
+        "import sys\n"
+        "from bitthumb_cli import cli\n"
+        "try:\n"
+        f"    cli.main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('LOADED=' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+
+    result = _run_python("-c", code)
+
+    assert "LOADED=\n" in result.stdout
@@ -0,0 +1,65 @@
+import httpx
+
+from bitthumb_cli import config, transport
+
+
+def test_pool_limits_follow_settings():
+    settings = config.ApiSettings(
+        base_url="https://api.test.com",
+        access_key="ak",
+        secret_key="sk",
+        max_connections=4,
+        max_keepalive_connections=2,
+        keepalive_expiry=12.5,
+    )
+
+    limits = transport.pool_limits(settings)
+
+    assert limits.max_connections == 4
+    assert limits.max_keepalive_connections == 2
+    assert limits.keepalive_expiry == 12.5
+
+
+def test_stats_split_connect_and_wait_time(mocker):
+    clock = mocker.patch("bitthumb_cli.transport.time.perf_counter")
+    clock.side_effect = [0.0, 0.25, 0.25, 0.5, 1.0, 1.75]
+    stats = transport.TransportStats()
+    request = httpx.Request("GET", "https://api.test.com/v1/orders/chance")
+
+    stats.attach(request)
+    trace = request.extensions["trace"]
+    trace("connection.connect_tcp.started", {})
+    trace("connection.connect_tcp.complete", {})
+    trace("connection.start_tls.started", {})
+    trace("connection.start_tls.complete", {})
+    trace("http11.send_request_headers.started", {})
+    trace("http11.receive_response_headers.started", {})
+    trace("http11.receive_response_headers.complete", {})
+
+    summary = stats.summary(cycles=2, elapsed=4.0)
+
+    assert summary["requests"] == 1
+    assert summary["connections_opened"] == 1
+    assert summary["connect_sec"] == 0.5
+    assert summary["server_wait_sec"] == 0.75
+    assert summary["cycles_per_sec"] == 0.5
+
+
+def test_stats_event_hooks_attach_trace_to_requests():
+    stats = transport.TransportStats()
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions.get("trace"))
+        return httpx.Response(200, json={})
+
+    with httpx.Client(transport=httpx.MockTransport(handler), event_hooks=stats.event_hooks()) as client:
+        client.get("https://api.test.com/a")
+        client.get("https://api.test.com/b")
+
+    assert stats.requests == 2
+    assert all(callable(item) for item in seen)
+
+
+def test_summary_handles_zero_elapsed():
+    assert transport.TransportStats().summary(cycles=0, elapsed=0.0)["cycles_per_sec"] is None